@@ -0,0 +1,58 @@
+import asyncio
+import os
+import sys
+
+import asyncclick as click
+from solders.keypair import Keypair
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.send_path import make_transaction  # noqa: E402
+from src.state import KeypairInput, sign_and_send_tx  # noqa: E402
+from src.rpc_pool import get_async_client  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+
+async def landing_rate(client, signer, count, broadcast, cluster, wait):
+    signatures = []
+    for i in range(count):
+        resp = await sign_and_send_tx(
+            make_transaction(signer.keypair, i + 1),
+            client,
+            signer,
+            skip_preflight=True,
+            broadcast=broadcast,
+        )
+        signatures.append(str(resp.value))
+    await asyncio.sleep(wait)
+    return sum(1 for signature in signatures if signature in cluster) / count
+
+
+@click.command()
+@click.option("--count", "-n", default=200, type=int, help="Transactions to send")
+@click.option("--drop", default=0.5, type=float, help="Per-node drop probability")
+@click.option("--wait", default=3.0, type=float, help="Seconds to wait for landing")
+async def main(count, drop, wait):
+    signer = KeypairInput(t_keypair=Keypair())
+    for name, endpoints, broadcast in (
+        ("single send, one endpoint", 1, False),
+        ("broadcast, one endpoint", 1, True),
+        ("broadcast, three endpoints", 3, True),
+    ):
+        cluster = {}
+        rpcs = [
+            MockRpc(latency=0.01, drop_probability=drop, signatures=cluster)
+            for _ in range(endpoints)
+        ]
+        for rpc in rpcs:
+            await rpc.__aenter__()
+        client = get_async_client([rpc.http_url for rpc in rpcs])
+        rate = await landing_rate(client, signer, count, broadcast, cluster, wait)
+        print(f"{name}: {rate * 100:.0f}% landed within {wait:g} s")
+        await client.close()
+        for rpc in rpcs:
+            await rpc.__aexit__(None, None, None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solana.transaction import Transaction
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+# Keep lookup table and compute unit state out of the real config directory.
+os.environ["HOME"] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.processor import (  # noqa: E402
+    build_vote_governance_instruction,
+    vote_governance,
+)
+from src.state import KeypairInput, sign_and_send_tx  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+# Past 256 accounts the legacy message cannot even be compiled.
+MAX_SINGLE_MINTS = 80
+
+
+async def single_transaction(client, signer, mints):
+    tx = Transaction().add(
+        build_vote_governance_instruction(
+            signer.pubkey, True, Pubkey.new_unique(), 1, mints
+        )
+    )
+    try:
+        await sign_and_send_tx(tx, client, signer, commitment=Confirmed)
+        return "sent"
+    except Exception as e:
+        return f"failed ({str(e)[:60]})"
+
+
+@click.command()
+@click.option("--max_in_flight", "-m", default=32, type=int)
+async def main(max_in_flight):
+    signer = KeypairInput(t_keypair=Keypair())
+    async with MockRpc(finalize_after=1.0, latency=0.02) as rpc:
+        client = AsyncClient(rpc.http_url, Confirmed)
+        for nfts in (9, 20, 60, 200):
+            mints = [Pubkey.new_unique() for _ in range(nfts)]
+            if nfts <= MAX_SINGLE_MINTS:
+                single = await single_transaction(client, signer, mints)
+            else:
+                single = "cannot compile"
+            for use_lookup_table in (False, True):
+                rpc.requests.clear()
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    result = await vote_governance(
+                        signer,
+                        True,
+                        1,
+                        mints,
+                        client,
+                        commitment=Confirmed,
+                        use_lookup_table=use_lookup_table,
+                        max_in_flight=max_in_flight,
+                    )
+                elapsed = time.perf_counter() - start
+                lines = result.splitlines()
+                landed = sum(1 for line in lines if "Transaction Id" in line)
+                votes = len(
+                    {line.split("tx/")[1][:20] for line in lines if "tx/" in line}
+                )
+                print(
+                    f"{nfts:>3} NFTs, {'v0' if use_lookup_table else 'legacy':<6}: "
+                    f"single tx {single}; chunked {landed}/{nfts} mints voted in "
+                    f"{votes} transactions, "
+                    f"{rpc.requests['sendTransaction'] - votes} table setup, "
+                    f"{elapsed:.2f} s"
+                )
+        await client.close()
+
+
+if __name__ == "__main__":
+    main()
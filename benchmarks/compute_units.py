@@ -0,0 +1,62 @@
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solders.keypair import Keypair
+
+# Keep the learned history out of the real config directory.
+os.environ["HOME"] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.send_path import make_transaction  # noqa: E402
+from src.instruction import ComputeBudgetInstruction  # noqa: E402
+from src.state import KeypairInput, sign_and_send_tx  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+PRICE = 10_000
+
+
+@click.command()
+@click.option("--sends", "-n", default=50, type=int, help="Sequential sends")
+@click.option("--latency", "-l", default=0.05, type=float, help="Stand-in latency (s)")
+async def main(sends, latency):
+    signer = KeypairInput(t_keypair=Keypair())
+    budget = ComputeBudgetInstruction()
+    async with MockRpc(latency=latency) as rpc:
+        client = AsyncClient(rpc.http_url)
+        for name, auto in (("hard-coded 400_000", False), ("auto compute units", True)):
+            rpc.requests.clear()
+            times = []
+            limit = None
+            for i in range(sends):
+                tx = make_transaction(signer.keypair, i + 1)
+                tx.instructions = (
+                    budget.set_compute_unit_limit(400_000, signer.pubkey),
+                    budget.set_compute_unit_price(PRICE, signer.pubkey),
+                    *tx.instructions,
+                )
+                start = time.perf_counter()
+                await sign_and_send_tx(
+                    tx, client, signer, commitment=Confirmed, auto_compute_units=auto
+                )
+                times.append((time.perf_counter() - start) * 1000)
+                limit = next(
+                    int.from_bytes(ix.data[1:5], "little")
+                    for ix in tx.instructions
+                    if ix.program_id == budget.program_id and ix.data[0] == 2
+                )
+            print(
+                f"{name}: limit {limit} CU, priority fee {PRICE * limit // 10**6} "
+                f"lamports per tx, median {statistics.median(times):.1f} ms per send, "
+                f"{rpc.requests['simulateTransaction']} simulations"
+            )
+        await client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+from solders.signature import Signature
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.confirm import confirm_signature, wait_for_finality  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+
+async def measure(finalize_after, confirm):
+    async with MockRpc(finalize_after=finalize_after) as rpc:
+        client = AsyncClient(rpc.http_url)
+        signature = Signature.new_unique()
+        rpc.submit(signature)
+        start = time.perf_counter()
+        await confirm(client, signature, rpc)
+        elapsed = time.perf_counter() - start
+        await client.close()
+        return elapsed - finalize_after, sum(rpc.requests.values())
+
+
+async def poll_confirm(client, signature, rpc):
+    await client.confirm_transaction(signature, "finalized", sleep_seconds=0.4)
+
+
+async def ws_confirm(client, signature, rpc):
+    await confirm_signature(client, signature, ws_url=rpc.ws_url)
+
+
+async def fallback_confirm(client, signature, rpc):
+    await confirm_signature(client, signature, ws_url="ws://127.0.0.1:1")
+
+
+async def confirmed_confirm(client, signature, rpc):
+    await confirm_signature(
+        client, signature, "confirmed", ws_url=rpc.ws_url, verify_finality=True
+    )
+    returned = time.perf_counter()
+    await wait_for_finality()
+    print(
+        f"  returned at confirmed {(time.perf_counter() - returned) * 1000:.0f} ms "
+        "before background finality was reported"
+    )
+
+
+@click.command()
+@click.option(
+    "--finalize-after",
+    "-f",
+    default=13.0,
+    type=float,
+    help="Seconds until the stand-in reports the signature as finalized",
+)
+async def main(finalize_after):
+    for name, confirm in (
+        ("confirm_transaction (0.4s polling)", poll_confirm),
+        ("confirm_signature (websocket)", ws_confirm),
+        ("confirm_signature (polling fallback)", fallback_confirm),
+        ("confirm_signature (confirmed, verify finality)", confirmed_confirm),
+    ):
+        lag, requests = await measure(finalize_after, confirm)
+        print(
+            f"{name}: noticed {lag * 1000:.0f} ms after finality, "
+            f"{requests} requests"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solders.keypair import Keypair
+
+os.environ["HOME"] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.processor import build_upload_uris_transaction  # noqa: E402
+from src.state import DryRun, KeypairInput, set_dry_run, sign_and_send_tx  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+URIS = [f"https://arweave.net/{i:043d}" for i in range(11)]
+
+
+@click.command()
+@click.option("--items", "-n", default=200, type=int, help="Transactions per mode")
+@click.option("--latency", "-l", default=0.05, type=float, help="Stand-in latency (s)")
+async def main(items, latency):
+    signer = KeypairInput(t_keypair=Keypair())
+    async with MockRpc(latency=latency) as rpc:
+        client = AsyncClient(rpc.http_url)
+        for name, dry_run in (("send", False), ("dry run", True)):
+            set_dry_run(dry_run)
+            rpc.http_requests = 0
+            times = []
+            sizes = []
+            for i in range(items):
+                tx = build_upload_uris_transaction(signer, signer, URIS, i % 4, 2)
+                start = time.perf_counter()
+                try:
+                    await sign_and_send_tx(tx, client, signer, commitment=Confirmed)
+                except DryRun as e:
+                    sizes.append(e.plans[0].size)
+                times.append((time.perf_counter() - start) * 1000)
+            print(
+                f"{name}: median {statistics.median(times):.2f} ms per transaction, "
+                f"{rpc.http_requests} HTTP requests"
+                + (f", planned size {sizes[0]}/1232 bytes" if sizes else "")
+            )
+        await client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.rpc_pool import PooledHTTPProvider  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] * 1000
+
+
+async def run_reads(client, reads):
+    times = []
+    for _ in range(reads):
+        start = time.perf_counter()
+        await client.get_slot()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@click.command()
+@click.option("--reads", "-n", default=500, type=int, help="Reads per mode")
+@click.option("--tail", default=0.05, type=float, help="Share of slow responses")
+async def main(reads, tail):
+    async with MockRpc(
+        latency=0.02, tail_latency=0.5, tail_probability=tail
+    ) as first, MockRpc(latency=0.025, tail_latency=0.5, tail_probability=tail) as second:
+        urls = [first.http_url, second.http_url]
+        for name, hedge in (("pool", False), ("pool + hedged reads", True)):
+            client = AsyncClient(urls[0])
+            client._provider = PooledHTTPProvider(urls, hedge_reads=hedge)
+            requests_before = first.http_requests + second.http_requests
+            times = await run_reads(client, reads)
+            requests = first.http_requests + second.http_requests - requests_before
+            print(
+                f"{name}: p50 {percentile(times, 0.5):.0f} ms, "
+                f"p95 {percentile(times, 0.95):.0f} ms, "
+                f"p99 {percentile(times, 0.99):.0f} ms, "
+                f"{client._provider.hedges} hedges, {requests} HTTP requests"
+            )
+            await client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+# Keep the created table's address out of the real config.
+os.environ["HOME"] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.chunking import pack_mints  # noqa: E402
+from src.lookup_table import (  # noqa: E402
+    MAX_LOOKUP_TABLE_ADDRESSES,
+    get_lookup_addresses,
+)
+from src.processor import (  # noqa: E402
+    build_vote_governance_instruction,
+    vote_governance,
+)
+from src.state import KeypairInput  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+SIGNATURE_FEE = 5000
+
+
+@click.command()
+@click.option("--nfts", "-n", default=80, type=int, help="NFTs to vote with")
+async def main(nfts):
+    signer = KeypairInput(t_keypair=Keypair())
+    mints = [Pubkey.new_unique() for _ in range(nfts)]
+    proposal = Pubkey.new_unique()
+
+    def build(chunk):
+        return build_vote_governance_instruction(
+            signer.pubkey, True, proposal, 1, chunk
+        )
+
+    addresses = get_lookup_addresses([build(mints)])[:MAX_LOOKUP_TABLE_ADDRESSES]
+    table = AddressLookupTableAccount(Pubkey.default(), addresses)
+    for name, lookup_tables in (("legacy", None), ("v0 + lookup table", [table])):
+        chunks = pack_mints(build, mints, signer.pubkey, lookup_tables)
+        print(
+            f"{name}: {len(chunks[0][0])} NFTs per vote_governance transaction, "
+            f"{len(chunks)} transactions and {len(chunks) * SIGNATURE_FEE} "
+            f"lamports in signature fees for {nfts} NFTs"
+        )
+
+    async with MockRpc(finalize_after=1.0) as rpc:
+        client = AsyncClient(rpc.http_url, Confirmed)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = await vote_governance(
+                signer,
+                True,
+                1,
+                mints,
+                client,
+                commitment=Confirmed,
+                use_lookup_table=True,
+            )
+        voted = sum(1 for line in result.splitlines() if "Transaction Id" in line)
+        print(
+            f"v0 vote for {voted}/{nfts} NFTs against the stand-in, table creation "
+            f"included: {rpc.requests['sendTransaction']} transactions in "
+            f"{time.perf_counter() - start:.1f} s"
+        )
+        await client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+
+import asyncclick as click
+from solders.pubkey import Pubkey
+from spl.token.instructions import get_associated_token_address
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.pda import derive_mint_addresses  # noqa: E402
+
+PROGRAM_ID = Pubkey.new_unique()
+OWNER = Pubkey.new_unique()
+
+
+def derive_serially(mints):
+    nft_accounts = []
+    associated_token_accounts = []
+    for mint in mints:
+        nft_accounts.append(
+            Pubkey.find_program_address([b"nft_account", bytes(mint)], PROGRAM_ID)[0]
+        )
+        associated_token_accounts.append(get_associated_token_address(OWNER, mint))
+    return nft_accounts, associated_token_accounts
+
+
+@click.command()
+@click.option(
+    "--count", "-c", "counts", multiple=True, type=int, help="Number of mints"
+)
+@click.option("--processes", "-p", default=None, type=int, help="Pool size")
+def main(counts, processes):
+    counts = list(counts) or [10_000, 100_000]
+    for count in counts:
+        mints = [Pubkey.new_unique() for _ in range(count)]
+
+        start = time.perf_counter()
+        nft_accounts, associated_token_accounts = derive_serially(mints)
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        addresses = derive_mint_addresses(
+            mints, owner=OWNER, program_id=PROGRAM_ID, processes=processes
+        )
+        pooled = time.perf_counter() - start
+
+        assert addresses.nft_accounts == nft_accounts
+        assert addresses.associated_token_accounts == associated_token_accounts
+        print(
+            f"{count} mints: serial {serial * 1000:.0f} ms, "
+            f"derive_mint_addresses {pooled * 1000:.0f} ms "
+            f"({serial / pooled:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import os
+import statistics
+import sys
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solders.keypair import Keypair
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.send_path import make_transaction  # noqa: E402
+from src.confirm import confirm_signature  # noqa: E402
+from src.sender import PipelinedSender  # noqa: E402
+from src.state import KeypairInput, sign_and_send_tx  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+
+async def send_serially(client, signer, count, ws_url):
+    latencies = []
+    start = time.perf_counter()
+    for i in range(count):
+        sent = time.perf_counter()
+        resp = await sign_and_send_tx(
+            make_transaction(signer.keypair, i + 1), client, signer, commitment=Confirmed
+        )
+        await confirm_signature(client, resp.value, Confirmed, ws_url=ws_url)
+        latencies.append(time.perf_counter() - sent)
+    return time.perf_counter() - start, latencies
+
+
+async def send_pipelined(client, signer, count, max_in_flight):
+    sender = PipelinedSender(client, max_in_flight, Confirmed)
+    results = await sender.send_all(
+        (make_transaction(signer.keypair, i + 1), [signer]) for i in range(count)
+    )
+    assert [result.index for result in results] == list(range(count))
+    assert all(result.error is None for result in results)
+    metrics = sender.metrics()
+    return metrics["elapsed"], [result.latency for result in results]
+
+
+def report(name, count, elapsed, latencies, rpc):
+    print(
+        f"{name}: {count / elapsed:.1f} tx/s, "
+        f"p50 latency {statistics.median(latencies) * 1000:.0f} ms, "
+        f"{sum(rpc.requests.values())} requests "
+        f"({rpc.requests['getSignatureStatuses']} getSignatureStatuses)"
+    )
+
+
+@click.command()
+@click.option("--count", "-n", default=50, type=int, help="Transactions to send")
+@click.option("--max-in-flight", "-k", default=32, type=int, help="Pipeline depth")
+@click.option(
+    "--latency", "-l", default=0.05, type=float, help="Stand-in RPC latency (s)"
+)
+async def main(count, max_in_flight, latency):
+    signer = KeypairInput(t_keypair=Keypair())
+    async with MockRpc(latency=latency) as rpc:
+        client = AsyncClient(rpc.http_url)
+        elapsed, latencies = await send_serially(client, signer, count, rpc.ws_url)
+        report("serial send + confirm", count, elapsed, latencies, rpc)
+        rpc.requests.clear()
+        elapsed, latencies = await send_pipelined(client, signer, count, max_in_flight)
+        report(f"PipelinedSender (K={max_in_flight})", count, elapsed, latencies, rpc)
+        await client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
+
+# Read the program id from an empty config.
+os.environ["HOME"] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.pda import derive_mint_addresses  # noqa: E402
+from src.portfolio import fetch_portfolio, get_held_mints  # noqa: E402
+from src.state import NftData, get_program_id  # noqa: E402
+from tests.mock_rpc import TOKEN_PROGRAM, MockRpc  # noqa: E402
+
+
+def token_account(mint, owner, amount):
+    return bytes(mint) + bytes(owner) + amount.to_bytes(8, "little") + bytes(93)
+
+
+def nft_data(numeration):
+    return NftData.build(
+        {
+            "validation_phrase": 0,
+            "rarity": random.randrange(4),
+            "rarity_seed_time": None,
+            "funds_location": random.randrange(3),
+            "numeration": numeration,
+            "date_created": 0,
+            "last_withdrawal_epoch": None,
+            "last_delegation_epoch": random.choice([None, 400, 401]),
+            "all_withdraws": [],
+            "all_votes": {i: True for i in range(random.randrange(4))},
+        }
+    )
+
+
+def make_wallet(owner, nfts, others):
+    accounts = {}
+    mints = [Pubkey.new_unique() for _ in range(nfts)]
+    for numeration, nft_account in enumerate(derive_mint_addresses(mints).nft_accounts):
+        accounts[str(nft_account)] = (str(get_program_id()), nft_data(numeration))
+    # Fungible balances and NFTs from other collections.
+    others = [
+        (Pubkey.new_unique(), random.choice([0, 1, 5_000])) for _ in range(others)
+    ]
+    for mint, amount in [(mint, 1) for mint in mints] + others:
+        accounts[str(Pubkey.new_unique())] = (
+            TOKEN_PROGRAM,
+            token_account(mint, owner, amount),
+        )
+    return accounts
+
+
+@click.command()
+@click.option("--nfts", "-n", default=200, type=int, help="Instance NFTs held")
+@click.option("--others", "-o", default=100, type=int, help="Other token accounts")
+@click.option("--latency", "-l", default=0.02, type=float, help="Stand-in latency (s)")
+async def main(nfts, others, latency):
+    owner = Pubkey.new_unique()
+    accounts = make_wallet(owner, nfts, others)
+    async with MockRpc(latency=latency, accounts=accounts) as rpc:
+        client = AsyncClient(rpc.http_url)
+
+        start = time.perf_counter()
+        held = await get_held_mints(client, owner)
+        found = 0
+        for nft_account in derive_mint_addresses(held).nft_accounts:
+            account = (await client.get_account_info(nft_account)).value
+            found += account is not None and account.owner == get_program_id()
+        print(
+            f"per-mint lookups: {found} NFTs in {rpc.http_requests} RPC calls, "
+            f"{time.perf_counter() - start:.2f} s"
+        )
+
+        rpc.http_requests = 0
+        start = time.perf_counter()
+        portfolio = await fetch_portfolio(client, owner)
+        print(
+            f"portfolio: {len(portfolio)} NFTs in {rpc.http_requests} RPC calls, "
+            f"{time.perf_counter() - start:.2f} s"
+        )
+        await client.close()
+
+
+if __name__ == "__main__":
+    main()
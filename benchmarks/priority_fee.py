@@ -0,0 +1,57 @@
+import os
+import random
+import statistics
+import sys
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solders.keypair import Keypair
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.send_path import make_transaction  # noqa: E402
+from src.state import KeypairInput, sign_and_send_tx  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+
+@click.command()
+@click.option("--sends", "-n", default=50, type=int, help="Sequential sends")
+@click.option("--latency", "-l", default=0.05, type=float, help="Stand-in latency (s)")
+async def main(sends, latency):
+    signer = KeypairInput(t_keypair=Keypair())
+    random.seed(0)
+    # Half the recent slots were contested; a leader only includes
+    # transactions paying at least the 67th percentile.
+    fees = sorted(random.choice([0, random.randint(1_000, 50_000)]) for _ in range(150))
+    async with MockRpc(
+        latency=latency, priority_fees=fees, min_priority_fee=fees[len(fees) * 2 // 3]
+    ) as rpc:
+        client = AsyncClient(rpc.http_url)
+        for name, priority_fee in (("no priority fee", False), ("priority fee", True)):
+            rpc.requests.clear()
+            rpc.compute_unit_prices.clear()
+            landed = len(rpc.signatures)
+            times = []
+            for i in range(sends):
+                start = time.perf_counter()
+                await sign_and_send_tx(
+                    make_transaction(signer.keypair, i + 1),
+                    client,
+                    signer,
+                    commitment=Confirmed,
+                    priority_fee=priority_fee,
+                )
+                times.append((time.perf_counter() - start) * 1000)
+            print(
+                f"{name}: median {statistics.median(times):.1f} ms per send, "
+                f"{len(rpc.signatures) - landed}/{sends} landed, "
+                f"price {statistics.median(rpc.compute_unit_prices)} micro-lamports/CU, "
+                f"{rpc.requests['getRecentPrioritizationFees']} fee requests"
+            )
+        await client.close()
+
+
+if __name__ == "__main__":
+    main()
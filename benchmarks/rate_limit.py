@@ -0,0 +1,58 @@
+import asyncio
+import os
+import sys
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import rate_limit  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+
+async def run_calls(client, calls, concurrency):
+    slots = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async def call():
+        nonlocal errors
+        async with slots:
+            try:
+                await client.get_slot()
+            except Exception:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(calls)))
+    return errors, time.perf_counter() - start
+
+
+@click.command()
+@click.option("--calls", "-n", default=600, type=int, help="Calls per mode")
+@click.option("--concurrency", "-k", default=64, type=int, help="Calls in flight")
+@click.option("--limit", default=50, type=int, help="Stand-in requests per second")
+@click.option("--retry_after", default=None, type=int, help="Retry-After seconds")
+async def main(calls, concurrency, limit, retry_after):
+    for name, limited in (("unlimited", False), ("rate limited", True)):
+        rate_limit._limiters.clear()
+        async with MockRpc(
+            latency=0.02, rate_limit=limit, retry_after=retry_after
+        ) as rpc:
+            client = AsyncClient(rpc.http_url)
+            if limited:
+                rate_limit.use_rate_limiter(client, rate=10)
+            errors, elapsed = await run_calls(client, calls, concurrency)
+            limiter = next(iter(rate_limit._limiters.values()), None)
+            print(
+                f"{name}: {calls - errors}/{calls} succeeded in {elapsed:.1f} s "
+                f"({(calls - errors) / elapsed:.1f} calls/s), "
+                f"{rpc.throttled} 429s from the endpoint"
+                + (f", settled at {limiter.rate:.1f} req/s" if limiter else "")
+            )
+            await client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import asyncio
+import os
+import sys
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
+from solders.system_program import ID as SYSTEM_PROGRAM_ID
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.rpc_batch import BatchingHTTPProvider  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+
+async def run_rounds(client, pubkeys, rounds):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(client.get_account_info(pubkey) for pubkey in pubkeys),
+            client.get_latest_blockhash(),
+            client.get_slot(),
+        )
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@click.command()
+@click.option("--rounds", "-n", default=50, type=int, help="Rounds per mode")
+@click.option("--reads", "-r", default=8, type=int, help="Account reads per round")
+@click.option("--latency", default=0.05, type=float, help="Stand-in latency (s)")
+async def main(rounds, reads, latency):
+    pubkeys = [Pubkey.new_unique() for _ in range(reads)]
+    accounts = {str(pubkey): (str(SYSTEM_PROGRAM_ID), bytes(64)) for pubkey in pubkeys}
+    async with MockRpc(latency=latency, accounts=accounts) as rpc:
+        for name, batched in (("unbatched", False), ("batched", True)):
+            client = AsyncClient(rpc.http_url)
+            if batched:
+                client._provider = BatchingHTTPProvider(rpc.http_url)
+            requests_before = rpc.http_requests
+            times = sorted(await run_rounds(client, pubkeys, rounds))
+            requests = rpc.http_requests - requests_before
+            print(
+                f"{name}: {reads + 2} calls per round, "
+                f"median {times[len(times) // 2] * 1000:.1f} ms, "
+                f"p95 {times[int(len(times) * 0.95)] * 1000:.1f} ms, "
+                f"{requests / rounds:.1f} HTTP requests per round"
+            )
+            await client.close()
+
+
+if __name__ == "__main__":
+    main()
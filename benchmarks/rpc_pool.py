@@ -0,0 +1,44 @@
+import os
+import statistics
+import sys
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.rpc_pool import get_async_client  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+
+async def run_reads(client, reads):
+    times = []
+    errors = 0
+    for _ in range(reads):
+        start = time.perf_counter()
+        try:
+            await client.get_slot()
+        except Exception:
+            errors += 1
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), errors
+
+
+@click.command()
+@click.option("--reads", "-n", default=100, type=int, help="Reads per phase")
+async def main(reads):
+    async with MockRpc(latency=0.08) as primary, MockRpc(latency=0.02) as backup:
+        single = AsyncClient(primary.http_url)
+        pooled = get_async_client([primary.http_url, backup.http_url])
+        for phase in ("primary slow", "primary returning 503"):
+            for name, client in (("single endpoint", single), ("pool", pooled)):
+                median, errors = await run_reads(client, reads)
+                print(f"{phase}, {name}: median {median:.1f} ms, {errors} errors")
+            primary.status_code = 503
+        await single.close()
+        await pooled.close()
+
+
+if __name__ == "__main__":
+    main()
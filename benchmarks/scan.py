@@ -0,0 +1,101 @@
+import base64
+import os
+import random
+import sys
+import tempfile
+import time
+
+import asyncclick as click
+from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
+
+# Read the program id from an empty config.
+os.environ["HOME"] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.rpc_pool import raw_request  # noqa: E402
+from src.scan import scan_nft_accounts  # noqa: E402
+from src.state import NftData, get_program_id  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+NFT_PHRASE = 739_024
+OTHER_PHRASE = 102_555
+VARIANTS = 1000
+
+
+def nft_data(numeration):
+    return NftData.build(
+        {
+            "validation_phrase": NFT_PHRASE,
+            "rarity": random.choice([None, 0, 1, 2, 3]),
+            "rarity_seed_time": random.choice([None, 1_700_000_000]),
+            "funds_location": random.randrange(3),
+            "numeration": numeration,
+            "date_created": 1_700_000_000,
+            "last_withdrawal_epoch": random.choice([None, 410]),
+            "last_delegation_epoch": random.choice([None, 400, 401]),
+            "all_withdraws": [410] * random.randrange(10),
+            "all_votes": {i: True for i in range(random.randrange(30))},
+        }
+    )
+
+
+def make_program_accounts(nfts, others):
+    program_id = str(get_program_id())
+    variants = [nft_data(i) for i in range(VARIANTS)]
+    accounts = {
+        str(Pubkey.new_unique()): (program_id, variants[i % VARIANTS])
+        for i in range(nfts)
+    }
+    # Config, general and proposal accounts carry other validation phrases.
+    other = OTHER_PHRASE.to_bytes(4, "little") + bytes(496)
+    accounts.update(
+        (str(Pubkey.new_unique()), (program_id, other)) for _ in range(others)
+    )
+    return accounts
+
+
+def table_bytes(table):
+    columns = [getattr(table, name) for name in table.__slots__[1:]]
+    return sum(c.itemsize * len(c) for c in columns if c is not None)
+
+
+@click.command()
+@click.option("--nfts", "-n", default=100_000, type=int, help="NftData accounts")
+@click.option("--others", "-o", default=2_000, type=int, help="Other program accounts")
+async def main(nfts, others):
+    random.seed(0)
+    async with MockRpc(accounts=make_program_accounts(nfts, others)) as rpc:
+        client = AsyncClient(rpc.http_url, timeout=120)
+
+        start = time.perf_counter()
+        params = [str(get_program_id()), {"encoding": "base64"}]
+        result = await raw_request(client, "getProgramAccounts", params)
+        decoded = []
+        for entry in result:
+            data = base64.b64decode(entry["account"]["data"][0])
+            if int.from_bytes(data[:4], "little") == NFT_PHRASE:
+                decoded.append(NftData.parse(data))
+        print(
+            f"unfiltered + NftData.parse: {len(decoded)} NFTs, "
+            f"{rpc.bytes_sent / 1e6:.1f} MB, {time.perf_counter() - start:.2f} s"
+        )
+        del result, decoded
+
+        for name, with_votes in (
+            ("memcmp, full data", True),
+            ("memcmp + dataSlice", False),
+        ):
+            rpc.bytes_sent = 0
+            start = time.perf_counter()
+            table = await scan_nft_accounts(client, NFT_PHRASE, with_votes=with_votes)
+            print(
+                f"{name}: {len(table)} NFTs, {rpc.bytes_sent / 1e6:.1f} MB, "
+                f"{time.perf_counter() - start:.2f} s, "
+                f"{table_bytes(table) / 1e6:.1f} MB of columns"
+            )
+        await client.close()
+
+
+if __name__ == "__main__":
+    main()
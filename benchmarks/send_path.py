@@ -0,0 +1,72 @@
+import os
+import statistics
+import sys
+import time
+
+import asyncclick as click
+from solana.rpc import types
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solana.transaction import Transaction
+from solders.keypair import Keypair
+from solders.system_program import TransferParams, transfer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.state import KeypairInput, sign_and_send_tx  # noqa: E402
+from tests.mock_rpc import MockRpc  # noqa: E402
+
+
+def make_transaction(payer, lamports):
+    return Transaction().add(
+        transfer(
+            TransferParams(
+                from_pubkey=payer.pubkey(), to_pubkey=payer.pubkey(), lamports=lamports
+            )
+        )
+    )
+
+
+async def fetch_then_send(client, signer, lamports):
+    tx = make_transaction(signer.keypair, lamports)
+    resp = await client.get_latest_blockhash(Confirmed)
+    tx.recent_blockhash = resp.value.blockhash
+    tx.sign(signer.keypair)
+    return await client.send_raw_transaction(
+        tx.serialize(), opts=types.TxOpts(skip_preflight=True)
+    )
+
+
+async def send_with_refresher(client, signer, lamports):
+    tx = make_transaction(signer.keypair, lamports)
+    return await sign_and_send_tx(tx, client, signer, commitment=Confirmed)
+
+
+@click.command()
+@click.option("--sends", "-n", default=50, type=int, help="Sequential sends")
+@click.option(
+    "--latency", "-l", default=0.05, type=float, help="Stand-in RPC latency (s)"
+)
+async def main(sends, latency):
+    signer = KeypairInput(t_keypair=Keypair())
+    async with MockRpc(latency=latency) as rpc:
+        client = AsyncClient(rpc.http_url)
+        for name, send in (
+            ("blockhash fetch per send", fetch_then_send),
+            ("sign_and_send_tx with refresher", send_with_refresher),
+        ):
+            rpc.requests.clear()
+            times = []
+            for i in range(sends):
+                start = time.perf_counter()
+                await send(client, signer, i + 1)
+                times.append((time.perf_counter() - start) * 1000)
+            print(
+                f"{name}: median {statistics.median(times):.1f} ms per send, "
+                f"{rpc.requests['getLatestBlockhash']} blockhash requests"
+            )
+        await client.close()
+
+
+if __name__ == "__main__":
+    main()
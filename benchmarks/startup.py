@@ -0,0 +1,62 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import asyncclick as click
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = """
+import importlib, sys, time
+t = time.perf_counter()
+importlib.import_module(sys.argv[1])
+print((time.perf_counter() - t) * 1000)
+"""
+
+
+def run_once(args):
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "src.ingl_cli", *args],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def import_once(module):
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET, module],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+@click.command()
+@click.option("--runs", "-n", default=20, type=int, help="Runs per measurement")
+@click.option(
+    "--module",
+    "-m",
+    "modules",
+    multiple=True,
+    help="Module whose import time is measured, may be repeated",
+)
+@click.argument("commands", nargs=-1)
+def main(runs, modules, commands):
+    modules = list(modules) or ["src.ingl_cli", "src.state"]
+    commands = list(commands) or ["--help", "--version", "config get"]
+    for module in modules:
+        import_times = [import_once(module) for _ in range(runs)]
+        print(f"import {module}: median {statistics.median(import_times):.1f} ms")
+    for command in commands:
+        times = [run_once(command.split()) for _ in range(runs)]
+        print(f"ingl {command}: median {statistics.median(times):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
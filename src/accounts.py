@@ -0,0 +1,77 @@
+import asyncio
+from typing import Dict, List, Optional, Sequence
+from solders.account import Account
+from solders.pubkey import Pubkey
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from .blockhash import get_blockhash_refresher
+from .state import get_blockhash_commitment, get_dry_run
+
+MAX_MULTIPLE_ACCOUNTS = 100
+
+# Dry runs read each account once per process and plan from then on.
+_dry_run_accounts: Dict[Pubkey, Optional[Account]] = {}
+
+
+async def _fetch_chunk(
+    client: AsyncClient, pubkeys: List[Pubkey], commitment: Optional[Commitment]
+) -> List[Optional[Account]]:
+    return (await client.get_multiple_accounts(pubkeys, commitment=commitment)).value
+
+
+async def _fetch_accounts(
+    client: AsyncClient,
+    unique: List[Pubkey],
+    commitment: Optional[Commitment],
+    prefetch_blockhash: bool,
+) -> Dict[Pubkey, Optional[Account]]:
+    chunks = [
+        unique[i : i + MAX_MULTIPLE_ACCOUNTS]
+        for i in range(0, len(unique), MAX_MULTIPLE_ACCOUNTS)
+    ]
+    fetches = [_fetch_chunk(client, chunk, commitment) for chunk in chunks]
+    if prefetch_blockhash:
+        # Warm the blockhash the follow-up transaction needs alongside the reads,
+        # so a batching provider sends both in the same request.
+        refresher = get_blockhash_refresher(
+            client, get_blockhash_commitment(commitment)
+        )
+        fetches.append(refresher.get())
+    results = await asyncio.gather(*fetches)
+    accounts = {}
+    for chunk, values in zip(chunks, results):
+        accounts.update(zip(chunk, values))
+    return accounts
+
+
+async def fetch_accounts(
+    client: AsyncClient,
+    pubkeys: Sequence[Pubkey],
+    commitment: Optional[Commitment] = None,
+    prefetch_blockhash: bool = False,
+) -> Dict[Pubkey, Optional[Account]]:
+    unique = list(dict.fromkeys(pubkeys))
+    if not get_dry_run():
+        return await _fetch_accounts(client, unique, commitment, prefetch_blockhash)
+    missing = [pubkey for pubkey in unique if pubkey not in _dry_run_accounts]
+    if missing:
+        _dry_run_accounts.update(
+            await _fetch_accounts(client, missing, commitment, False)
+        )
+    return {pubkey: _dry_run_accounts[pubkey] for pubkey in unique}
+
+
+async def fetch_account_data(
+    client: AsyncClient,
+    pubkeys: Sequence[Pubkey],
+    commitment: Optional[Commitment] = None,
+    prefetch_blockhash: bool = False,
+) -> List[bytes]:
+    accounts = await fetch_accounts(client, pubkeys, commitment, prefetch_blockhash)
+    data = []
+    for pubkey in pubkeys:
+        account = accounts[pubkey]
+        if account is None:
+            raise Exception(f"Account {pubkey} does not exist")
+        data.append(account.data)
+    return data
@@ -0,0 +1,111 @@
+import asyncio
+import time
+import weakref
+from typing import Optional, Tuple
+from solders.hash import Hash
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment, Confirmed
+
+SLOT_SECONDS = 0.4
+BLOCKHASH_REFRESH_SLOTS = 20
+BLOCKHASH_RETRY_SLOTS = 2
+# A blockhash stays valid for 150 blocks; stop handing one out well before that.
+BLOCKHASH_MIN_REMAINING_BLOCKS = 90
+
+_refreshers = weakref.WeakKeyDictionary()
+
+
+class BlockhashRefresher:
+    def __init__(
+        self,
+        client: AsyncClient,
+        commitment: Commitment = Confirmed,
+        refresh_slots: int = BLOCKHASH_REFRESH_SLOTS,
+    ):
+        # The refresher lives in _refreshers, keyed weakly by the client.
+        self._client = weakref.ref(client)
+        self.commitment = commitment
+        self.refresh_slots = refresh_slots
+        self.blockhash: Optional[Hash] = None
+        self.last_valid_block_height: Optional[int] = None
+        self.block_height: Optional[int] = None
+        self.observed_at = 0.0
+        self.task: Optional[asyncio.Task] = None
+        self.lock = asyncio.Lock()
+
+    @property
+    def client(self) -> Optional[AsyncClient]:
+        return self._client()
+
+    def is_closed(self) -> bool:
+        client = self.client
+        return client is None or client._provider.session.is_closed
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    def is_fresh(self) -> bool:
+        if self.blockhash is None or self.block_height is None:
+            return False
+        remaining = self.last_valid_block_height - self.block_height
+        return remaining > BLOCKHASH_MIN_REMAINING_BLOCKS
+
+    def is_observed(self) -> bool:
+        # Without the background refresh the block height goes stale; look again.
+        age = time.monotonic() - self.observed_at
+        return age < 2 * self.refresh_slots * SLOT_SECONDS
+
+    async def update_block_height(self):
+        self.block_height = (await self.client.get_block_height(self.commitment)).value
+        self.observed_at = time.monotonic()
+
+    async def refresh(self):
+        resp, height = await asyncio.gather(
+            self.client.get_latest_blockhash(self.commitment),
+            self.client.get_block_height(self.commitment),
+        )
+        self.blockhash = resp.value.blockhash
+        self.last_valid_block_height = resp.value.last_valid_block_height
+        self.block_height = height.value
+        self.observed_at = time.monotonic()
+
+    async def _run(self):
+        delay = self.refresh_slots
+        while True:
+            await asyncio.sleep(delay * SLOT_SECONDS)
+            if self.is_closed():
+                return
+            try:
+                await self.refresh()
+                delay = self.refresh_slots
+            except Exception:
+                delay = BLOCKHASH_RETRY_SLOTS
+
+    async def get(self) -> Tuple[Hash, int]:
+        if not (self.is_fresh() and self.is_observed()):
+            async with self.lock:
+                if self.blockhash is not None and not self.is_observed():
+                    await self.update_block_height()
+                if not self.is_fresh():
+                    await self.refresh()
+        self.start()
+        return self.blockhash, self.last_valid_block_height
+
+
+def get_blockhash_refresher(
+    client: AsyncClient, commitment: Commitment = Confirmed
+) -> BlockhashRefresher:
+    refreshers = _refreshers.setdefault(client, {})
+    if commitment not in refreshers:
+        refreshers[commitment] = BlockhashRefresher(client, commitment)
+    return refreshers[commitment]
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from typing import List, Optional, Sequence
+from solders.rpc.config import RpcSendTransactionConfig
+from solders.rpc.requests import SendRawTransaction
+from solders.rpc.responses import SendTransactionResp
+from solders.signature import Signature
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solana.rpc.core import _COMMITMENT_TO_SOLDERS
+from .blockhash import SLOT_SECONDS
+from .state import get_endpoints
+
+REBROADCAST_INTERVAL = 2.0
+# A blockhash expires 150 blocks in; stop then even if block heights can't be read.
+MAX_REBROADCAST_SECONDS = 150 * SLOT_SECONDS
+
+_rebroadcasts = set()
+
+
+async def _send_to(
+    client: AsyncClient, url: str, body: SendRawTransaction
+) -> Signature:
+    response = await client._provider.session.post(
+        url, content=body.to_json(), headers={"Content-Type": "application/json"}
+    )
+    response.raise_for_status()
+    parsed = SendTransactionResp.from_json(response.text)
+    if not isinstance(parsed, SendTransactionResp):
+        raise Exception(getattr(parsed, "message", parsed))
+    return parsed.value
+
+
+async def _send_to_all(
+    client: AsyncClient, endpoints: Sequence[str], body: SendRawTransaction
+) -> Signature:
+    results = await asyncio.gather(
+        *(_send_to(client, url, body) for url in endpoints), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Signature):
+            return result
+    raise results[0]
+
+
+async def _rebroadcast(
+    client: AsyncClient,
+    endpoints: Sequence[str],
+    raw: bytes,
+    signature: Signature,
+    last_valid_block_height: int,
+    interval: float,
+):
+    body = SendRawTransaction(raw, RpcSendTransactionConfig(skip_preflight=True))
+    deadline = time.monotonic() + MAX_REBROADCAST_SECONDS
+    while not client._provider.session.is_closed:
+        await asyncio.sleep(interval)
+        if time.monotonic() > deadline:
+            return
+        try:
+            if (await client.get_signature_statuses([signature])).value[0]:
+                return
+            if (await client.get_block_height()).value > last_valid_block_height:
+                return
+            await _send_to_all(client, endpoints, body)
+        except Exception:
+            # Keep trying until the signature lands or the blockhash expires.
+            pass
+
+
+def get_broadcast_endpoints(client: AsyncClient) -> List[str]:
+    provider = client._provider
+    if hasattr(provider, "endpoints"):
+        return [endpoint.url for endpoint in provider.endpoints]
+    endpoints = [provider.endpoint_uri]
+    return endpoints + [e for e in get_endpoints() if e not in endpoints]
+
+
+async def broadcast_transaction(
+    client: AsyncClient,
+    raw: bytes,
+    last_valid_block_height: int,
+    skip_preflight: bool = False,
+    preflight_commitment: Optional[Commitment] = None,
+    endpoints: Optional[Sequence[str]] = None,
+    interval: float = REBROADCAST_INTERVAL,
+) -> SendTransactionResp:
+    endpoints = list(endpoints or get_broadcast_endpoints(client))
+    config = RpcSendTransactionConfig(
+        skip_preflight=skip_preflight,
+        preflight_commitment=_COMMITMENT_TO_SOLDERS[
+            preflight_commitment or client._commitment
+        ],
+    )
+    signature = await _send_to_all(
+        client, endpoints, SendRawTransaction(raw, config)
+    )
+    task = asyncio.ensure_future(
+        _rebroadcast(
+            client, endpoints, raw, signature, last_valid_block_height, interval
+        )
+    )
+    _rebroadcasts.add(task)
+    task.add_done_callback(_rebroadcasts.discard)
+    return SendTransactionResp(signature)
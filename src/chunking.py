@@ -0,0 +1,75 @@
+from typing import Callable, List, Optional, Sequence, Tuple
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+from solana.transaction import PACKET_DATA_SIZE, Transaction
+from .compute_units import MAX_COMPUTE_UNITS
+from .instruction import ComputeBudgetInstruction
+from .state import get_transaction_size
+
+# Accounts a transaction may lock, looked-up ones included.
+MAX_TRANSACTION_ACCOUNTS = 64
+# The instructions' cnt field is a u8.
+MAX_MINTS_PER_INSTRUCTION = 255
+
+MintChunk = Tuple[List[Pubkey], Transaction]
+
+_compute_budget = ComputeBudgetInstruction()
+
+
+def count_accounts(instructions: Sequence[Instruction], fee_payer: Pubkey) -> int:
+    accounts = {fee_payer}
+    for ix in instructions:
+        accounts.add(ix.program_id)
+        accounts.update(meta.pubkey for meta in ix.accounts)
+    return len(accounts)
+
+
+def _budget_instructions(fee_payer: Pubkey) -> List[Instruction]:
+    # sign_and_send_tx may prepend both; leave room so neither gets dropped.
+    return [
+        _compute_budget.set_compute_unit_limit(MAX_COMPUTE_UNITS, fee_payer),
+        _compute_budget.set_compute_unit_price(1, fee_payer),
+    ]
+
+
+def pack_mints(
+    build: Callable[[List[Pubkey]], Instruction],
+    mints: Sequence[Pubkey],
+    fee_payer: Pubkey,
+    lookup_tables: Optional[List[AddressLookupTableAccount]] = None,
+    max_mints: int = MAX_MINTS_PER_INSTRUCTION,
+) -> List[MintChunk]:
+    budget = _budget_instructions(fee_payer)
+
+    def fits(chunk: List[Pubkey]) -> bool:
+        instructions = [*budget, build(chunk)]
+        # Check the account count first; compiling past 256 keys panics.
+        if count_accounts(instructions, fee_payer) > MAX_TRANSACTION_ACCOUNTS:
+            return False
+        tx = Transaction(fee_payer=fee_payer)
+        tx.instructions = instructions
+        return get_transaction_size(tx, lookup_tables) <= PACKET_DATA_SIZE
+
+    chunks: List[MintChunk] = []
+    start, count = 0, 1
+    while start < len(mints):
+        # Chunks of one instruction usually hold the same number of mints,
+        # so start from the last chunk's count and adjust.
+        count = min(count, max_mints, len(mints) - start)
+        while count > 1 and not fits(list(mints[start : start + count])):
+            count -= 1
+        if count == 1 and not fits([mints[start]]):
+            raise Exception(f"Mint {mints[start]} does not fit in a transaction")
+        while (
+            count < max_mints
+            and start + count < len(mints)
+            and fits(list(mints[start : start + count + 1]))
+        ):
+            count += 1
+        chunk = list(mints[start : start + count])
+        tx = Transaction(fee_payer=fee_payer)
+        tx.add(build(chunk))
+        chunks.append((chunk, tx))
+        start += count
+    return chunks
@@ -0,0 +1,265 @@
+import asyncclick as click
+from ..state import *
+from rich import print
+
+
+@click.group(name="config")
+async def config():
+    pass
+
+
+@click.command(
+    name="set",
+    help="Set the default config options. Options: --program_id/-p, --url/-u, --keypair/-k, --endpoint/-e, --broadcast, --hedge_reads, --hedge_delay, --batch_requests, --rate_limit, --priority_fee, --priority_fee_percentile, --priority_fee_cap, --auto_compute_units, --lookup_tables, --commitment/-c, --verify_finality",
+)
+@click.option(
+    "--program_id",
+    "-p",
+    help="Enter the program Id of the validator instance transactions will default to",
+)
+@click.option(
+    "--url",
+    "-u",
+    help="Enter the network you want to connect to. Options: mainnet, testnet, devnet, or a custom url.",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    help="Enter the path to the keypair that transactions will be signed with by default.",
+)
+@click.option(
+    "--endpoint",
+    "-e",
+    "endpoints",
+    multiple=True,
+    help="Enter an additional RPC endpoint to pool with the network url, may be repeated. Pass an empty string to clear.",
+)
+@click.option(
+    "--broadcast/--no_broadcast",
+    default=None,
+    help="Send transactions to every pooled endpoint and rebroadcast them until they land or expire.",
+)
+@click.option(
+    "--hedge_reads/--no_hedge_reads",
+    default=None,
+    help="Duplicate slow read requests to a second pooled endpoint and use whichever answers first.",
+)
+@click.option(
+    "--hedge_delay",
+    type=float,
+    help="Milliseconds to wait before hedging a read. 0 uses the endpoint's measured p95 latency.",
+)
+@click.option(
+    "--batch_requests/--no_batch_requests",
+    default=None,
+    help="Combine RPC calls issued together into a single JSON-RPC batch request.",
+)
+@click.option(
+    "--rate_limit",
+    type=float,
+    help="Requests per second each endpoint starts at before adapting to 429s. Defaults to no cap until an endpoint answers 429. 0 disables rate limiting.",
+)
+@click.option(
+    "--priority_fee/--no_priority_fee",
+    default=None,
+    help="Add a compute unit price estimated from recent prioritization fees on the accounts a transaction writes.",
+)
+@click.option(
+    "--priority_fee_percentile",
+    type=click.FloatRange(0, 100),
+    help="Percentile of recent prioritization fees to pay. Default: 75.",
+)
+@click.option(
+    "--priority_fee_cap",
+    type=click.IntRange(0),
+    help="Maximum compute unit price to pay, in micro-lamports. Default: 100000.",
+)
+@click.option(
+    "--auto_compute_units/--no_auto_compute_units",
+    default=None,
+    help="Size each transaction's compute unit limit from a simulation, remembered per instruction variant.",
+)
+@click.option(
+    "--lookup_tables/--no_lookup_tables",
+    default=None,
+    help="Send multi-mint transactions as v0 transactions through the keypair's address lookup table.",
+)
+@click.option(
+    "--commitment",
+    "-c",
+    type=click.Choice(COMMITMENT_LEVELS),
+    help="Enter the commitment level transactions are confirmed at by default.",
+)
+@click.option(
+    "--verify_finality/--no_verify_finality",
+    default=None,
+    help="Keep checking finality in the background when confirming below finalized.",
+)
+def set(
+    program_id,
+    url,
+    keypair,
+    endpoints,
+    broadcast,
+    hedge_reads,
+    hedge_delay,
+    batch_requests,
+    rate_limit,
+    priority_fee,
+    priority_fee_percentile,
+    priority_fee_cap,
+    auto_compute_units,
+    lookup_tables,
+    commitment,
+    verify_finality,
+):
+    assert (
+        program_id
+        or url
+        or keypair
+        or endpoints
+        or broadcast is not None
+        or hedge_reads is not None
+        or hedge_delay is not None
+        or batch_requests is not None
+        or rate_limit is not None
+        or priority_fee is not None
+        or priority_fee_percentile is not None
+        or priority_fee_cap is not None
+        or auto_compute_units is not None
+        or lookup_tables is not None
+        or commitment
+        or verify_finality is not None
+    ), "No options specified. Use --help for more information."
+    updates = {}
+    if program_id:
+        try:
+            program_pubkey = parse_pubkey_input(program_id)
+        except Exception as e:
+            print("Invalid Public Key provided.")
+            return
+        updates["program_id"] = program_pubkey.pubkey.__str__()
+    if url:
+        if (
+            url.lower() == "mainnet"
+            or url.lower() == "testnet"
+            or url.lower() == "devnet"
+        ):
+            url = get_network_url(url)
+        updates["network"] = url
+    if keypair:
+        try:
+            keypair_path, keypair_value = load_keypair_path(keypair)
+        except Exception as e:
+            print("Invalid keypair path")
+            return
+        updates["keypair_path"] = keypair_path
+    if endpoints:
+        endpoints = [
+            get_network_url(e) if e.lower() in ("mainnet", "testnet", "devnet") else e
+            for e in endpoints
+            if e
+        ]
+        updates["endpoints"] = endpoints
+    if broadcast is not None:
+        updates["broadcast"] = broadcast
+    if hedge_reads is not None:
+        updates["hedge_reads"] = hedge_reads
+    if hedge_delay is not None:
+        updates["hedge_delay"] = hedge_delay / 1000
+    if batch_requests is not None:
+        updates["batch_requests"] = batch_requests
+    if rate_limit is not None:
+        updates["rate_limit"] = rate_limit
+    if priority_fee is not None:
+        updates["priority_fee"] = priority_fee
+    if priority_fee_percentile is not None:
+        updates["priority_fee_percentile"] = priority_fee_percentile
+    if priority_fee_cap is not None:
+        updates["priority_fee_cap"] = priority_fee_cap
+    if auto_compute_units is not None:
+        updates["auto_compute_units"] = auto_compute_units
+    if lookup_tables is not None:
+        updates["lookup_tables"] = lookup_tables
+    if commitment:
+        updates["commitment"] = commitment
+    if verify_finality is not None:
+        updates["verify_finality"] = verify_finality
+    if not updates:
+        print("No options specified. Use --help for more information.")
+        return
+    set_configs(updates)
+    if program_id:
+        print("Program ID set to: ", program_pubkey.pubkey)
+    if url:
+        print("Network set to: ", url)
+    if keypair:
+        print("Keypair path set to: ", keypair_path)
+        print("Keypair Public Key: ", keypair_value.pubkey())
+    if "endpoints" in updates:
+        print("Additional endpoints set to: ", ", ".join(endpoints) or "none")
+    if broadcast is not None:
+        print("Broadcast set to: ", broadcast)
+    if hedge_reads is not None:
+        print("Hedge reads set to: ", hedge_reads)
+    if hedge_delay is not None:
+        print("Hedge delay set to: ", f"{hedge_delay} ms" if hedge_delay else "p95")
+    if batch_requests is not None:
+        print("Batch requests set to: ", batch_requests)
+    if rate_limit is not None:
+        print("Rate limit set to: ", f"{rate_limit} req/s" if rate_limit else "off")
+    if priority_fee is not None:
+        print("Priority fee set to: ", priority_fee)
+    if priority_fee_percentile is not None:
+        print("Priority fee percentile set to: ", priority_fee_percentile)
+    if priority_fee_cap is not None:
+        print("Priority fee cap set to: ", f"{priority_fee_cap} micro-lamports/CU")
+    if auto_compute_units is not None:
+        print("Auto compute units set to: ", auto_compute_units)
+    if lookup_tables is not None:
+        print("Lookup tables set to: ", lookup_tables)
+    if commitment:
+        print("Commitment set to: ", commitment)
+    if verify_finality is not None:
+        print("Verify finality set to: ", verify_finality)
+    print("Config set successfully.")
+
+
+@click.command(name="get")
+def get():
+
+    print("\nProgram ID: ", get_program_id())
+    print("Network: ", get_network())
+    print("Endpoints: ", ", ".join(get_endpoints()))
+    print("Broadcast: ", get_broadcast())
+    hedge_delay = get_hedge_delay()
+    print(
+        "Hedge reads: ",
+        get_hedge_reads(),
+        f"(after {hedge_delay * 1000:g} ms)" if hedge_delay else "(after p95)",
+    )
+    print("Batch requests: ", get_batch_requests())
+    rate_limit = get_rate_limit()
+    if rate_limit is None:
+        print("Rate limit: ", "uncapped until a 429")
+    else:
+        print("Rate limit: ", f"{rate_limit:g} req/s" if rate_limit else "off")
+    print(
+        "Priority fee: ",
+        get_priority_fee(),
+        f"(p{get_priority_fee_percentile():g}, capped at {get_priority_fee_cap()} micro-lamports/CU)",
+    )
+    print("Auto compute units: ", get_auto_compute_units())
+    print("Lookup tables: ", get_lookup_tables())
+    print("Keypair: ", get_keypair_path())
+    print("Commitment: ", get_commitment())
+    print("Verify finality: ", get_verify_finality())
+    try:
+        print("Keypair Public Key: ", parse_keypair_input(get_keypair_path()).pubkey)
+    except Exception as e:
+        pass
+    print("\nConfig retrieved successfully.")
+
+
+config.add_command(set)
+config.add_command(get)
@@ -0,0 +1,240 @@
+import asyncclick as click
+from ..instruction import *
+from ..processor import *
+from ..state import *
+from ..utils import *
+from ..rpc_pool import get_async_client
+from ..portfolio import fetch_portfolio
+from rich import print
+
+
+@click.command(
+    name="init_governance",
+    help="Initialize Governance, Arguments: Mint_Id(Pubkey or Kepair) Options: --keypair/-k, --log_level/-l",
+)
+@click.argument(
+    "mint_id",
+    type=str,
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_create_governance(keypair, mint_id, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input. ")
+        return
+    try:
+        mint_pubkey = parse_pubkey_input(mint_id)
+    except Exception as e:
+        print("Invalid Public Key provided for mint.")
+        return
+
+    governed = ["Validator Name", "Program Upgrade"]
+    for i in range(len(governed)):
+        print(f"{i} : {governed[i]}")
+    numeration = click.prompt("Enter the number of the governed item", type=int)
+    if numeration not in range(len(governed)):
+        print("Invalid Input")
+        return
+    if numeration == 0:
+        value = click.prompt("Enter the new validator name: ", type=str)
+        title = click.prompt("Enter the new Proposal's Title", type=str)
+        description = click.prompt("Enter the Proposal's Description", type=str)
+        t_dets = await init_governance(
+            payer_keypair,
+            mint_pubkey,
+            client,
+            title=title,
+            description=description,
+            governance_type=GovernanceType.enum.ConfigAccount(),
+            config_account_type=ConfigAccountType.enum.ValidatorName(value=value),
+            log_level=log_level,
+        )
+    elif numeration == 1:
+        try:
+            buffer_address = parse_pubkey_input(
+                click.prompt("Enter the buffer address: ", type=str)
+            ).pubkey
+        except Exception as e:
+            print("Invalid Public Key provided for buffer.")
+            return
+        code_link = click.prompt("Enter the code link: ", type=str)
+        title = click.prompt("Enter the new Proposal's Title", type=str)
+        description = click.prompt("Enter the Proposal's Description", type=str)
+
+        t_dets = await init_governance(
+            payer_keypair,
+            mint_pubkey,
+            client,
+            title=title,
+            description=description,
+            governance_type=GovernanceType.enum.ProgramUpgrade(
+                buffer_account=buffer_address, code_link=code_link
+            ),
+            log_level=log_level,
+        )
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="vote_governance",
+    help="Vote on a Governance Proposal, Arguments: Mint_IDs(Pubkeys or Keypairs), Numeration, Options: --vote/-v, --portfolio/-p, --keypair/-k, --log_level/-l",
+)
+@click.argument("mints", type=str, nargs=-1)
+@click.argument(
+    "numeration",
+    type=int,
+)
+@click.option(
+    "--vote",
+    "-v",
+    default="D",
+    help="Enter the vote you want to cast. D: For 'Dissapprove', A: For 'Approve', ",
+)
+@click.option(
+    "--portfolio",
+    "-p",
+    is_flag=True,
+    help="Vote with every NFT of the instance held by the keypair that has not voted on this proposal yet",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_vote_governance(
+    keypair, mints, numeration, vote, portfolio, log_level
+):
+    client = get_async_client()
+    try:
+        client_state = await client.is_connected()
+        print("Client is connected" if client_state else "Client is Disconnected")
+        try:
+            payer_keypair = parse_keypair_input(keypair)
+        except Exception as e:
+            print("Invalid Keypair Input. ")
+            return
+
+        try:
+            mint_pubkeys = [parse_pubkey_input(mint).pubkey for mint in mints]
+        except Exception as e:
+            print("Invalid Public Key provided for mint.")
+            return
+        if portfolio:
+            try:
+                held = await fetch_portfolio(client, payer_keypair.pubkey)
+            except Exception as e:
+                print("Unable to fetch the portfolio, ", e)
+                return
+            unvoted = [entry.mint for entry in held if not entry.has_voted(numeration)]
+            print(
+                f"Voting with {len(unvoted)} of {len(held)} NFTs in the portfolio, "
+                f"{len(held) - len(unvoted)} already voted"
+            )
+            mint_pubkeys = list(dict.fromkeys(mint_pubkeys + unvoted))
+        if not mint_pubkeys:
+            print("No mints to vote with.")
+            return
+        vote = parse_vote(vote)
+        t_dets = await vote_governance(
+            payer_keypair, vote, numeration, mint_pubkeys, client, log_level
+        )
+        print(t_dets)
+    finally:
+        await client.close()
+
+
+@click.command(
+    name="finalize_governance",
+    help="Finalize a Governance Proposal, Arguments: Numeration(int), Options: --keypair/-k, --log_level/-l",
+)
+@click.argument(
+    "numeration",
+    type=int,
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_finalize_governance(keypair, numeration, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input. ")
+        return
+
+    t_dets = await finalize_governance(payer_keypair, numeration, client, log_level)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="execute_governance",
+    help="Execute a Governance Proposal, Arguments: Numeration(int), Options: --keypair/-k, --log_level/-l",
+)
+@click.argument(
+    "numeration",
+    type=int,
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_execute_governance(keypair, numeration, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input. ")
+        return
+
+    t_dets = await execute_governance(payer_keypair, numeration, client, log_level)
+    print(t_dets)
+    await client.close()
@@ -0,0 +1,745 @@
+import asyncclick as click
+from ..instruction import *
+from ..processor import *
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from borsh_construct import *
+from ..state import *
+from ..utils import *
+from ..state import Constants as ingl_constants
+from ..pda import find_program_address
+from ..portfolio import fetch_portfolio, render_portfolio
+from ..scan import render_nft_table, scan_nft_accounts
+from ..rpc_pool import get_async_client
+from rich import print
+
+
+@click.command(
+    name="mint", help="Mint a new NFT. Options: --keypair/-k, --log_level/-l"
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def mint(keypair, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input. ", e)
+        return
+    mint_keypair = KeypairInput(t_keypair=Keypair())
+    print("Mint_Id: ", mint_keypair.pubkey)
+    t_dets = await mint_nft(payer_keypair, mint_keypair, client, log_level)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="init_rebalance",
+    help="Initialize the rebalancing process. Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def initialize_rebalancing(keypair, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input. ")
+        return
+    t_dets = await init_rebalance(payer_keypair, client, log_level)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="finalize_rebalance",
+    help="Finalize the rebalancing process. Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def finalize_rebalancing(keypair, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input. ")
+        return
+    t_dets = await finalize_rebalance(payer_keypair, client, log_level)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="init",
+    help="Initialize the validator instance. Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "--validator",
+    "-v",
+    default=get_keypair_path,
+    help="Enter the path to the validator id, or the public key of the validator id for this instance",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--authorized_withdrawer",
+    "-aw",
+    default=get_keypair_path,
+    help="Enter the path to the authorized_withdrawer keypair of the vote account you seek to fractionalize if already created",
+)
+@click.option(
+    "--upgrade_authority",
+    "-ua",
+    default=get_keypair_path,
+    help="Enter the path to the upgrade authority of the program instance in question",
+)
+@click.option(
+    "--vote_account",
+    "-va",
+    default=None,
+    help="Enter the path to the vote_account keypair, or the publicKey of the vote_account you seek to fractionalize",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def ingl(
+    keypair,
+    validator,
+    authorized_withdrawer,
+    upgrade_authority,
+    vote_account,
+    log_level,
+):
+
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input. ")
+        return
+    try:
+        validator_key = parse_pubkey_input(validator)
+    except Exception as e:
+        print("Invalid Validator Input. ")
+        return
+    try:
+        upgrade_authority_keypair = parse_keypair_input(upgrade_authority)
+    except Exception as e:
+        print("Invalid Upgrade Authority Input. ")
+        return
+
+    if vote_account:
+        try:
+            authorized_withdrawer_keypair = parse_keypair_input(authorized_withdrawer)
+        except Exception as e:
+            print("Invalid Authorized Withdrawer Input. ")
+            return
+
+        try:
+            vote_account_key = parse_pubkey_input(vote_account)
+        except Exception as e:
+            print("Invalid Vote Account Input. ")
+            return
+
+    init_commission = 105
+    counter = 0
+    while init_commission > 100 or init_commission < 0:
+        if counter > 0:
+            print("Invalid Input.")
+        counter += 1
+        init_commission = click.prompt(
+            "Enter the Commission(%) to be set for the validator ( > 0, <=100)",
+            type=int,
+        )
+    max_primary_stake = 1
+    counter = 0
+    while max_primary_stake < 1_030_000_000:
+        if counter > 0:
+            print("Invalid Input.")
+        counter += 1
+        max_primary_stake = click.prompt(
+            "Enter the maximum primary stake(in lamports) to be set for the validator (>1,030,000,000)",
+            type=int,
+        )
+    nft_holders_share = 105
+    counter = 0
+    while nft_holders_share > 100 or nft_holders_share < 50:
+        if counter > 0:
+            print("Invalid Input.")
+        counter += 1
+        nft_holders_share = click.prompt(
+            "Enter the NFT Holders Share(%) to be set for the validator (>50, <=100)",
+            type=int,
+        )
+    initial_redemption_fee = 26
+    counter = 0
+    while initial_redemption_fee > 25 or initial_redemption_fee < 0:
+        if counter > 0:
+            print("Invalid Input.")
+        counter += 1
+        initial_redemption_fee = click.prompt(
+            "Enter the Initial Redemption Fee(%) to be set for the validator (>=0, <=25)",
+            type=int,
+        )
+    is_validator_switchable = None
+    counter = 0
+    while type(is_validator_switchable) != bool:
+        if counter > 0:
+            print("Invalid Input.")
+        counter += 1
+        is_validator_switchable = click.prompt(
+            "Is the validator switchable? (y/n) ", type=bool
+        )
+    unit_backing = 1
+    counter = 0
+    while unit_backing < 1_030_000_000:
+        if counter > 0:
+            print("Invalid Input.")
+        counter += 1
+        unit_backing = click.prompt(
+            "Enter the Unit Backing(in lamports) to be set for the validator (>1,030,000,000) ",
+            type=int,
+        )
+    redemption_fee_duration = 70_000_000
+    counter = 0
+    while redemption_fee_duration > 63_072_000:
+        if counter > 0:
+            print("Invalid Input.")
+        counter += 1
+        redemption_fee_duration = click.prompt(
+            "Enter the Redemption Fee duration(in seconds) to be set for the validator (<63,072,000)",
+            type=int,
+        )
+    proposal_quorum = 60
+    counter = 0
+    while proposal_quorum < 65 or proposal_quorum > 100:
+        if counter > 0:
+            print("Invalid Input.")
+        counter += 1
+        proposal_quorum = click.prompt(
+            "Enter the Proposal Quorum(%) to be set for governance proposals (>=65, <=100) ",
+            type=int,
+        )
+    creator_royalty = 300
+    counter = 0
+    while creator_royalty > 200 or creator_royalty < 0:
+        if counter > 0:
+            print("Invalid Input.")
+        counter += 1
+        creator_royalty = click.prompt(
+            "Enter the Creator Royalty(in basis points) to be set for the validator (>=0, <200)",
+            type=int,
+        )
+    governance_expiration_time = 1
+    counter = 0
+    while governance_expiration_time < 35 or governance_expiration_time > 365:
+        if counter > 0:
+            print("Invalid Input.")
+        counter += 1
+        governance_expiration_time = click.prompt(
+            "How long should a governance take to expire? (in days) (>=35 days, <=365 days) ",
+            type=int,
+        )
+    governance_expiration_time = governance_expiration_time * 86_400
+    twitter_handle = click.prompt("Enter the Twitter handle of the validator", type=str)
+    discord_invite = click.prompt("Enter the Discord Invite of the validator", type=str)
+    validator_name = click.prompt("Enter the Name of the validator", type=str)
+    website = click.prompt("Enter the Website of the validator", type=str)
+    default_uri = click.prompt("Enter the Default URI of the validator", type=str)
+
+    json_data = {}
+    while "uris" not in json_data:
+        json_path = click.prompt(
+            "Enter the Collection path to the config json", type=str
+        )
+        try:
+            f = open(f"{json_path}", "r")
+            json_data = json.load(f)
+            f.close()
+        except Exception as e:
+            print("Invalid Json Path. ")
+            return
+    collection_uri = json_data["collection_uri"]
+    rarity_names = json_data["rarity_names"]
+    rarities = json_data["rarities"]
+
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+
+    if vote_account:
+        t_dets = await fractionalize_existing(
+            payer_keypair,
+            authorized_withdrawer_keypair,
+            upgrade_authority_keypair,
+            vote_account_key,
+            validator_key,
+            init_commission,
+            max_primary_stake,
+            nft_holders_share,
+            initial_redemption_fee,
+            is_validator_switchable,
+            unit_backing,
+            redemption_fee_duration,
+            proposal_quorum,
+            creator_royalty,
+            governance_expiration_time,
+            rarities,
+            rarity_names,
+            twitter_handle,
+            discord_invite,
+            validator_name,
+            collection_uri,
+            website,
+            default_uri,
+            client,
+            log_level,
+        )
+
+    else:
+        t_dets = await ingl_init(
+            payer_keypair,
+            upgrade_authority_keypair,
+            validator_key,
+            init_commission,
+            max_primary_stake,
+            nft_holders_share,
+            initial_redemption_fee,
+            is_validator_switchable,
+            unit_backing,
+            redemption_fee_duration,
+            proposal_quorum,
+            creator_royalty,
+            governance_expiration_time,
+            rarities,
+            rarity_names,
+            twitter_handle,
+            discord_invite,
+            validator_name,
+            collection_uri,
+            website,
+            default_uri,
+            client,
+            log_level,
+        )
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="process_rewards",
+    help="Process rewards for a vote account, Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_vote_account_rewards(keypair, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input. ")
+        return
+    t_dets = await process_rewards(payer_keypair, client, log_level)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="create_vote_account",
+    help="Create the vote account for the validator's program instance, Options: --val_keypair/-k, --log_level/-l",
+)
+@click.option(
+    "--val_keypair",
+    default=get_keypair_path,
+    help="Enter the path to the validator id keypair json file. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_create_vote_account(val_keypair, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(f"{val_keypair}")
+    except Exception as e:
+        print("Invalid Keypair Input. ")
+        return
+    t_dets = await create_vote_account(payer_keypair, client, log_level)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="delegate",
+    help="Delegate an NFT to a validator, Argument: Mint_ID(Pubkey or Keypair), Options: --keypair/-k, --log_level/-l",
+)
+@click.argument("mint_id", type=str)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_delegate_gem(keypair, mint_id, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input. ")
+        return
+    try:
+        mint_pubkey = parse_pubkey_input(mint_id)
+    except Exception as e:
+        print("Invalid Public Key provided.")
+        return
+    t_dets = await delegate_nft(payer_keypair, mint_pubkey, client, log_level)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="undelegate",
+    help="Undelegate an NFT from a validator, Argument: Mint_ID(Pubkey or Keypair), Options: --keypair/-k, --log_level/-l",
+)
+@click.argument("mint_id", type=str)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_undelegate_gem(keypair, mint_id, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input. ")
+        return
+    try:
+        mint_pubkey = parse_pubkey_input(mint_id)
+    except Exception as e:
+        print("Invalid Public Key provided.")
+        return
+    # print(payer_keypair, mint_pubkey)
+    t_dets = await undelegate_nft(payer_keypair, mint_pubkey, client, log_level)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="upload_uris",
+    help="Upload URIs for the Validator's instange NFTs, Arguments: json_path(path to uris Json file) Options: --keypair/-k, --log_level/-l",
+)
+@click.argument("json_path")
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_upload_uris(keypair, json_path, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input, ", e)
+        return
+    try:
+        f = open(f"{json_path}", "r")
+        json_data = json.load(f)
+        f.close()
+    except Exception as e:
+        print("Invalid Json Path. ")
+        return
+    sender = await upload_uris(
+        payer_keypair,
+        payer_keypair,
+        json_data["uris"],
+        client,
+        log_level,
+    )
+    for result in sender.results:
+        if result.plan is not None:
+            print(result.plan.render())
+        elif result.error is not None:
+            print(f"[warning]Error: {result.error}[/warning]")
+        else:
+            print(get_tx_link(result.signature))
+    if any(result.error is not None for result in sender.results):
+        print("[warning]Stopped at the failed upload, the rest were not sent[/warning]")
+    if not get_dry_run():
+        metrics = sender.metrics()
+        print(
+            f"Confirmed {metrics['confirmed']}/{metrics['sent']} transactions in {metrics['elapsed']:.1f}s ({metrics['tx_per_second']:.1f} tx/s)"
+        )
+    await client.close()
+
+
+@click.command(
+    name="reset_uris",
+    help="Reset URIs for the Validator's instange NFTs, Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_reset_uris(keypair, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input, ", e)
+        return
+    t_dets = await reset_uris(payer_keypair, client, log_level)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="get_vote_pubkey",
+    help="Get the Vote Account Pubkey for the Validator's instance, Options: --program_id/-p",
+)
+@click.option(
+    "--program_id",
+    "-p",
+    default=get_program_id,
+    help="Enter the program_id of the validator instance you want to get the vote account pubkey for. Defaults to the set config program_id",
+)
+async def process_get_vote_key(program_id):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        program_pubkey = parse_pubkey_input(program_id)
+    except Exception as e:
+        print("Invalid Pubkey Input, ", e)
+        return
+    print("Program_id: ", program_pubkey.pubkey)
+    config_account_pubkey, _config_account_bump = find_program_address(
+        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], program_pubkey.pubkey
+    )
+    config_data = ValidatorConfig.parse(
+        (await client.get_account_info(config_account_pubkey)).value.data
+    )
+    vote_account_key = Pubkey(config_data.vote_account)
+    print("Vote Account Key: ", vote_account_key)
+    return
+
+
+@click.command(name="inject_test")
+@click.argument("num_mints", type=int)
+@click.option(
+    "--portfolio",
+    "-p",
+    is_flag=True,
+    help="Use the instance's NFTs held by the keypair instead of prompting for each mint",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def process_inject_test(keypair, num_mints, portfolio, log_level):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input, ", e)
+        return
+
+    mints = []
+    if portfolio:
+        try:
+            held = await fetch_portfolio(client, payer_keypair.pubkey)
+        except Exception as e:
+            print("Unable to fetch the portfolio, ", e)
+            return
+        mints = [entry.mint for entry in held[:num_mints]]
+        print(f"Using {len(mints)} NFTs from the portfolio")
+    for i in range(len(mints), num_mints):
+        while True:
+            try:
+                mints.append(
+                    parse_pubkey_input(
+                        click.prompt(f"Enter the Mint Address for Mint {i+1}", type=str)
+                    ).pubkey
+                )
+                break
+            except Exception as e:
+                print("Invalid Mint Address, ", e)
+
+    t_dets = await inject_testing_data(
+        payer_keypair, mints, client, log_level=log_level
+    )
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="portfolio",
+    help="List the instance's NFTs held by a wallet, Arguments: Owner(Pubkey or Keypair), defaults to the set config keypair",
+)
+@click.argument("owner", type=str, default=get_keypair_path)
+async def process_portfolio(owner):
+    client = get_async_client()
+    try:
+        try:
+            owner_pubkey = parse_pubkey_input(owner)
+        except Exception as e:
+            print("Invalid Pubkey Input, ", e)
+            return
+        try:
+            portfolio = await fetch_portfolio(client, owner_pubkey.pubkey)
+        except Exception as e:
+            print(f"Error: {e}")
+            return
+        print(f"{len(portfolio)} NFTs held by {owner_pubkey.pubkey}")
+        if portfolio:
+            print(render_portfolio(portfolio))
+    finally:
+        await client.close()
+
+
+@click.command(
+    name="scan",
+    help="List every NFT account of the instance by rarity and funds location, Options: --validation_phrase/-v, --votes",
+)
+@click.option(
+    "--validation_phrase",
+    "-v",
+    required=True,
+    type=int,
+    help="The validation phrase the program stores at the start of every NFT account",
+)
+@click.option(
+    "--votes",
+    is_flag=True,
+    help="Also fetch each account's votes. Downloads the full accounts instead of their headers",
+)
+async def process_scan(validation_phrase, votes):
+    client = get_async_client()
+    try:
+        try:
+            table = await scan_nft_accounts(client, validation_phrase, with_votes=votes)
+        except Exception as e:
+            print(f"Error: {e}")
+            return
+        print(f"{len(table)} NFT accounts found for program {get_program_id()}")
+        if len(table):
+            print(render_nft_table(table))
+        if table.votes is not None:
+            print(f"Votes cast: {sum(table.votes)}")
+    finally:
+        await client.close()
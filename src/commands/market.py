@@ -0,0 +1,299 @@
+import asyncclick as click
+from ..instruction import *
+from ..processor import *
+from ..state import *
+from ..rpc_pool import get_async_client
+from rich import print
+import time
+
+
+@click.command(
+    name="list",
+    help="Initialize the validator instance. Options: --upgrade_authority/-u, --authorized_withdrawer/-aw, --log_level/-l",
+)
+@click.argument("validator_json", type=str)
+@click.option(
+    "--upgrade_authority",
+    "-u",
+    default=get_market_keypair_path,
+    help="Enter the path to the program's upgrade authority. Defaults to the set config keypair",
+)
+@click.option(
+    "--authorized_withdrawer",
+    "-aw",
+    default=get_market_keypair_path,
+    help="Enter the path to the authorized_withdrawer keypair of the vote account. Defaults to the set config keypair",
+)
+@click.option(
+    "--log_level",
+    "-l",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def list_validator(
+    validator_json, upgrade_authority, authorized_withdrawer, log_level
+):
+    assert log_level >= 0 and log_level <= 5, "Log level must be between 0 and 5"
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        upgrade_authority = parse_keypair_input(upgrade_authority)
+        authorized_withdrawer = parse_keypair_input(authorized_withdrawer)
+    except Exception as e:
+        print("Invalid keypair provided.")
+        return
+    try:
+        json_file = open(validator_json)
+        validator_json = json.load(json_file)
+        json_file.close()
+    except Exception as e:
+        print("Invalid JSON provided.")
+        return
+
+    try:
+        vote_account = parse_pubkey_input(validator_json["vote_account"])
+    except Exception as e:
+        print("Invalid vote account provided.")
+        return
+
+    try:
+        authorized_withdrawer_cost = int(validator_json["authorized_withdrawer_cost"])
+        mediatable_date = int(
+            time.time() + 86400 * int(validator_json["mediation_wait_days"])
+        )
+        description = validator_json["description"]
+        validator_name = validator_json["validator_name"]
+        validator_logo_url = validator_json["validator_logo_url"]
+        secondary_items = validator_json["secondary_items"]
+    except Exception as e:
+        print(f"Invalid JSON provided: {e}")
+        return
+
+    t_dets = await process_list_validator(
+        authorized_withdrawer,
+        upgrade_authority,
+        vote_account,
+        authorized_withdrawer_cost,
+        mediatable_date,
+        secondary_items,
+        description,
+        validator_name,
+        validator_logo_url,
+        client=client,
+        log_level=log_level,
+    )
+    await client.close()
+    print(t_dets)
+
+
+@click.command(
+    name="delist",
+    help="Delist the validator instance. Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "-k",
+    "--keypair",
+    default=get_market_keypair_path,
+    help="Enter the path to the authorized_withdrawer keypair of the sales instance. Defaults to the set config keypair",
+)
+@click.option(
+    "-l",
+    "--log_level",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def delist(keypair, log_level):
+    assert log_level >= 0 and log_level <= 5, "Log level must be between 0 and 5"
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        authorized_withdrawer = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid keypair provided.")
+        return
+    t_dets = await process_delist_validator(
+        authorized_withdrawer, client=client, log_level=log_level
+    )
+    await client.close()
+    print(t_dets)
+
+
+@click.command(
+    name="buy",
+    help="Buy the validator instance. Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "-k",
+    "--keypair",
+    default=get_market_keypair_path,
+    help="Enter the path to the payer keypair. Defaults to the set config keypair",
+)
+@click.option(
+    "-l",
+    "--log_level",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def buy(keypair, log_level):
+    assert log_level >= 0 and log_level <= 5, "Log level must be between 0 and 5"
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid keypair provided.")
+        return
+    t_dets = await process_buy_validator(payer, client=client, log_level=log_level)
+    await client.close()
+    print(t_dets)
+
+
+@click.command(
+    name="withraw_rewards",
+    help="withdraw rewards from the running validator. Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "-k",
+    "--keypair",
+    default=get_market_keypair_path,
+    help="Enter the path to the payer keypair. Defaults to the set config keypair",
+)
+async def withdraw_rewards(keypair, log_level):
+    assert log_level >= 0 and log_level <= 5, "Log level must be between 0 and 5"
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        authorized_withdrawer = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid keypair provided.")
+        return
+    t_dets = await process_withdraw_rewards(
+        authorized_withdrawer, client=client, log_level=log_level
+    )
+    await client.close()
+    print(t_dets)
+
+
+@click.command(
+    name="request_mediation",
+    help="request mediation for the running validator. Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "-k",
+    "--keypair",
+    default=get_market_keypair_path,
+    help="Enter the path to the payer keypair. Defaults to the set config keypair",
+)
+@click.option(
+    "-l",
+    "--log_level",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def request_mediation(keypair, log_level):
+    assert log_level >= 0 and log_level <= 5, "Log level must be between 0 and 5"
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid keypair provided.")
+        return
+    t_dets = await process_request_mediation(payer, client=client, log_level=log_level)
+    await client.close()
+    print(t_dets)
+
+
+@click.command(
+    name="mediate",
+    help="Mediate a conflict during a sale. Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "-k",
+    "--keypair",
+    default=get_market_keypair_path,
+    help="Enter the path to the payer keypair. Defaults to the set config keypair",
+)
+@click.option(
+    "-l",
+    "--log_level",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+async def mediate(keypair, log_level):
+    assert log_level >= 0 and log_level <= 5, "Log level must be between 0 and 5"
+    mediation_shares = {}
+    mediation_shares["buyer"] = click.prompt(
+        "Enter the buyer's mediation share", type=int
+    )
+    mediation_shares["seller"] = click.prompt(
+        "Enter the seller's mediation share", type=int
+    )
+    mediation_shares["team"] = click.prompt(
+        "Enter the team's mediation share", type=int
+    )
+
+    assert (
+        sum([v for v in mediation_shares.values()]) == 100
+    ), "Mediation shares must add up to 100"
+
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid keypair provided.")
+        return
+    t_dets = await process_mediate(payer, client=client, log_level=log_level)
+    await client.close()
+    print(t_dets)
+
+
+@click.command(
+    name="validate_secondary_item",
+    help="Validate a secondary item sale completion. Options: --keypair/-k, --log_level/-l",
+)
+@click.option(
+    "-k",
+    "--keypair",
+    default=get_market_keypair_path,
+    help="Enter the path to the payer keypair. Defaults to the set config keypair",
+)
+@click.option(
+    "-l",
+    "--log_level",
+    default=2,
+    type=int,
+    help="Precise Log_level you want the transaction to be logged at, and above(0 -> 5). 0: All logs,  ... 5: Only Errors",
+)
+@click.argument(
+    "secondary_item",
+    type=int,
+    # help="Enter the index of the secondary item to be validated.",
+)
+async def validate_secondary_item(keypair, log_level, secondary_item):
+    assert log_level >= 0 and log_level <= 5, "Log level must be between 0 and 5"
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid keypair provided.")
+        return
+    t_dets = await process_validate_secondary_item_transfers(
+        payer, secondary_item, client=client, log_level=log_level
+    )
+    await client.close()
+    print(t_dets)
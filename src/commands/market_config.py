@@ -0,0 +1,73 @@
+import asyncclick as click
+from ..state import *
+from rich import print
+
+
+@click.group(name="config")
+async def market_config():
+    pass
+
+
+@click.command(
+    name="set",
+    help="Set the default config options. Options: --program_id/-p, --keypair/-k",
+)
+@click.option(
+    "--program_id",
+    "-p",
+    help="Enter the program Id of the validator instance transactions will default to",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    help="Enter the path to the keypair that transactions will be signed with by default.",
+)
+def market_set(program_id, keypair):
+    assert (
+        program_id or keypair
+    ), "No options specified. Use --help for more information."
+    updates = {}
+    if program_id:
+        try:
+            program_pubkey = parse_pubkey_input(program_id)
+        except Exception as e:
+            print("Invalid Public Key provided.")
+            return
+        updates["markets_program_id"] = program_pubkey.pubkey.__str__()
+    if keypair:
+        try:
+            keypair_path, keypair_value = load_keypair_path(keypair)
+        except Exception as e:
+            print("Invalid keypair path")
+            return
+        updates["markets_keypair_path"] = keypair_path
+    if not updates:
+        print("No options specified. Use --help for more information.")
+        return
+    set_configs(updates)
+    if program_id:
+        print("Program ID set to: ", program_pubkey.pubkey)
+    if keypair:
+        print("Keypair path set to: ", keypair_path)
+        print("Keypair Public Key: ", keypair_value.pubkey())
+    print("Config set successfully.")
+
+
+@click.command(name="get")
+def market_get():
+
+    print("\nProgram ID: ", get_market_program_id())
+    print("Network: ", get_network())
+    print("Keypair: ", get_market_keypair_path())
+    try:
+        print(
+            "Keypair Public Key: ",
+            parse_keypair_input(get_market_keypair_path()).pubkey,
+        )
+    except Exception as e:
+        pass
+    print("\nConfig retrieved successfully.")
+
+
+market_config.add_command(market_set)
+market_config.add_command(market_get)
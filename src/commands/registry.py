@@ -0,0 +1,91 @@
+import asyncclick as click
+from ..processor import *
+from ..state import *
+from ..rpc_pool import get_async_client
+from rich import print
+
+
+@click.command(
+    name="init_registry",
+    help="Initialize the Governance Registry Program, Options: --keypair/-k",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+async def process_initialize_registry(keypair):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input, ", e)
+        return
+    t_dets = await init_registry(payer_keypair, client)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="reset_registry",
+    help="Reset the Governance Registry Program, Options: --keypair/-k",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+async def process_reset_registry(keypair):
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input, ", e)
+        return
+    t_dets = await reset_registry(payer_keypair, client)
+    print(t_dets)
+    await client.close()
+
+
+@click.command(
+    name="register_program",
+    help="Register a Program with the Governance Registry, Options: --keypair/-k, --program_id/-p",
+)
+@click.option(
+    "--keypair",
+    "-k",
+    default=get_keypair_path,
+    help="Enter the path to the keypair that will be used to sign this transaction. Defaults to the set config keypair",
+)
+@click.option(
+    "--program_id",
+    "-p",
+    default=get_program_id,
+    help="Enter the program_id of the validator instance you want to register. Defaults to the set config program_id",
+)
+async def process_register_program(keypair, program_id):
+    name = click.prompt(
+        "What is the name of the program you want to register :", type=str
+    )
+    client = get_async_client()
+    client_state = await client.is_connected()
+    print("Client is connected" if client_state else "Client is Disconnected")
+    try:
+        payer_keypair = parse_keypair_input(keypair)
+    except Exception as e:
+        print("Invalid Keypair Input, ", e)
+        return
+    try:
+        program_pubkey = parse_pubkey_input(program_id)
+    except Exception as e:
+        print("Invalid Pubkey Input, ", e)
+        return
+    t_dets = await register_program(payer_keypair, program_pubkey.pubkey, client, name)
+    print(t_dets)
+    await client.close()
@@ -0,0 +1,145 @@
+import asyncio
+import math
+import os
+from typing import Dict, List, Optional
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import Instruction
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+from solana.rpc.async_api import AsyncClient
+from solana.transaction import PACKET_DATA_SIZE, Transaction
+from .instruction import ComputeBudgetInstruction
+from .state import (
+    Constants,
+    compile_versioned_message,
+    config_lock,
+    config_stamp,
+    get_config_path,
+    get_transaction_size,
+    read_config,
+    write_config,
+)
+
+MAX_COMPUTE_UNITS = 1_400_000
+COMPUTE_UNIT_MARGIN = 0.1
+MIN_COMPUTE_UNIT_MARGIN = 1_000
+SET_COMPUTE_UNIT_LIMIT = 2
+
+_compute_budget = ComputeBudgetInstruction()
+_history_cache = {"stamp": None, "units": {}}
+_simulating: Dict[str, asyncio.Future] = {}
+
+
+def get_compute_units_path() -> str:
+    return os.path.join(os.path.dirname(get_config_path()), "compute_units.json")
+
+
+def load_compute_units() -> dict:
+    file_path = get_compute_units_path()
+    stamp = config_stamp(file_path)
+    if stamp is None or stamp != _history_cache["stamp"]:
+        _history_cache["units"] = read_config(file_path)
+        _history_cache["stamp"] = stamp
+    return _history_cache["units"]
+
+
+def record_compute_units(key: str, units: int):
+    file_path = get_compute_units_path()
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with config_lock(file_path):
+        history = read_config(file_path)
+        # Keep the largest limit seen, so one light run can't undercut a heavy one.
+        history[key] = max(units, history.get(key, 0))
+        write_config(file_path, history)
+        _history_cache["stamp"] = config_stamp(file_path)
+        _history_cache["units"] = history
+
+
+def is_compute_budget(instruction: Instruction) -> bool:
+    return instruction.program_id == Constants.COMPUTE_BUDGET_PROGRAM
+
+
+def is_compute_unit_limit(instruction: Instruction) -> bool:
+    return is_compute_budget(instruction) and instruction.data[:1] == bytes(
+        [SET_COMPUTE_UNIT_LIMIT]
+    )
+
+
+def get_variant_key(tx: Transaction) -> str:
+    # Instruction tag, account count and data length identify a variant; the
+    # data length separates e.g. upload_uris batches of different sizes.
+    return "|".join(
+        f"{ix.program_id}:{ix.data[:1].hex()}:{len(ix.accounts)}:{len(ix.data)}"
+        for ix in tx.instructions
+        if not is_compute_budget(ix)
+    )
+
+
+def _with_compute_unit_limit(tx: Transaction, units: int) -> Transaction:
+    sized = Transaction(recent_blockhash=tx.recent_blockhash, fee_payer=tx.fee_payer)
+    sized.instructions = (
+        _compute_budget.set_compute_unit_limit(units, tx.fee_payer),
+        *(ix for ix in tx.instructions if not is_compute_unit_limit(ix)),
+    )
+    return sized
+
+
+async def simulate_compute_units(
+    client: AsyncClient,
+    tx: Transaction,
+    lookup_tables: Optional[List[AddressLookupTableAccount]] = None,
+) -> int:
+    simulated = _with_compute_unit_limit(tx, MAX_COMPUTE_UNITS)
+    if lookup_tables:
+        message = compile_versioned_message(simulated, lookup_tables)
+        signatures = [Signature.default()] * message.header.num_required_signatures
+        simulated = VersionedTransaction.populate(message, signatures)
+    resp = await client.simulate_transaction(simulated)
+    if resp.value.err is not None:
+        raise Exception(f"Simulation failed: {resp.value.err}")
+    if resp.value.units_consumed is None:
+        raise Exception("Simulation did not report units consumed")
+    consumed = resp.value.units_consumed
+    margin = max(MIN_COMPUTE_UNIT_MARGIN, math.ceil(consumed * COMPUTE_UNIT_MARGIN))
+    return min(MAX_COMPUTE_UNITS, consumed + margin)
+
+
+async def estimate_compute_units(
+    client: AsyncClient,
+    tx: Transaction,
+    lookup_tables: Optional[List[AddressLookupTableAccount]] = None,
+) -> int:
+    key = get_variant_key(tx)
+    units = load_compute_units().get(key)
+    if units is not None:
+        return units
+    # Concurrent sends of the same variant share one simulation.
+    if key not in _simulating:
+        _simulating[key] = asyncio.ensure_future(
+            simulate_compute_units(client, tx, lookup_tables)
+        )
+        try:
+            units = await _simulating[key]
+        finally:
+            del _simulating[key]
+        record_compute_units(key, units)
+        return units
+    return await asyncio.shield(_simulating[key])
+
+
+async def set_compute_units(
+    client: AsyncClient,
+    tx: Transaction,
+    lookup_tables: Optional[List[AddressLookupTableAccount]] = None,
+) -> Optional[int]:
+    # Needs the blockhash set; simulation runs against it.
+    try:
+        units = await estimate_compute_units(client, tx, lookup_tables)
+    except Exception:
+        # Keep the transaction's own limit; sending will surface the real error.
+        return None
+    sized = _with_compute_unit_limit(tx, units)
+    if get_transaction_size(sized, lookup_tables) > PACKET_DATA_SIZE:
+        return None
+    tx.instructions = sized.instructions
+    return units
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from typing import Callable, Optional
+from solders.rpc.responses import SignatureNotification
+from solders.signature import Signature
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment, Finalized
+from rich import print
+from .rate_limit import use_rate_limiter
+from .rpc_pool import get_endpoint_url
+from .state import get_commitment, get_verify_finality
+
+CONFIRM_TIMEOUT = 90.0
+POLL_INITIAL_INTERVAL = 0.5
+POLL_MAX_INTERVAL = 4.0
+POLL_BACKOFF = 1.5
+
+COMMITMENT_RANKS = {"processed": 0, "confirmed": 1, "finalized": 2}
+
+
+def get_ws_url(http_url: str) -> str:
+    if http_url.startswith("https://"):
+        return "wss://" + http_url[len("https://") :]
+    if http_url.startswith("http://"):
+        # solana-test-validator serves pubsub on the port after RPC
+        return "ws://" + http_url[len("http://") :].replace(":8899", ":8900")
+    return http_url
+
+
+def status_reached(status, rank: int) -> bool:
+    if status is None:
+        return False
+    if status.err is not None:
+        return True
+    return (
+        status.confirmation_status is not None
+        and int(status.confirmation_status) >= rank
+    )
+
+
+async def _poll(client: AsyncClient, signature: Signature, rank: int, deadline: float):
+    interval = POLL_INITIAL_INTERVAL
+    while True:
+        status = (await client.get_signature_statuses([signature])).value[0]
+        if status_reached(status, rank):
+            return status.err
+        if time.monotonic() + interval > deadline:
+            raise Exception(f"Unable to confirm transaction {signature}")
+        await asyncio.sleep(interval)
+        interval = min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+
+
+async def _subscribe(
+    client: AsyncClient,
+    signature: Signature,
+    commitment: Commitment,
+    rank: int,
+    ws_url: str,
+):
+    from solana.rpc.websocket_api import connect
+
+    async with connect(ws_url) as websocket:
+        await websocket.signature_subscribe(signature, commitment)
+        await websocket.recv()
+        # The signature may have reached the commitment before the
+        # subscription existed, in which case no notification will follow.
+        status = (await client.get_signature_statuses([signature])).value[0]
+        if status_reached(status, rank):
+            return status.err
+        while True:
+            for message in await websocket.recv():
+                if isinstance(message, SignatureNotification):
+                    return message.result.value.err
+
+
+_pending_finality = set()
+
+
+def _log_finality(signature: Signature, error: Optional[Exception]):
+    if error is None:
+        print(f"Finalized: {signature}")
+    else:
+        print(f"[warning]Finality check failed for {signature}: {error}[/warning]")
+
+
+async def _verify_finality(
+    endpoint: str,
+    signature: Signature,
+    ws_url: str,
+    timeout: float,
+    on_finalized: Callable[[Signature, Optional[Exception]], None],
+):
+    # The caller's client may be closed once the command returns.
+    client = AsyncClient(endpoint)
+    use_rate_limiter(client)
+    error = None
+    try:
+        await confirm_signature(
+            client, signature, Finalized, ws_url, timeout, verify_finality=False
+        )
+    except Exception as e:
+        error = e
+    finally:
+        await client.close()
+    on_finalized(signature, error)
+
+
+async def wait_for_finality():
+    while _pending_finality:
+        await asyncio.gather(*_pending_finality, return_exceptions=True)
+
+
+async def confirm_signature(
+    client: AsyncClient,
+    signature: Signature,
+    commitment: Optional[Commitment] = None,
+    ws_url: Optional[str] = None,
+    timeout: float = CONFIRM_TIMEOUT,
+    verify_finality: Optional[bool] = None,
+    on_finalized: Optional[Callable[[Signature, Optional[Exception]], None]] = None,
+) -> None:
+    commitment = commitment or get_commitment()
+    if verify_finality is None:
+        verify_finality = get_verify_finality()
+    rank = COMMITMENT_RANKS[commitment]
+    deadline = time.monotonic() + timeout
+    endpoint = get_endpoint_url(client)
+    if ws_url is None:
+        ws_url = get_ws_url(endpoint)
+    try:
+        err = await asyncio.wait_for(
+            _subscribe(client, signature, commitment, rank, ws_url), timeout
+        )
+    except Exception:
+        # Websocket unavailable or dropped: poll for whatever time is left.
+        if time.monotonic() >= deadline:
+            raise Exception(f"Unable to confirm transaction {signature}")
+        err = await _poll(client, signature, rank, deadline)
+    if err is not None:
+        raise Exception(f"Transaction {signature} failed: {err}")
+    if verify_finality and commitment != Finalized:
+        task = asyncio.ensure_future(
+            _verify_finality(
+                endpoint, signature, ws_url, timeout, on_finalized or _log_finality
+            )
+        )
+        _pending_finality.add(task)
+        task.add_done_callback(_pending_finality.discard)
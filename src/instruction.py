@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 from borsh_construct import *
+from solders import system_program
 from solders.pubkey import Pubkey
 from solders.instruction import Instruction, AccountMeta
 from .state import get_market_program_id
@@ -265,3 +266,79 @@ class ComputeBudgetInstruction:
             program_id=self.program_id,
             data=instruction_bytes,
         )
+
+
+class AddressLookupTableInstruction:
+    # The lookup table program takes bincode: a u32 tag and u64 vector lengths.
+    CREATE_LOOKUP_TABLE = 0
+    EXTEND_LOOKUP_TABLE = 2
+    DEACTIVATE_LOOKUP_TABLE = 3
+    CLOSE_LOOKUP_TABLE = 4
+
+    def __init__(self):
+        self.program_id = Pubkey.from_string(
+            "AddressLookupTab1e1111111111111111111111111"
+        )
+
+    def create_lookup_table(
+        self, authority, payer, recent_slot
+    ) -> Tuple[Instruction, Pubkey]:
+        table, bump = Pubkey.find_program_address(
+            [bytes(authority), recent_slot.to_bytes(8, "little")], self.program_id
+        )
+        instruction_bytes = (
+            self.CREATE_LOOKUP_TABLE.to_bytes(4, "little")
+            + recent_slot.to_bytes(8, "little")
+            + bump.to_bytes(1, "little")
+        )
+        instruction = Instruction(
+            accounts=[
+                AccountMeta(table, False, True),
+                AccountMeta(authority, True, False),
+                AccountMeta(payer, True, True),
+                AccountMeta(system_program.ID, False, False),
+            ],
+            program_id=self.program_id,
+            data=instruction_bytes,
+        )
+        return instruction, table
+
+    def deactivate_lookup_table(self, table, authority) -> Instruction:
+        return Instruction(
+            accounts=[
+                AccountMeta(table, False, True),
+                AccountMeta(authority, True, False),
+            ],
+            program_id=self.program_id,
+            data=self.DEACTIVATE_LOOKUP_TABLE.to_bytes(4, "little"),
+        )
+
+    def close_lookup_table(self, table, authority, recipient) -> Instruction:
+        return Instruction(
+            accounts=[
+                AccountMeta(table, False, True),
+                AccountMeta(authority, True, False),
+                AccountMeta(recipient, False, True),
+            ],
+            program_id=self.program_id,
+            data=self.CLOSE_LOOKUP_TABLE.to_bytes(4, "little"),
+        )
+
+    def extend_lookup_table(
+        self, table, authority, payer, addresses: List[Pubkey]
+    ) -> Instruction:
+        instruction_bytes = (
+            self.EXTEND_LOOKUP_TABLE.to_bytes(4, "little")
+            + len(addresses).to_bytes(8, "little")
+            + b"".join(bytes(address) for address in addresses)
+        )
+        return Instruction(
+            accounts=[
+                AccountMeta(table, False, True),
+                AccountMeta(authority, True, False),
+                AccountMeta(payer, True, True),
+                AccountMeta(system_program.ID, False, False),
+            ],
+            program_id=self.program_id,
+            data=instruction_bytes,
+        )
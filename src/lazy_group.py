@@ -0,0 +1,48 @@
+import importlib
+import asyncclick as click
+
+
+class LazyGroup(click.Group):
+    def __init__(self, *args, lazy_commands: dict = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # command name -> ("module:attribute", short help), imported on first dispatch
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        # Commands not loaded yet are listed from their stored short help, so --help imports nothing.
+        commands = []
+        for cmd_name in self.list_commands(ctx):
+            command = self.commands.get(cmd_name)
+            if command is None:
+                commands.append((cmd_name, self.lazy_commands[cmd_name][1]))
+            elif not command.hidden:
+                commands.append((cmd_name, command))
+        if not commands:
+            return
+        limit = formatter.width - 6 - max(len(cmd_name) for cmd_name, _ in commands)
+        rows = []
+        for cmd_name, command in commands:
+            if isinstance(command, str):
+                rows.append((cmd_name, click.utils.make_default_short_help(command, limit)))
+            else:
+                rows.append((cmd_name, command.get_short_help_str(limit)))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+    def _load_command(self, cmd_name):
+        module_name, attribute = self.lazy_commands[cmd_name][0].split(":")
+        module = importlib.import_module(module_name, package=__package__)
+        command = getattr(module, attribute)
+        if not isinstance(command, click.Command):
+            raise Exception(
+                f"Lazy command {cmd_name} resolved to {type(command)}, expected a click command"
+            )
+        return command
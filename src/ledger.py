@@ -1,6 +1,6 @@
 from ledgerblue.comm import getDongle
 import struct
-from solana.rpc.commitment import Finalized
+from solana.rpc.commitment import Commitment, Finalized
 from solders.pubkey import Pubkey
 from solana.transaction import *
 from solders.sysvar import *
@@ -33,9 +33,14 @@ def _extend_and_serialize_derivations_path(derivations_path: bytes):
     return (1).to_bytes(1, byteorder="little") + derivations_path
 
 
-async def make_message(tx: Transaction, asyncclient: AsyncClient, find_blockhash=True):
+async def make_message(
+    tx: Transaction,
+    asyncclient: AsyncClient,
+    find_blockhash=True,
+    commitment: Commitment = Finalized,
+):
     if find_blockhash:
-        blockhash_resp = await asyncclient.get_latest_blockhash(Finalized)
+        blockhash_resp = await asyncclient.get_latest_blockhash(commitment)
         recent_blockhash = asyncclient._process_blockhash_resp(
             blockhash_resp, used_immediately=True
         )
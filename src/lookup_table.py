@@ -0,0 +1,234 @@
+import asyncio
+from typing import List, Optional, Sequence
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment, Finalized
+from solana.transaction import Transaction
+from .accounts import fetch_accounts
+from .blockhash import SLOT_SECONDS
+from .confirm import confirm_signature
+from .instruction import AddressLookupTableInstruction
+from .state import (
+    KeypairInput,
+    get_dry_run,
+    get_lookup_table_address,
+    get_retired_lookup_tables,
+    set_lookup_table_address,
+    set_retired_lookup_tables,
+    sign_and_send_tx,
+)
+
+LOOKUP_TABLE_META_SIZE = 56
+MAX_LOOKUP_TABLE_ADDRESSES = 256
+# Keeps an extend transaction with its create instruction under 1232 bytes.
+MAX_EXTEND_ADDRESSES = 20
+# A deactivated table can only be closed once it leaves the slot hashes sysvar.
+DEACTIVATION_COOLDOWN_SLOTS = 513
+INSTANCE_TABLE = "instance"
+MINTS_TABLE = "mints"
+
+_lookup_table_instruction = AddressLookupTableInstruction()
+
+
+def parse_lookup_table(key: Pubkey, data: bytes) -> AddressLookupTableAccount:
+    addresses = [
+        Pubkey(data[i : i + 32]) for i in range(LOOKUP_TABLE_META_SIZE, len(data), 32)
+    ]
+    return AddressLookupTableAccount(key, addresses)
+
+
+async def fetch_lookup_table(
+    client: AsyncClient, key: Pubkey, commitment: Optional[Commitment] = None
+) -> Optional[AddressLookupTableAccount]:
+    account = (await fetch_accounts(client, [key], commitment))[key]
+    if account is None or account.owner != _lookup_table_instruction.program_id:
+        return None
+    return parse_lookup_table(key, account.data)
+
+
+def get_lookup_addresses(instructions: Sequence[Instruction]) -> List[Pubkey]:
+    # Signers and invoked programs have to stay in the static account keys.
+    programs = {ix.program_id for ix in instructions}
+    signers = {
+        meta.pubkey for ix in instructions for meta in ix.accounts if meta.is_signer
+    }
+    return list(
+        dict.fromkeys(
+            meta.pubkey
+            for ix in instructions
+            for meta in ix.accounts
+            if meta.pubkey not in programs and meta.pubkey not in signers
+        )
+    )
+
+
+async def _wait_for_next_slot(client: AsyncClient, commitment: Optional[Commitment]):
+    # Addresses appended in a slot can only be looked up from the next one.
+    extended_slot = (await client.get_slot(commitment)).value
+    while (await client.get_slot(commitment)).value <= extended_slot:
+        await asyncio.sleep(SLOT_SECONDS)
+
+
+async def _send_and_confirm(
+    client: AsyncClient,
+    authority: KeypairInput,
+    transaction: Transaction,
+    commitment: Optional[Commitment],
+):
+    t_dets = await sign_and_send_tx(
+        transaction, client, authority, commitment=commitment
+    )
+    await confirm_signature(client, t_dets.value, commitment)
+
+
+async def _deactivate(
+    client: AsyncClient,
+    authority: KeypairInput,
+    table_key: Pubkey,
+    commitment: Optional[Commitment],
+) -> int:
+    deactivate = _lookup_table_instruction.deactivate_lookup_table(
+        table_key, authority.pubkey
+    )
+    await _send_and_confirm(
+        client, authority, Transaction().add(deactivate), commitment
+    )
+    return (await client.get_slot(commitment)).value
+
+
+async def retire_lookup_table(
+    client: AsyncClient,
+    authority: KeypairInput,
+    table_key: Pubkey,
+    commitment: Optional[Commitment] = None,
+):
+    try:
+        slot = await _deactivate(client, authority, table_key, commitment)
+    except Exception:
+        # close_retired_lookup_tables tries the deactivation again.
+        slot = None
+    retired = get_retired_lookup_tables(authority.pubkey)
+    set_retired_lookup_tables(authority.pubkey, retired + [(table_key, slot)])
+
+
+async def close_retired_lookup_tables(
+    client: AsyncClient,
+    authority: KeypairInput,
+    commitment: Optional[Commitment] = None,
+):
+    # Closing a deactivated table refunds its rent to the authority.
+    retired = get_retired_lookup_tables(authority.pubkey)
+    if not retired or get_dry_run():
+        return
+    current_slot = (await client.get_slot(commitment)).value
+    remaining = []
+    for table_key, slot in retired:
+        try:
+            if slot is None:
+                slot = await _deactivate(client, authority, table_key, commitment)
+            elif current_slot > slot + DEACTIVATION_COOLDOWN_SLOTS:
+                if await fetch_lookup_table(client, table_key, commitment) is None:
+                    continue
+                close = _lookup_table_instruction.close_lookup_table(
+                    table_key, authority.pubkey, authority.pubkey
+                )
+                await _send_and_confirm(
+                    client, authority, Transaction().add(close), commitment
+                )
+                continue
+        except Exception:
+            pass
+        remaining.append((table_key, slot))
+    set_retired_lookup_tables(authority.pubkey, remaining)
+
+
+async def ensure_lookup_table(
+    client: AsyncClient,
+    authority: KeypairInput,
+    addresses: Sequence[Pubkey],
+    commitment: Optional[Commitment] = None,
+    kind: str = INSTANCE_TABLE,
+) -> Optional[AddressLookupTableAccount]:
+    await close_retired_lookup_tables(client, authority, commitment)
+    table_key = get_lookup_table_address(authority.pubkey, kind)
+    table = None
+    if table_key is not None:
+        table = await fetch_lookup_table(client, table_key, commitment)
+    requested = list(dict.fromkeys(addresses))
+    existing = list(table.addresses) if table is not None else []
+    known = set(existing)
+    missing = [address for address in requested if address not in known]
+    if not missing:
+        return table
+    # Replace a full table once a fresh one would cover more of the addresses.
+    replace = (
+        table is not None
+        and len(missing) > MAX_LOOKUP_TABLE_ADDRESSES - len(existing)
+        and len(requested) - len(missing)
+        < min(len(requested), MAX_LOOKUP_TABLE_ADDRESSES)
+    )
+    if replace:
+        existing, missing = [], requested
+    # Whatever still doesn't fit stays in the static keys.
+    missing = missing[: MAX_LOOKUP_TABLE_ADDRESSES - len(existing)]
+    if not missing:
+        return table
+    new_table = table is None or replace
+    if get_dry_run():
+        # Plan against the table as it would look once extended.
+        if new_table:
+            table_key = Pubkey.default()
+        return AddressLookupTableAccount(table_key, existing + missing)
+
+    if replace:
+        await retire_lookup_table(client, authority, table_key, commitment)
+    transactions = []
+    if new_table:
+        recent_slot = (await client.get_slot(Finalized)).value
+        create, table_key = _lookup_table_instruction.create_lookup_table(
+            authority.pubkey, authority.pubkey, recent_slot
+        )
+        transactions.append(Transaction().add(create))
+    for i in range(0, len(missing), MAX_EXTEND_ADDRESSES):
+        extend = _lookup_table_instruction.extend_lookup_table(
+            table_key,
+            authority.pubkey,
+            authority.pubkey,
+            missing[i : i + MAX_EXTEND_ADDRESSES],
+        )
+        if i == 0 and transactions:
+            transactions[0].add(extend)
+        else:
+            transactions.append(Transaction().add(extend))
+
+    for i, transaction in enumerate(transactions):
+        await _send_and_confirm(client, authority, transaction, commitment)
+        if i == 0 and new_table:
+            set_lookup_table_address(authority.pubkey, table_key, kind)
+    await _wait_for_next_slot(client, commitment)
+    return AddressLookupTableAccount(table_key, existing + missing)
+
+
+async def ensure_lookup_tables(
+    client: AsyncClient,
+    authority: KeypairInput,
+    instance_addresses: Sequence[Pubkey],
+    mint_addresses: Sequence[Pubkey],
+    commitment: Optional[Commitment] = None,
+) -> List[AddressLookupTableAccount]:
+    # Instance PDAs rarely change; the holder's mint accounts get their own
+    # table so a new set of mints only ever replaces that one.
+    instance_table = await ensure_lookup_table(
+        client, authority, instance_addresses, commitment
+    )
+    known = set(instance_table.addresses) if instance_table is not None else set()
+    mint_table = await ensure_lookup_table(
+        client,
+        authority,
+        [address for address in mint_addresses if address not in known],
+        commitment,
+        MINTS_TABLE,
+    )
+    return [table for table in (instance_table, mint_table) if table is not None]
@@ -0,0 +1,334 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+from solders.pubkey import Pubkey
+from spl.token.constants import ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID
+from .state import (
+    Constants,
+    config_lock,
+    get_config,
+    get_market_program_id,
+    get_program_id,
+    write_config,
+)
+
+PDA_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PDA_CACHE_SIZE)
+def _find_program_address(
+    seeds: Tuple[bytes, ...], program_id: Pubkey
+) -> Tuple[Pubkey, int]:
+    return Pubkey.find_program_address(list(seeds), program_id)
+
+
+def find_program_address(
+    seeds: Sequence[bytes], program_id: Pubkey
+) -> Tuple[Pubkey, int]:
+    return _find_program_address(tuple(seeds), program_id)
+
+
+def clear_pda_cache():
+    _find_program_address.cache_clear()
+
+
+METAPLEX_PROGRAM_ID = Constants.METAPLEX_PROGRAM_ID
+BPF_LOADER_UPGRADEABLE = Constants.BPF_LOADER_UPGRADEABLE
+
+# name -> seed string, derived against get_program_id()
+INSTANCE_SEEDS = {
+    "config": Constants.INGL_CONFIG_SEED,
+    "general": Constants.GENERAL_ACCOUNT_SEED,
+    "uris": Constants.URIS_ACCOUNT_SEED,
+    "mint_authority": Constants.INGL_MINT_AUTHORITY_KEY,
+    "collection_mint": Constants.INGL_NFT_COLLECTION_KEY,
+    "collection_holder": Constants.COLLECTION_HOLDER_KEY,
+    "pd_pool": Constants.PD_POOL_ACCOUNT_KEY,
+    "vote_account": Constants.VOTE_ACCOUNT_KEY,
+    "stake": Constants.STAKE_ACCOUNT_KEY,
+    "t_stake": Constants.T_STAKE_ACCOUNT_KEY,
+    "t_withdraw": Constants.T_WITHDRAW_KEY,
+    "authorized_withdrawer": Constants.AUTHORIZED_WITHDRAWER_KEY,
+}
+
+# name -> seed bytes, derived against get_market_program_id()
+MARKET_SEEDS = {
+    "market_authorized_withdrawer": Constants.PDA_AUTHORIZED_WITHDRAWER_SEED,
+    "market_storage": Constants.PROGRAM_STORAGE_SEED,
+    "market_upgrade_authority": Constants.PDA_UPGRADE_AUTHORITY_SEED,
+    "market_escrow": Constants.ESCROW_ACCOUNT_SEED,
+}
+
+ADDRESS_NAMES = (
+    tuple(INSTANCE_SEEDS)
+    + ("program_data", "collection_metadata", "collection_master_edition")
+    + tuple(MARKET_SEEDS)
+    + ("market_program_data",)
+)
+
+
+class InstanceAddresses:
+    __slots__ = ("program_id", "market_program_id") + tuple(
+        slot for name in ADDRESS_NAMES for slot in (name, name + "_bump")
+    )
+
+    def __init__(
+        self, program_id: Pubkey, market_program_id: Optional[Pubkey], entries: dict
+    ):
+        self.program_id = program_id
+        self.market_program_id = market_program_id
+        for name in ADDRESS_NAMES:
+            address, bump = entries.get(name, (None, None))
+            setattr(self, name, address)
+            setattr(self, name + "_bump", bump)
+
+    @staticmethod
+    def derive(
+        program_id: Pubkey, market_program_id: Optional[Pubkey] = None
+    ) -> "InstanceAddresses":
+        entries = {}
+        for name, seed in INSTANCE_SEEDS.items():
+            entries[name] = find_program_address([bytes(seed, "UTF-8")], program_id)
+        entries["program_data"] = find_program_address(
+            [bytes(program_id)], BPF_LOADER_UPGRADEABLE
+        )
+        collection_mint = entries["collection_mint"][0]
+        entries["collection_metadata"] = find_program_address(
+            [b"metadata", bytes(METAPLEX_PROGRAM_ID), bytes(collection_mint)],
+            METAPLEX_PROGRAM_ID,
+        )
+        entries["collection_master_edition"] = find_program_address(
+            [
+                b"metadata",
+                bytes(METAPLEX_PROGRAM_ID),
+                bytes(collection_mint),
+                b"edition",
+            ],
+            METAPLEX_PROGRAM_ID,
+        )
+        if market_program_id is not None:
+            for name, seed in MARKET_SEEDS.items():
+                entries[name] = find_program_address([seed], market_program_id)
+            entries["market_program_data"] = find_program_address(
+                [bytes(market_program_id)], BPF_LOADER_UPGRADEABLE
+            )
+        return InstanceAddresses(program_id, market_program_id, entries)
+
+    def to_json(self) -> dict:
+        return {
+            name: [str(getattr(self, name)), getattr(self, name + "_bump")]
+            for name in ADDRESS_NAMES
+            if getattr(self, name) is not None
+        }
+
+    @staticmethod
+    def from_json(
+        program_id: Pubkey, market_program_id: Optional[Pubkey], data: dict
+    ) -> "InstanceAddresses":
+        entries = {
+            name: (Pubkey.from_string(address), bump)
+            for name, (address, bump) in data.items()
+        }
+        expected = set(INSTANCE_SEEDS) | {
+            "program_data",
+            "collection_metadata",
+            "collection_master_edition",
+        }
+        if market_program_id is not None:
+            expected |= set(MARKET_SEEDS) | {"market_program_data"}
+        if not expected.issubset(entries):
+            raise Exception("Incomplete address book entry")
+        return InstanceAddresses(program_id, market_program_id, entries)
+
+
+_address_books = {}
+
+
+def get_address_book_path() -> str:
+    return f"{os.path.expanduser('~')}/.config/solana/ingl/address_book.json"
+
+
+def _address_book_key(
+    program_id: Pubkey, market_program_id: Optional[Pubkey]
+) -> str:
+    return f"{program_id}:{market_program_id if market_program_id else ''}"
+
+
+def _read_address_book(file_path: str) -> dict:
+    try:
+        with open(file_path, "r") as f:
+            return json.load(f)
+    except:
+        return {}
+
+
+def _store_address_book(key: str, addresses: InstanceAddresses):
+    file_path = get_address_book_path()
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with config_lock(file_path):
+            book = _read_address_book(file_path)
+            book[key] = addresses.to_json()
+            write_config(file_path, book)
+    except OSError:
+        # The address book is only a cache, a failed write just means the
+        # next invocation derives the addresses again.
+        pass
+
+
+def get_instance_addresses(require_market: bool = False) -> InstanceAddresses:
+    program_id = get_program_id()
+    if require_market:
+        market_program_id = get_market_program_id()
+    else:
+        try:
+            market_program_id = Pubkey.from_string(get_config("markets_program_id"))
+        except:
+            market_program_id = None
+    key = _address_book_key(program_id, market_program_id)
+    if key in _address_books:
+        return _address_books[key]
+    data = _read_address_book(get_address_book_path()).get(key)
+    addresses = None
+    if data is not None:
+        try:
+            addresses = InstanceAddresses.from_json(program_id, market_program_id, data)
+        except:
+            addresses = None
+    if addresses is None:
+        addresses = InstanceAddresses.derive(program_id, market_program_id)
+        _store_address_book(key, addresses)
+    _address_books[key] = addresses
+    return addresses
+
+
+NFT_ACCOUNT_SEED = bytes(Constants.NFT_ACCOUNT_CONST, "UTF-8")
+MINT_CHUNK_SIZE = 2048
+
+
+class MintAddresses:
+    __slots__ = (
+        "mints",
+        "nft_accounts",
+        "nft_account_bumps",
+        "associated_token_accounts",
+        "metadata",
+        "master_editions",
+    )
+
+    def __init__(self):
+        self.mints = []
+        self.nft_accounts = []
+        self.nft_account_bumps = []
+        self.associated_token_accounts = []
+        self.metadata = []
+        self.master_editions = []
+
+    def __len__(self):
+        return len(self.mints)
+
+    def extend(self, columns: tuple):
+        self.mints.extend(columns[0])
+        self.nft_accounts.extend(columns[1])
+        self.nft_account_bumps.extend(columns[2])
+        self.associated_token_accounts.extend(columns[3])
+        self.metadata.extend(columns[4])
+        self.master_editions.extend(columns[5])
+
+
+def _derive_mint_chunk(args) -> tuple:
+    # Per-mint PDAs are unique, so this deliberately bypasses the LRU cache
+    # instead of evicting the static instance PDAs from it.
+    mints, program_id, owner, include_metadata = args
+    nft_accounts = []
+    nft_account_bumps = []
+    associated_token_accounts = []
+    metadata = []
+    master_editions = []
+    for mint in mints:
+        mint_bytes = bytes(mint)
+        nft_account, nft_account_bump = Pubkey.find_program_address(
+            [NFT_ACCOUNT_SEED, mint_bytes], program_id
+        )
+        nft_accounts.append(nft_account)
+        nft_account_bumps.append(nft_account_bump)
+        if owner is not None:
+            associated_token_accounts.append(
+                Pubkey.find_program_address(
+                    [bytes(owner), bytes(TOKEN_PROGRAM_ID), mint_bytes],
+                    ASSOCIATED_TOKEN_PROGRAM_ID,
+                )[0]
+            )
+        else:
+            associated_token_accounts.append(None)
+        if include_metadata:
+            metadata.append(
+                Pubkey.find_program_address(
+                    [b"metadata", bytes(METAPLEX_PROGRAM_ID), mint_bytes],
+                    METAPLEX_PROGRAM_ID,
+                )[0]
+            )
+            master_editions.append(
+                Pubkey.find_program_address(
+                    [b"metadata", bytes(METAPLEX_PROGRAM_ID), mint_bytes, b"edition"],
+                    METAPLEX_PROGRAM_ID,
+                )[0]
+            )
+        else:
+            metadata.append(None)
+            master_editions.append(None)
+    return (
+        mints,
+        nft_accounts,
+        nft_account_bumps,
+        associated_token_accounts,
+        metadata,
+        master_editions,
+    )
+
+
+def _mint_chunks(mints: Iterable[Pubkey], chunk_size: int) -> Iterator[list]:
+    mints = iter(mints)
+    while True:
+        chunk = list(islice(mints, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def derive_mint_addresses(
+    mints: Iterable[Pubkey],
+    owner: Optional[Pubkey] = None,
+    program_id: Optional[Pubkey] = None,
+    include_metadata: bool = False,
+    processes: Optional[int] = None,
+    chunk_size: int = MINT_CHUNK_SIZE,
+) -> MintAddresses:
+    if program_id is None:
+        program_id = get_program_id()
+    if processes is None:
+        processes = os.cpu_count() or 1
+    result = MintAddresses()
+    chunks = _mint_chunks(mints, chunk_size)
+    first = next(chunks, None)
+    if first is None:
+        return result
+    second = next(chunks, None)
+    if second is None or processes <= 1:
+        # A single chunk is cheaper to derive inline than to ship to a pool.
+        for chunk in chain([first], [second] if second else [], chunks):
+            result.extend(
+                _derive_mint_chunk((chunk, program_id, owner, include_metadata))
+            )
+        return result
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        jobs = (
+            (chunk, program_id, owner, include_metadata)
+            for chunk in chain([first, second], chunks)
+        )
+        for columns in executor.map(_derive_mint_chunk, jobs):
+            result.extend(columns)
+    return result
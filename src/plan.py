@@ -0,0 +1,92 @@
+from typing import List, Optional, Tuple
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.pubkey import Pubkey
+from solana.transaction import PACKET_DATA_SIZE, Transaction
+from .compute_units import (
+    MAX_COMPUTE_UNITS,
+    get_variant_key,
+    is_compute_budget,
+    is_compute_unit_limit,
+    load_compute_units,
+)
+from .state import compile_versioned_message, get_transaction_size
+
+DEFAULT_INSTRUCTION_COMPUTE_UNITS = 200_000
+
+
+class TransactionPlan:
+    __slots__ = ("accounts", "size", "compute_units", "compute_source", "looked_up")
+
+    def __init__(
+        self,
+        accounts: List[Tuple[Pubkey, bool, bool]],
+        size: int,
+        compute_units: int,
+        compute_source: str,
+        looked_up: int = 0,
+    ):
+        self.accounts = accounts
+        self.size = size
+        self.compute_units = compute_units
+        self.compute_source = compute_source
+        self.looked_up = looked_up
+
+    @property
+    def fits(self) -> bool:
+        return self.size <= PACKET_DATA_SIZE
+
+    @property
+    def writable(self) -> List[Pubkey]:
+        return [pubkey for pubkey, _signer, writable in self.accounts if writable]
+
+    def render(self) -> str:
+        size = f"{self.size}/{PACKET_DATA_SIZE} bytes"
+        if self.looked_up:
+            size += f", v0 with {self.looked_up} accounts from lookup tables"
+        lines = [
+            "Dry run, transaction not sent.",
+            f"Size: {size}" if self.fits else f"Size: [warning]{size}, too large[/warning]",
+            f"Compute: {self.compute_units} CU ({self.compute_source})",
+            f"Accounts ({len(self.accounts)}), {len(self.writable)} writable:",
+        ]
+        for pubkey, signer, writable in self.accounts:
+            flags = ("s" if signer else "-") + ("w" if writable else "-")
+            lines.append(f"  {flags} {pubkey}")
+        return "\n".join(lines)
+
+
+def estimate_plan_compute_units(tx: Transaction) -> Tuple[int, str]:
+    units = load_compute_units().get(get_variant_key(tx))
+    if units is not None:
+        return units, "learned"
+    for ix in tx.instructions:
+        if is_compute_unit_limit(ix):
+            return int.from_bytes(ix.data[1:5], "little"), "limit"
+    # The runtime default when no limit is set.
+    instructions = sum(1 for ix in tx.instructions if not is_compute_budget(ix))
+    return (
+        min(MAX_COMPUTE_UNITS, DEFAULT_INSTRUCTION_COMPUTE_UNITS * instructions),
+        "default",
+    )
+
+
+def plan_transaction(
+    tx: Transaction, lookup_tables: Optional[List[AddressLookupTableAccount]] = None
+) -> TransactionPlan:
+    message = tx.compile_message()
+    accounts = [
+        (pubkey, message.is_signer(i), message.is_writable(i))
+        for i, pubkey in enumerate(message.account_keys)
+    ]
+    looked_up = 0
+    if lookup_tables:
+        versioned = compile_versioned_message(tx, lookup_tables)
+        looked_up = len(message.account_keys) - len(versioned.account_keys)
+    compute_units, compute_source = estimate_plan_compute_units(tx)
+    return TransactionPlan(
+        accounts,
+        get_transaction_size(tx, lookup_tables),
+        compute_units,
+        compute_source,
+        looked_up,
+    )
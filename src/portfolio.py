@@ -0,0 +1,94 @@
+import base64
+from typing import Dict, List, Optional
+from rich.table import Table
+from solders.pubkey import Pubkey
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from spl.token.constants import TOKEN_PROGRAM_ID
+from .accounts import fetch_accounts
+from .pda import derive_mint_addresses
+from .rpc_pool import raw_request
+from .state import NftData, get_commitment, get_program_id
+
+# SPL token account layout: mint, owner, then the u64 amount.
+TOKEN_ACCOUNT_AMOUNT_END = 72
+
+
+class PortfolioEntry:
+    __slots__ = (
+        "mint",
+        "nft_account",
+        "rarity",
+        "funds_location",
+        "numeration",
+        "last_delegation_epoch",
+        "votes",
+    )
+
+    def __init__(self, mint: Pubkey, nft_account: Pubkey, nft_data):
+        self.mint = mint
+        self.nft_account = nft_account
+        self.rarity: Optional[int] = nft_data.rarity
+        self.funds_location: int = nft_data.funds_location
+        self.numeration: int = nft_data.numeration
+        self.last_delegation_epoch: Optional[int] = nft_data.last_delegation_epoch
+        self.votes: Dict[int, bool] = dict(nft_data.all_votes)
+
+    def has_voted(self, proposal_numeration: int) -> bool:
+        return proposal_numeration in self.votes
+
+
+async def get_held_mints(
+    client: AsyncClient, owner: Pubkey, commitment: Optional[Commitment] = None
+) -> List[Pubkey]:
+    # Only mint and amount are needed, so skip the rest of each token account.
+    config = {
+        "encoding": "base64",
+        "dataSlice": {"offset": 0, "length": TOKEN_ACCOUNT_AMOUNT_END},
+        "commitment": commitment or get_commitment(),
+    }
+    result = await raw_request(
+        client,
+        "getTokenAccountsByOwner",
+        [str(owner), {"programId": str(TOKEN_PROGRAM_ID)}, config],
+    )
+    mints = []
+    for token_account in result["value"]:
+        data = base64.b64decode(token_account["account"]["data"][0])
+        if int.from_bytes(data[64:TOKEN_ACCOUNT_AMOUNT_END], "little") == 1:
+            mints.append(Pubkey(data[:32]))
+    return list(dict.fromkeys(mints))
+
+
+async def fetch_portfolio(
+    client: AsyncClient, owner: Pubkey, commitment: Optional[Commitment] = None
+) -> List[PortfolioEntry]:
+    mints = await get_held_mints(client, owner, commitment)
+    nft_accounts = derive_mint_addresses(mints).nft_accounts
+    accounts = await fetch_accounts(client, nft_accounts, commitment)
+    program_id = get_program_id()
+    portfolio = []
+    for mint, nft_account in zip(mints, nft_accounts):
+        account = accounts[nft_account]
+        # Mints from outside the instance's collection have no NFT account.
+        if account is None or account.owner != program_id:
+            continue
+        portfolio.append(PortfolioEntry(mint, nft_account, NftData.parse(account.data)))
+    return sorted(portfolio, key=lambda entry: entry.numeration)
+
+
+def render_portfolio(portfolio: List[PortfolioEntry]) -> Table:
+    table = Table("#", "Mint", "Rarity", "Funds", "Delegated", "Votes")
+    table.columns[1].no_wrap = True
+    for entry in portfolio:
+        table.add_row(
+            str(entry.numeration),
+            str(entry.mint),
+            "-" if entry.rarity is None else str(entry.rarity),
+            str(entry.funds_location),
+            "-"
+            if entry.last_delegation_epoch is None
+            else str(entry.last_delegation_epoch),
+            str(len(entry.votes)),
+        )
+    return table
@@ -0,0 +1,104 @@
+import time
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+from solana.rpc.async_api import AsyncClient
+from solana.transaction import PACKET_DATA_SIZE, Transaction
+from .blockhash import SLOT_SECONDS
+from .instruction import ComputeBudgetInstruction
+from .rpc_pool import raw_request
+from .state import (
+    Constants,
+    get_priority_fee_cap,
+    get_priority_fee_percentile,
+    get_transaction_size,
+)
+
+PRIORITY_FEE_CACHE_SLOTS = 10
+MAX_PRIORITY_FEE_ACCOUNTS = 128
+SET_COMPUTE_UNIT_PRICE = 3
+
+_estimates = weakref.WeakKeyDictionary()
+# Building the instruction enum costs ~3 ms; do it once.
+_compute_budget = ComputeBudgetInstruction()
+
+
+async def get_recent_prioritization_fees(
+    client: AsyncClient, accounts: Sequence[Pubkey]
+) -> List[int]:
+    addresses = [str(account) for account in accounts[:MAX_PRIORITY_FEE_ACCOUNTS]]
+    result = await raw_request(client, "getRecentPrioritizationFees", [addresses])
+    return [entry["prioritizationFee"] for entry in result]
+
+
+def _percentile(fees: List[int], percentile: float) -> int:
+    if not fees:
+        return 0
+    fees = sorted(fees)
+    return fees[min(len(fees) - 1, int(len(fees) * percentile / 100))]
+
+
+async def estimate_priority_fee(
+    client: AsyncClient,
+    accounts: Sequence[Pubkey],
+    percentile: Optional[float] = None,
+    cap: Optional[int] = None,
+) -> int:
+    percentile = get_priority_fee_percentile() if percentile is None else percentile
+    cap = get_priority_fee_cap() if cap is None else cap
+    cache: Dict[Tuple, Tuple[float, List[int]]] = _estimates.setdefault(client, {})
+    key = tuple(sorted(set(accounts), key=bytes))
+    cached = cache.get(key)
+    if cached is None or time.monotonic() - cached[0] > (
+        PRIORITY_FEE_CACHE_SLOTS * SLOT_SECONDS
+    ):
+        cached = (time.monotonic(), await get_recent_prioritization_fees(client, key))
+        cache[key] = cached
+    return min(cap, _percentile(cached[1], percentile))
+
+
+def _is_set_compute_unit_price(instruction: Instruction) -> bool:
+    return (
+        instruction.program_id == Constants.COMPUTE_BUDGET_PROGRAM
+        and instruction.data[:1] == bytes([SET_COMPUTE_UNIT_PRICE])
+    )
+
+
+def get_writable_accounts(tx: Transaction) -> List[Pubkey]:
+    accounts = [tx.fee_payer] if tx.fee_payer is not None else []
+    for instruction in tx.instructions:
+        accounts.extend(meta.pubkey for meta in instruction.accounts if meta.is_writable)
+    return list(dict.fromkeys(accounts))
+
+
+async def estimate_transaction_priority_fee(
+    client: AsyncClient,
+    tx: Transaction,
+    percentile: Optional[float] = None,
+    cap: Optional[int] = None,
+) -> Optional[int]:
+    if any(_is_set_compute_unit_price(ix) for ix in tx.instructions):
+        return None
+    return await estimate_priority_fee(
+        client, get_writable_accounts(tx), percentile, cap
+    )
+
+
+def add_priority_fee(
+    tx: Transaction,
+    micro_lamports: Optional[int],
+    lookup_tables: Optional[List[AddressLookupTableAccount]] = None,
+) -> bool:
+    # Needs the fee payer and blockhash set so the message can be sized.
+    if not micro_lamports:
+        return False
+    instructions = tx.instructions
+    price = _compute_budget.set_compute_unit_price(micro_lamports, tx.fee_payer)
+    tx.instructions = (price, *instructions)
+    if get_transaction_size(tx, lookup_tables) > PACKET_DATA_SIZE:
+        # No room left in this transaction; send it at the base fee.
+        tx.instructions = instructions
+        return False
+    return True
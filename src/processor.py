@@ -1,14 +1,21 @@
+from typing import Callable
 import solders
 from solders.pubkey import Pubkey
 from solders import system_program
+from solders.sysvar import *
 from solana.transaction import *
 from spl.token import constants as spl_constants
 from spl.token import instructions as assoc_instructions
 from .instruction import *
 from .state import *
 from .state import Constants as ingl_constants
+from .accounts import fetch_account_data
+from .chunking import MAX_MINTS_PER_INSTRUCTION, pack_mints
+from .lookup_table import ensure_lookup_tables, get_lookup_addresses
+from .sender import MAX_IN_FLIGHT, PipelinedSender
+from .pda import derive_mint_addresses, find_program_address, get_instance_addresses
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.api import Client
+from solana.rpc.commitment import Commitment
 from rich import print
 
 
@@ -36,52 +43,31 @@ async def ingl_init(
     default_uri: str,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    mint_pubkey, _mint_pubkey_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_NFT_COLLECTION_KEY, "UTF-8")], get_program_id()
-    )
-    mint_authority_pubkey, _mint_authority_pubkey_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_MINT_AUTHORITY_KEY, "UTF-8")], get_program_id()
-    )
-    (
-        collection_holder_pubkey,
-        _collection_holder_pubkey_bump,
-    ) = Pubkey.find_program_address(
-        [bytes(ingl_constants.COLLECTION_HOLDER_KEY, "UTF-8")], get_program_id()
-    )
+    addresses = get_instance_addresses()
+    mint_pubkey = addresses.collection_mint
+    mint_authority_pubkey = addresses.mint_authority
+    collection_holder_pubkey = addresses.collection_holder
     mint_associated_account_pubkey = assoc_instructions.get_associated_token_address(
         collection_holder_pubkey, mint_pubkey
     )
     metaplex_program_id = Pubkey.from_string(
         "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
     )
-    metadata_pda, _metadata_pda_bump = Pubkey.find_program_address(
-        [b"metadata", bytes(metaplex_program_id), bytes(mint_pubkey)],
-        metaplex_program_id,
-    )
-    master_edition_pda, _master_edition_bump = Pubkey.find_program_address(
-        [b"metadata", bytes(metaplex_program_id), bytes(mint_pubkey), b"edition"],
-        metaplex_program_id,
-    )
-    ingl_config_pubkey, _ingl_config_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    uris_account_pubkey, _uris_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.URIS_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    this_program_data_pubkey, _this_program_data_bump = Pubkey.find_program_address(
-        [bytes(get_program_id())], ingl_constants.BPF_LOADER_UPGRADEABLE
-    )
+    metadata_pda = addresses.collection_metadata
+    master_edition_pda = addresses.collection_master_edition
+    ingl_config_pubkey = addresses.config
+    general_account_pubkey = addresses.general
+    uris_account_pubkey = addresses.uris
+    this_program_data_pubkey = addresses.program_data
 
-    # registry_program_config_key, _registry_program_config_bump = Pubkey.find_program_address([b'config'], ingl_constants.REGISTRY_PROGRAM_ID)
-    storage_key, _storage_bump = Pubkey.find_program_address(
+    # registry_program_config_key, _registry_program_config_bump = find_program_address([b'config'], ingl_constants.REGISTRY_PROGRAM_ID)
+    storage_key, _storage_bump = find_program_address(
         [b"storage"], ingl_constants.REGISTRY_PROGRAM
     )
     name_storage_meta = AccountMeta(
-        Pubkey.find_program_address(
+        find_program_address(
             [
                 b"name_storage",
             ],
@@ -179,19 +165,13 @@ async def ingl_init(
         Instruction(accounts=accounts, program_id=get_program_id(), data=data)
     )
 
-    try:
-        t_dets = await sign_and_send_tx(
-            transaction, client, payer_keypair, skip_preflight=False
-        )
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
+    return await sign_send_confirm_return_tx_as_link(
+        transaction,
+        client,
+        payer_keypair,
+        skip_preflight=False,
+        commitment=commitment,
+    )
 
 
 async def mint_nft(
@@ -199,36 +179,24 @@ async def mint_nft(
     mint_keypair: KeypairInput,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    mint_authority_pubkey, _mint_authority_pubkey_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_MINT_AUTHORITY_KEY, "UTF-8")], get_program_id()
-    )
-    collection_mint_pubkey, _collection_mint_pubkey_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_NFT_COLLECTION_KEY, "UTF-8")], get_program_id()
-    )
-    pd_pool_pubkey, _pd_pool_pubkey_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.PD_POOL_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
+    addresses = get_instance_addresses()
+    mint_authority_pubkey = addresses.mint_authority
+    collection_mint_pubkey = addresses.collection_mint
+    pd_pool_pubkey = addresses.pd_pool
     mint_associated_account_pubkey = assoc_instructions.get_associated_token_address(
         payer_keypair.pubkey, mint_keypair.pubkey
     )
     metaplex_program_id = Pubkey.from_string(
         "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
     )
-    metadata_pda, _metadata_pda_bump = Pubkey.find_program_address(
+    metadata_pda, _metadata_pda_bump = find_program_address(
         [b"metadata", bytes(metaplex_program_id), bytes(mint_keypair.pubkey)],
         metaplex_program_id,
     )
-    collection_master_edition_pda, _master_edition_bump = Pubkey.find_program_address(
-        [
-            b"metadata",
-            bytes(metaplex_program_id),
-            bytes(collection_mint_pubkey),
-            b"edition",
-        ],
-        metaplex_program_id,
-    )
-    mint_edition_pda, _mint_edition_bump = Pubkey.find_program_address(
+    collection_master_edition_pda = addresses.collection_master_edition
+    mint_edition_pda, _mint_edition_bump = find_program_address(
         [
             b"metadata",
             bytes(metaplex_program_id),
@@ -237,23 +205,14 @@ async def mint_nft(
         ],
         metaplex_program_id,
     )
-    collection_account_pda, _collection_account_bump = Pubkey.find_program_address(
-        [b"metadata", bytes(metaplex_program_id), bytes(collection_mint_pubkey)],
-        metaplex_program_id,
-    )
-    nft_account_pubkey, _nft_account_bump = Pubkey.find_program_address(
+    collection_account_pda = addresses.collection_metadata
+    nft_account_pubkey, _nft_account_bump = find_program_address(
         [bytes(ingl_constants.NFT_ACCOUNT_CONST, "UTF-8"), bytes(mint_keypair.pubkey)],
         get_program_id(),
     )
-    ingl_config_pubkey, _ingl_config_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    uri_account_pubkey, _uri_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.URIS_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
+    ingl_config_pubkey = addresses.config
+    uri_account_pubkey = addresses.uris
+    general_account_pubkey = addresses.general
 
     payer_account_meta = AccountMeta(payer_keypair.pubkey, True, True)
     mint_account_meta = AccountMeta(mint_keypair.pubkey, True, True)
@@ -323,19 +282,9 @@ async def mint_nft(
             accounts=accounts, program_id=get_program_id(), data=instruction_data
         )
     )
-    try:
-        t_dets = await sign_and_send_tx(
-            transaction, client, payer_keypair, mint_keypair
-        )
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer_keypair, mint_keypair, commitment=commitment
+    )
 
 
 async def delegate_nft(
@@ -343,20 +292,18 @@ async def delegate_nft(
     mint_pubkey: PubkeyInput,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    nft_account_pubkey, _nft_account_bump = Pubkey.find_program_address(
+    addresses = get_instance_addresses()
+    nft_account_pubkey, _nft_account_bump = find_program_address(
         [bytes(ingl_constants.NFT_ACCOUNT_CONST, "UTF-8"), bytes(mint_pubkey.pubkey)],
         get_program_id(),
     )
     mint_associated_account_pubkey = assoc_instructions.get_associated_token_address(
         payer_keypair.pubkey, mint_pubkey.pubkey
     )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
+    config_account_pubkey = addresses.config
+    general_account_pubkey = addresses.general
 
     payer_account_meta = AccountMeta(payer_keypair.pubkey, True, True)
     mint_account_meta = AccountMeta(mint_pubkey.pubkey, False, False)
@@ -388,17 +335,9 @@ async def delegate_nft(
             accounts=accounts, program_id=get_program_id(), data=instruction_data
         )
     )
-    try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer_keypair, commitment=commitment
+    )
 
 
 async def undelegate_nft(
@@ -406,30 +345,24 @@ async def undelegate_nft(
     mint_pubkey: PubkeyInput,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    nft_account_pubkey, _nft_account_bump = Pubkey.find_program_address(
+    addresses = get_instance_addresses()
+    nft_account_pubkey, _nft_account_bump = find_program_address(
         [bytes(ingl_constants.NFT_ACCOUNT_CONST, "UTF-8"), bytes(mint_pubkey.pubkey)],
         get_program_id(),
     )
     mint_associated_account_pubkey = assoc_instructions.get_associated_token_address(
         payer_keypair.pubkey, mint_pubkey.pubkey
     )
-    (
-        authorized_withdrawer_key,
-        _authorized_withdrawer_bump,
-    ) = Pubkey.find_program_address(
-        [bytes(ingl_constants.AUTHORIZED_WITHDRAWER_KEY, "UTF-8")], get_program_id()
-    )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
+    authorized_withdrawer_key = addresses.authorized_withdrawer
+    config_account_pubkey = addresses.config
+    general_account_pubkey = addresses.general
 
-    config_data = ValidatorConfig.parse(
-        (await client.get_account_info(config_account_pubkey)).value.data
+    (config_account_data,) = await fetch_account_data(
+        client, [config_account_pubkey], commitment, prefetch_blockhash=True
     )
+    config_data = ValidatorConfig.parse(config_account_data)
     expected_vote_pubkey = Pubkey(config_data.vote_account)
 
     payer_account_meta = AccountMeta(payer_keypair.pubkey, True, True)
@@ -471,37 +404,23 @@ async def undelegate_nft(
             accounts=accounts, program_id=get_program_id(), data=instruction_data
         )
     )
-    try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer_keypair, commitment=commitment
+    )
 
 
 async def create_vote_account(
-    validator_keypair: KeypairInput, client: AsyncClient, log_level: int = 0
+    validator_keypair: KeypairInput,
+    client: AsyncClient,
+    log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    expected_vote_pubkey, _expected_vote_pubkey_nonce = Pubkey.find_program_address(
-        [bytes(ingl_constants.VOTE_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    expected_stake_key, _expected_stake_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.STAKE_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    pd_pool_account_pubkey, _pd_pool_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.PD_POOL_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
+    addresses = get_instance_addresses()
+    expected_vote_pubkey = addresses.vote_account
+    expected_stake_key = addresses.stake
+    config_account_pubkey = addresses.config
+    general_account_pubkey = addresses.general
+    pd_pool_account_pubkey = addresses.pd_pool
 
     print(f"Vote_Account: {expected_vote_pubkey}")
 
@@ -550,67 +469,29 @@ async def create_vote_account(
     transaction.add(
         Instruction(accounts=accounts, program_id=get_program_id(), data=data)
     )
-    try:
-        t_dets = await sign_and_send_tx(transaction, client, validator_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
-
-
-async def init_rebalance(
-    payer_keypair: KeypairInput, client: AsyncClient, log_level: int = 0
-) -> str:
-    expected_stake_key, _expected_stake_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.STAKE_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    t_stake_key, _t_stake_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.T_STAKE_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    t_withdraw_key, _t_withdraw_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.T_WITHDRAW_KEY, "UTF-8")], get_program_id()
-    )
-    pd_pool_pubkey, _pd_pool_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.PD_POOL_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, validator_keypair, commitment=commitment
     )
 
 
 async def init_rebalance(
-    payer_keypair: KeypairInput, client: AsyncClient, log_level: int = 0
+    payer_keypair: KeypairInput,
+    client: AsyncClient,
+    log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    expected_stake_key, _expected_stake_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.STAKE_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    t_stake_key, _t_stake_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.T_STAKE_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    t_withdraw_key, _t_withdraw_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.T_WITHDRAW_KEY, "UTF-8")], get_program_id()
-    )
-    pd_pool_pubkey, _pd_pool_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.PD_POOL_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-
-    config_data = ValidatorConfig.parse(
-        (await client.get_account_info(config_account_pubkey)).value.data
-    )
+    addresses = get_instance_addresses()
+    expected_stake_key = addresses.stake
+    t_stake_key = addresses.t_stake
+    t_withdraw_key = addresses.t_withdraw
+    pd_pool_pubkey = addresses.pd_pool
+    general_account_pubkey = addresses.general
+    config_account_pubkey = addresses.config
+
+    (config_account_data,) = await fetch_account_data(
+        client, [config_account_pubkey], commitment, prefetch_blockhash=True
+    )
+    config_data = ValidatorConfig.parse(config_account_data)
     expected_vote_pubkey = Pubkey(config_data.vote_account)
 
     payer_account_meta = AccountMeta(payer_keypair.pubkey, True, True)
@@ -660,43 +541,29 @@ async def init_rebalance(
     transaction.add(
         Instruction(accounts=accounts, program_id=get_program_id(), data=data)
     )
-    try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer_keypair, commitment=commitment
+    )
 
 
 async def finalize_rebalance(
-    payer_keypair: KeypairInput, client: AsyncClient, log_level: int = 0
+    payer_keypair: KeypairInput,
+    client: AsyncClient,
+    log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    expected_stake_key, _expected_stake_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.STAKE_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    t_stake_key, _t_stake_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.T_STAKE_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    t_withdraw_key, _t_withdraw_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.T_WITHDRAW_KEY, "UTF-8")], get_program_id()
-    )
-    pd_pool_pubkey, _pd_pool_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.PD_POOL_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-
-    data = await client.get_account_info(config_account_pubkey)
-    validator_id = Pubkey(ValidatorConfig.parse(data.value.data).validator_id)
+    addresses = get_instance_addresses()
+    expected_stake_key = addresses.stake
+    t_stake_key = addresses.t_stake
+    t_withdraw_key = addresses.t_withdraw
+    pd_pool_pubkey = addresses.pd_pool
+    general_account_pubkey = addresses.general
+    config_account_pubkey = addresses.config
+
+    (config_account_data,) = await fetch_account_data(
+        client, [config_account_pubkey], commitment, prefetch_blockhash=True
+    )
+    validator_id = Pubkey(ValidatorConfig.parse(config_account_data).validator_id)
     print(f"Validator_Id: {validator_id}")
 
     payer_account_meta = AccountMeta(payer_keypair.pubkey, True, True)
@@ -736,61 +603,29 @@ async def finalize_rebalance(
     transaction.add(
         Instruction(accounts=accounts, program_id=get_program_id(), data=data)
     )
-    try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
-
-
-async def process_rewards(
-    payer_keypair: KeypairInput, client: AsyncClient, log_level: int = 0
-) -> str:
-    ingl_team_account_pubkey = Pubkey.from_string(
-        "Team111111111111111111111111111111111111111"
-    )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    (
-        authorized_withdrawer_key,
-        _authorized_withdrawer_bump,
-    ) = Pubkey.find_program_address(
-        [bytes(ingl_constants.AUTHORIZED_WITHDRAWER_KEY, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer_keypair, commitment=commitment
     )
 
 
 async def process_rewards(
-    payer_keypair: KeypairInput, client: AsyncClient, log_level: int = 0
+    payer_keypair: KeypairInput,
+    client: AsyncClient,
+    log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
+    addresses = get_instance_addresses()
     ingl_team_account_pubkey = Pubkey.from_string(
         "Team111111111111111111111111111111111111111"
     )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    (
-        authorized_withdrawer_key,
-        _authorized_withdrawer_bump,
-    ) = Pubkey.find_program_address(
-        [bytes(ingl_constants.AUTHORIZED_WITHDRAWER_KEY, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
+    config_account_pubkey = addresses.config
+    authorized_withdrawer_key = addresses.authorized_withdrawer
+    general_account_pubkey = addresses.general
 
-    config_data = ValidatorConfig.parse(
-        (await client.get_account_info(config_account_pubkey)).value.data
+    (config_account_data,) = await fetch_account_data(
+        client, [config_account_pubkey], commitment, prefetch_blockhash=True
     )
+    config_data = ValidatorConfig.parse(config_account_data)
     vote_account_key = Pubkey(config_data.vote_account)
     validator_id = Pubkey(config_data.validator_id)
     print(f"Validator_Id: {validator_id}")
@@ -828,72 +663,31 @@ async def process_rewards(
     transaction.add(
         Instruction(accounts=accounts, program_id=get_program_id(), data=config_data)
     )
-    try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
-
-
-async def nft_withdraw(
-    payer_keypair: KeypairInput,
-    mints: List[Pubkey],
-    client: AsyncClient,
-    log_level: int = 0,
-) -> str:
-    (
-        authorized_withdrawer_key,
-        _authorized_withdrawer_bump,
-    ) = Pubkey.find_program_address(
-        [
-            bytes(ingl_constants.AUTHORIZED_WITHDRAWER_KEY, "UTF-8"),
-            bytes(vote_account_id.pubkey),
-        ],
-        get_program_id(),
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer_keypair, commitment=commitment
     )
 
 
-async def nft_withdraw(
-    payer_keypair: KeypairInput,
+def build_nft_withdraw_instruction(
+    payer_pubkey: Pubkey,
+    vote_account_id: Pubkey,
     mints: List[Pubkey],
-    client: AsyncClient,
     log_level: int = 0,
-) -> str:
+) -> Instruction:
+    addresses = get_instance_addresses()
     (
         authorized_withdrawer_key,
         _authorized_withdrawer_bump,
-    ) = Pubkey.find_program_address(
+    ) = find_program_address(
         [
             bytes(ingl_constants.AUTHORIZED_WITHDRAWER_KEY, "UTF-8"),
-            bytes(vote_account_id.pubkey),
+            bytes(vote_account_id),
         ],
         get_program_id(),
     )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-
-    config_data = ValidatorConfig.parse(
-        (await client.get_account_info(config_account_pubkey)).value.data
-    )
-    vote_account_id = Pubkey(config_data.vote_account)
+    general_account_pubkey = addresses.general
 
-    payer_account_meta = AccountMeta(payer_keypair.pubkey, True, True)
+    payer_account_meta = AccountMeta(payer_pubkey, True, True)
     vote_account_meta = AccountMeta(vote_account_id, False, True)
     sys_program_meta = AccountMeta(system_program.ID, False, False)
     general_account_meta = AccountMeta(general_account_pubkey, False, True)
@@ -907,41 +701,52 @@ async def nft_withdraw(
         sys_program_meta,
     ]
 
-    for mint_pubkey in mints:
-        mint_associated_account_pubkey = (
-            assoc_instructions.get_associated_token_address(
-                payer_keypair.pubkey, mint_pubkey.pubkey
-            )
-        )
+    mint_addresses = derive_mint_addresses(mints, owner=payer_pubkey)
+    for mint_pubkey, mint_associated_account_pubkey, nft_account_pubkey in zip(
+        mint_addresses.mints,
+        mint_addresses.associated_token_accounts,
+        mint_addresses.nft_accounts,
+    ):
         accounts.append(AccountMeta(mint_associated_account_pubkey, False, False))
-        accounts.append(AccountMeta(mint_pubkey.pubkey, False, False))
-        gem_account_pubkey, _gem_account_bump = Pubkey.find_program_address(
-            [
-                bytes(ingl_constants.GEM_ACCOUNT_CONST, "UTF-8"),
-                bytes(mint_pubkey.pubkey),
-            ],
-            get_program_id(),
-        )
-        accounts.append(AccountMeta(gem_account_pubkey, False, True))
+        accounts.append(AccountMeta(mint_pubkey, False, False))
+        accounts.append(AccountMeta(nft_account_pubkey, False, True))
 
     accounts.append(sys_program_meta)
     # print(accounts)
     data = InstructionEnum.build(
         InstructionEnum.enum.NFTWithdraw(log_level=log_level, cnt=len(mints))
     )
-    transaction = Transaction()
-    transaction.add(
-        Instruction(accounts=accounts, program_id=get_program_id(), data=data)
-    )
+    return Instruction(accounts=accounts, program_id=get_program_id(), data=data)
+
+
+async def nft_withdraw(
+    payer_keypair: KeypairInput,
+    mints: List[Pubkey],
+    client: AsyncClient,
+    log_level: int = 0,
+    commitment: Optional[Commitment] = None,
+    use_lookup_table: Optional[bool] = None,
+    max_in_flight: int = MAX_IN_FLIGHT,
+) -> str:
+    config_account_pubkey = get_instance_addresses().config
     try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
+        (config_account_data,) = await fetch_account_data(
+            client, [config_account_pubkey], commitment, prefetch_blockhash=True
+        )
+        config_data = ValidatorConfig.parse(config_account_data)
+        vote_account_id = Pubkey(config_data.vote_account)
+
+        return await send_mint_chunks(
+            lambda chunk: build_nft_withdraw_instruction(
+                payer_keypair.pubkey, vote_account_id, chunk, log_level
+            ),
+            [mint_pubkey.pubkey for mint_pubkey in mints],
+            payer_keypair,
+            client,
+            commitment,
+            use_lookup_table,
+            max_in_flight,
         )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
     except Exception as e:
         return f"Error: {e}"
 
@@ -956,14 +761,12 @@ async def init_governance(
     config_account_type: Optional[ConfigAccountType.enum] = None,
     vote_account_governance: Optional[VoteAccountGovernance.enum] = None,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    config_account_pubkey, _config_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    nft_account_data_pubkey, _nft_account_data_bump = Pubkey.find_program_address(
+    addresses = get_instance_addresses()
+    general_account_pubkey = addresses.general
+    config_account_pubkey = addresses.config
+    nft_account_data_pubkey, _nft_account_data_bump = find_program_address(
         [bytes(ingl_constants.NFT_ACCOUNT_CONST, "UTF-8"), bytes(mint.pubkey)],
         get_program_id(),
     )
@@ -971,16 +774,19 @@ async def init_governance(
         payer_keypair.pubkey, mint.pubkey
     )
 
-    data = await client.get_account_info(general_account_pubkey)
-    proposal_numeration = GeneralData.parse(data.value.data).proposal_numeration
+    general_account_data, config_account_data = await fetch_account_data(
+        client,
+        [general_account_pubkey, config_account_pubkey],
+        commitment,
+        prefetch_blockhash=True,
+    )
+    proposal_numeration = GeneralData.parse(general_account_data).proposal_numeration
     print(f"proposal_numeration: {proposal_numeration}")
 
-    config_data = ValidatorConfig.parse(
-        (await client.get_account_info(config_account_pubkey)).value.data
-    )
+    config_data = ValidatorConfig.parse(config_account_data)
     vote_account_key = Pubkey(config_data.vote_account)
 
-    proposal_pubkey, _proposal_bump = Pubkey.find_program_address(
+    proposal_pubkey, _proposal_bump = find_program_address(
         [
             bytes(ingl_constants.INGL_PROPOSAL_KEY, "UTF-8"),
             (proposal_numeration).to_bytes(4, "big"),
@@ -1057,41 +863,67 @@ async def init_governance(
             accounts=accounts, program_id=get_program_id(), data=instruction_data
         )
     )
-    try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer_keypair, commitment=commitment
+    )
 
 
-async def vote_governance(
+async def send_mint_chunks(
+    build: Callable[[List[Pubkey]], Instruction],
+    mints: List[Pubkey],
     payer_keypair: KeypairInput,
+    client: AsyncClient,
+    commitment: Optional[Commitment] = None,
+    use_lookup_table: Optional[bool] = None,
+    max_in_flight: int = MAX_IN_FLIGHT,
+) -> str:
+    lookup_tables = None
+    if get_lookup_tables() if use_lookup_table is None else use_lookup_table:
+        # Accounts the instruction has without any mint belong to the instance.
+        instance_addresses = get_lookup_addresses([build([])])
+        instructions = [
+            build(mints[i : i + MAX_MINTS_PER_INSTRUCTION])
+            for i in range(0, len(mints), MAX_MINTS_PER_INSTRUCTION)
+        ]
+        lookup_tables = await ensure_lookup_tables(
+            client,
+            payer_keypair,
+            instance_addresses,
+            get_lookup_addresses(instructions),
+            commitment,
+        )
+    chunks = pack_mints(build, mints, payer_keypair.pubkey, lookup_tables)
+    sender = PipelinedSender(
+        client, max_in_flight, commitment, lookup_tables=lookup_tables
+    )
+    await sender.send_all(
+        (transaction, [payer_keypair]) for _chunk, transaction in chunks
+    )
+
+    lines = []
+    for (chunk, _transaction), result in zip(chunks, sender.results):
+        if result.plan is not None:
+            lines.append(f"Mints: {', '.join(str(mint) for mint in chunk)}")
+            lines.append(result.plan.render())
+            continue
+        if result.error is not None:
+            status = f"Error: {result.error}"
+        else:
+            status = get_tx_link(result.signature)
+        lines += [f"{mint}: {status}" for mint in chunk]
+    return "\n".join(lines)
+
+
+def build_vote_governance_instruction(
+    payer_pubkey: Pubkey,
     vote: Bool,
+    proposal_pubkey: Pubkey,
     proposal_numeration: int,
     mints: List[Pubkey],
-    client: AsyncClient,
     log_level: int = 0,
-) -> str:
-    proposal_pubkey, _proposal_account_bump = Pubkey.find_program_address(
-        [
-            bytes(ingl_constants.INGL_PROPOSAL_KEY, "UTF-8"),
-            (proposal_numeration).to_bytes(4, "big"),
-        ],
-        get_program_id(),
-    )
-
-    print(
-        f"Proposal_Account: {proposal_pubkey}, Vote: {'Approve' if vote else 'Dissaprove'} "
-    )
-
+) -> Instruction:
     payer_account_meta = AccountMeta(
-        pubkey=payer_keypair.pubkey, is_signer=True, is_writable=True
+        pubkey=payer_pubkey, is_signer=True, is_writable=True
     )
     proposal_account_meta = AccountMeta(
         pubkey=proposal_pubkey, is_signer=False, is_writable=True
@@ -1105,15 +937,12 @@ async def vote_governance(
         proposal_account_meta,
     ]
 
-    for mint in mints:
-        associated_account_key = assoc_instructions.get_associated_token_address(
-            payer_keypair.pubkey, mint
-        )
-        nft_account_pubkey, _nft_account_bump = Pubkey.find_program_address(
-            [bytes(ingl_constants.NFT_ACCOUNT_CONST, "UTF-8"), bytes(mint)],
-            get_program_id(),
-        )
-
+    mint_addresses = derive_mint_addresses(mints, owner=payer_pubkey)
+    for mint, associated_account_key, nft_account_pubkey in zip(
+        mint_addresses.mints,
+        mint_addresses.associated_token_accounts,
+        mint_addresses.nft_accounts,
+    ):
         nft_account_meta = AccountMeta(
             pubkey=nft_account_pubkey, is_signer=False, is_writable=True
         )
@@ -1137,21 +966,51 @@ async def vote_governance(
             cnt=len(mints),
         )
     )
-    transaction = Transaction()
-    transaction.add(
-        Instruction(
-            accounts=accounts, program_id=get_program_id(), data=instruction_data
-        )
+    return Instruction(
+        accounts=accounts, program_id=get_program_id(), data=instruction_data
+    )
+
+
+async def vote_governance(
+    payer_keypair: KeypairInput,
+    vote: Bool,
+    proposal_numeration: int,
+    mints: List[Pubkey],
+    client: AsyncClient,
+    log_level: int = 0,
+    commitment: Optional[Commitment] = None,
+    use_lookup_table: Optional[bool] = None,
+    max_in_flight: int = MAX_IN_FLIGHT,
+) -> str:
+    proposal_pubkey, _proposal_account_bump = find_program_address(
+        [
+            bytes(ingl_constants.INGL_PROPOSAL_KEY, "UTF-8"),
+            (proposal_numeration).to_bytes(4, "big"),
+        ],
+        get_program_id(),
+    )
+
+    print(
+        f"Proposal_Account: {proposal_pubkey}, Vote: {'Approve' if vote else 'Dissaprove'} "
     )
+
     try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
+        return await send_mint_chunks(
+            lambda chunk: build_vote_governance_instruction(
+                payer_keypair.pubkey,
+                vote,
+                proposal_pubkey,
+                proposal_numeration,
+                chunk,
+                log_level,
+            ),
+            mints,
+            payer_keypair,
+            client,
+            commitment,
+            use_lookup_table,
+            max_in_flight,
         )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
     except Exception as e:
         return f"Error: {e}"
 
@@ -1161,15 +1020,16 @@ async def finalize_governance(
     proposal_numeration: int,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    proposal_account_key, _proposal_account_bump = Pubkey.find_program_address(
+    proposal_account_key, _proposal_account_bump = find_program_address(
         [bytes(ingl_constants.INGL_PROPOSAL_KEY, "UTF-8"), (proposal_numeration)],
         get_program_id(),
     )
-    config_account_key, _config_account_bump = Pubkey.find_program_address(
+    config_account_key, _config_account_bump = find_program_address(
         [bytes(ingl_constants.INGL_CONFIG_KEY, "UTF-8")], get_program_id()
     )
-    general_account_key, _general_account_bump = Pubkey.find_program_address(
+    general_account_key, _general_account_bump = find_program_address(
         [bytes(ingl_constants.INGL_GENERAL_KEY, "UTF-8")], get_program_id()
     )
 
@@ -1215,17 +1075,9 @@ async def finalize_governance(
             accounts=accounts, program_id=get_program_id(), data=instruction_data
         )
     )
-    try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer_keypair, commitment=commitment
+    )
 
 
 async def execute_governance(
@@ -1233,22 +1085,25 @@ async def execute_governance(
     proposal_numeration: int,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    proposal_account_key, _proposal_account_bump = Pubkey.find_program_address(
+    addresses = get_instance_addresses()
+    proposal_account_key, _proposal_account_bump = find_program_address(
         [bytes(ingl_constants.INGL_PROPOSAL_KEY, "UTF-8"), (proposal_numeration)],
         get_program_id(),
     )
-    config_account_key, _config_account_bump = Pubkey.find_program_address(
+    config_account_key, _config_account_bump = find_program_address(
         [bytes(ingl_constants.INGL_CONFIG_KEY, "UTF-8")], get_program_id()
     )
-    general_account_key, _general_account_bump = Pubkey.find_program_address(
+    general_account_key, _general_account_bump = find_program_address(
         [bytes(ingl_constants.INGL_GENERAL_KEY, "UTF-8")], get_program_id()
     )
 
     print(f"Proposal_Account: {proposal_account_key}")
 
-    proposal_data = await client.get_account_info(proposal_account_key)
-    proposal_data = proposal_data.value.data
+    (proposal_data,) = await fetch_account_data(
+        client, [proposal_account_key], commitment, prefetch_blockhash=True
+    )
 
     # payer is the validator ID.
     payer_account_meta = AccountMeta(
@@ -1300,10 +1155,8 @@ async def execute_governance(
         pass
     elif governance_type == 1:
         buffer_account_key = Pubkey(proposal_data[loc : loc + 32])
-        programdata_key, _programdata_bump = Pubkey.find_program_address(
-            [bytes(get_program_id())], ingl_constants.BPF_LOADER_UPGRADEABLE
-        )
-        upgrade_authority_key, _upgrade_authority_bump = Pubkey.find_program_address(
+        programdata_key = addresses.program_data
+        upgrade_authority_key, _upgrade_authority_bump = find_program_address(
             [
                 bytes(ingl_constants.INGL_PROGRAM_AUTHORITY_KEY, "UTF-8"),
                 bytes(get_program_id()),
@@ -1336,7 +1189,7 @@ async def execute_governance(
     elif governance_type == 2:
         vote_account_governance_type = proposal_data[loc]
         loc += 1
-        vote_account_key, _vote_account_bump = Pubkey.find_program_address(
+        vote_account_key, _vote_account_bump = find_program_address(
             [
                 bytes(ingl_constants.INGL_VOTE_KEY, "UTF-8"),
             ],
@@ -1345,7 +1198,7 @@ async def execute_governance(
         (
             authorized_withdrawer_key,
             _authorized_withdrawer_bump,
-        ) = Pubkey.find_program_address(
+        ) = find_program_address(
             [
                 bytes(ingl_constants.INGL_VOTE_AUTHORIZED_WITHDRAWER_KEY, "UTF-8"),
             ],
@@ -1380,86 +1233,24 @@ async def execute_governance(
             accounts=accounts, program_id=get_program_id(), data=instruction_data
         )
     )
-    try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
-
-
-async def reset_uris(
-    payer_keypair: KeypairInput, client: AsyncClient, log_level: int = 0
-) -> str:
-    config_account_key, _config_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_ACCOUNT_KEY, "UTF-8")], get_program_id()
-    )
-    # payer is the validator id address.
-    payer_account_meta = AccountMeta(
-        pubkey=payer_keypair.pubkey, is_signer=True, is_writable=True
-    )
-    uris_account_key, uris_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_URIS_ACCOUNT_KEY, "UTF-8")], get_program_id()
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer_keypair, commitment=commitment
     )
 
-    uris_account_meta = AccountMeta(
-        pubkey=uris_account_key, is_signer=False, is_writable=True
-    )
-    config_account_meta = AccountMeta(
-        pubkey=config_account_key, is_signer=False, is_writable=True
-    )
-    system_program_meta = AccountMeta(
-        pubkey=system_program.SYSTEM_PROGRAM_ID, is_signer=False, is_writable=False
-    )
 
-    accounts = [
-        payer_account_meta,
-        config_account_meta,
-        uris_account_meta,
-        system_program_meta,
-    ]
-
-    instruction_data = build_instruction(
-        InstructionEnum.enum.ResetUris(log_level=log_level)
-    )
-    transaction = Transaction()
-    transaction.add(
-        Instruction(
-            accounts=accounts, program_id=get_program_id(), data=instruction_data
-        )
-    )
-    try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
+URIS_PER_TRANSACTION = 11
 
 
-def upload_uris(
+def build_upload_uris_transaction(
     payer_keypair: KeypairInput,
     upload_authority: KeypairInput,
     uris: List[str],
     rarity: int,
-    client: Client,
     log_level: int = 0,
-) -> str:
-    config_account_key, _config_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    uris_account_key, _config_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.URIS_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
+) -> Transaction:
+    addresses = get_instance_addresses()
+    config_account_key = addresses.config
+    uris_account_key = addresses.uris
 
     payer_account_meta = AccountMeta(
         pubkey=payer_keypair.pubkey, is_signer=True, is_writable=True
@@ -1485,40 +1276,64 @@ def upload_uris(
         system_program_meta,
     ]
 
-    t_dets = None
-    try:
-        instruction_data = build_instruction(
-            InstructionEnum.enum.UploadUris(
-                uris=uris, rarity=rarity, log_level=log_level
-            )
+    instruction_data = build_instruction(
+        InstructionEnum.enum.UploadUris(uris=uris, rarity=rarity, log_level=log_level)
+    )
+    transaction = Transaction()
+    transaction.add(
+        ComputeBudgetInstruction().set_compute_unit_limit(
+            1_000_000, payer_keypair.pubkey
         )
-        transaction = Transaction()
-        transaction.add(
-            ComputeBudgetInstruction().set_compute_unit_limit(
-                1_000_000, payer_keypair.pubkey
-            )
+    )
+    transaction.add(
+        Instruction(
+            accounts=accounts, program_id=get_program_id(), data=instruction_data
         )
-        transaction.add(
-            Instruction(
-                accounts=accounts, program_id=get_program_id(), data=instruction_data
-            )
+    )
+    return transaction
+
+
+async def upload_uris(
+    payer_keypair: KeypairInput,
+    upload_authority: KeypairInput,
+    rarities: List[List[str]],
+    client: AsyncClient,
+    log_level: int = 0,
+    commitment: Optional[Commitment] = None,
+) -> PipelinedSender:
+    signers = [payer_keypair]
+    if upload_authority.pubkey != payer_keypair.pubkey:
+        signers.append(upload_authority)
+    transactions = (
+        (
+            build_upload_uris_transaction(
+                payer_keypair,
+                upload_authority,
+                uris[i : i + URIS_PER_TRANSACTION],
+                rarity,
+                log_level,
+            ),
+            signers,
         )
-        t_dets = client.send_transaction(transaction, payer_keypair.keypair)
-        return t_dets
-    except Exception as e:
-        print(t_dets, e)
-        raise e
+        for rarity, uris in enumerate(rarities)
+        for i in range(0, len(uris), URIS_PER_TRANSACTION)
+    )
+    # The uris account appends in arrival order: send one chunk at a time,
+    # each confirmed before the next, and stop at the first failure.
+    sender = PipelinedSender(client, 1, commitment, stop_on_error=True)
+    await sender.send_all(transactions)
+    return sender
 
 
 async def reset_uris(
-    payer_keypair: KeypairInput, client: AsyncClient, log_level: int = 0
+    payer_keypair: KeypairInput,
+    client: AsyncClient,
+    log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    config_account_key, _config_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    uris_account_key, _config_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.URIS_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
+    addresses = get_instance_addresses()
+    config_account_key = addresses.config
+    uris_account_key = addresses.uris
 
     payer_account_meta = AccountMeta(
         pubkey=payer_keypair.pubkey, is_signer=True, is_writable=True
@@ -1540,7 +1355,6 @@ async def reset_uris(
         system_program_meta,
     ]
 
-    t_dets = None
     try:
         instruction_data = build_instruction(
             InstructionEnum.enum.ResetUris(log_level=log_level)
@@ -1556,24 +1370,20 @@ async def reset_uris(
                 accounts=accounts, program_id=get_program_id(), data=instruction_data
             )
         )
-        t_dets = await client.send_transaction(transaction, payer_keypair.keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
+        return await sign_send_confirm_tx(
+            transaction, client, payer_keypair, commitment=commitment
         )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
     except Exception as e:
-        print(t_dets, e)
+        print(e)
         raise e
 
 
 async def init_registry(
     payer_keypair: KeypairInput,
     client: AsyncClient,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    config_account_key, _config_bump = Pubkey.find_program_address(
+    config_account_key, _config_bump = find_program_address(
         [b"config"], ingl_constants.REGISTRY_PROGRAM
     )
 
@@ -1593,7 +1403,6 @@ async def init_registry(
         system_program_meta,
     ]
 
-    t_dets = None
     try:
         instruction_data = RegistryEnum.build(RegistryEnum.enum.InitConfig())
         transaction = Transaction()
@@ -1604,24 +1413,20 @@ async def init_registry(
                 data=instruction_data,
             )
         )
-        t_dets = await client.send_transaction(transaction, payer_keypair.keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
+        return await sign_send_confirm_tx(
+            transaction, client, payer_keypair, commitment=commitment
         )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
     except Exception as e:
-        print(t_dets, e)
+        print(e)
         raise e
 
 
 async def reset_registry(
     payer_keypair: KeypairInput,
     client: AsyncClient,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    config_account_key, _config_bump = Pubkey.find_program_address(
+    config_account_key, _config_bump = find_program_address(
         [b"config"], ingl_constants.REGISTRY_PROGRAM
     )
 
@@ -1631,11 +1436,11 @@ async def reset_registry(
     system_program_meta = AccountMeta(
         pubkey=system_program.ID, is_signer=False, is_writable=False
     )
-    storage_account_key, _config_account_bump = Pubkey.find_program_address(
+    storage_account_key, _config_account_bump = find_program_address(
         [b"storage"],
         ingl_constants.REGISTRY_PROGRAM,
     )
-    name_storage_key, _name_storage_bump = Pubkey.find_program_address(
+    name_storage_key, _name_storage_bump = find_program_address(
         [b"name_storage"],
         ingl_constants.REGISTRY_PROGRAM,
     )
@@ -1655,7 +1460,6 @@ async def reset_registry(
         system_program_meta,
     ]
 
-    t_dets = None
     try:
         instruction_data = RegistryEnum.build(RegistryEnum.enum.Reset())
         transaction = Transaction()
@@ -1666,16 +1470,11 @@ async def reset_registry(
                 data=instruction_data,
             )
         )
-        t_dets = await client.send_transaction(transaction, payer_keypair.keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
+        return await sign_send_confirm_tx(
+            transaction, client, payer_keypair, commitment=commitment
         )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
     except Exception as e:
-        print(t_dets, e)
+        print(e)
         raise e
 
 
@@ -1683,8 +1482,9 @@ async def register_program(
     payer_keypair: KeypairInput,
     program_key: Pubkey,
     client: AsyncClient,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    config_account_key, _config_bump = Pubkey.find_program_address(
+    config_account_key, _config_bump = find_program_address(
         [b"config"], ingl_constants.REGISTRY_PROGRAM
     )
     payer_account_meta = AccountMeta(
@@ -1703,9 +1503,11 @@ async def register_program(
         pubkey=system_program.ID, is_signer=False, is_writable=False
     )
 
-    config_data = await client.get_account_info(config_account_key)
-    config_data = RegistryConfig.parse(config_data.value.data)
-    storage_account_key, _config_account_bump = Pubkey.find_program_address(
+    (config_data,) = await fetch_account_data(
+        client, [config_account_key], commitment, prefetch_blockhash=True
+    )
+    config_data = RegistryConfig.parse(config_data)
+    storage_account_key, _config_account_bump = find_program_address(
         [b"storage", (config_data.validator_numeration // 625).to_bytes(4, "big")],
         ingl_constants.REGISTRY_PROGRAM,
     )
@@ -1722,7 +1524,6 @@ async def register_program(
         system_program_meta,
     ]
 
-    t_dets = None
     try:
         instruction_data = RegistryEnum.build(RegistryEnum.enum.AddProgram(name=name))
         transaction = Transaction()
@@ -1733,16 +1534,11 @@ async def register_program(
                 data=instruction_data,
             )
         )
-        t_dets = await client.send_transaction(transaction, payer_keypair.keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
+        return await sign_send_confirm_tx(
+            transaction, client, payer_keypair, commitment=commitment
         )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
     except Exception as e:
-        print(t_dets, e)
+        print(e)
         raise e
 
 
@@ -1772,53 +1568,36 @@ async def fractionalize_existing(
     default_uri: str,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    mint_pubkey, _mint_pubkey_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_NFT_COLLECTION_KEY, "UTF-8")], get_program_id()
-    )
-    mint_authority_pubkey, _mint_authority_pubkey_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_MINT_AUTHORITY_KEY, "UTF-8")], get_program_id()
-    )
-    (
-        collection_holder_pubkey,
-        _collection_holder_pubkey_bump,
-    ) = Pubkey.find_program_address(
-        [bytes(ingl_constants.COLLECTION_HOLDER_KEY, "UTF-8")], get_program_id()
-    )
+    addresses = get_instance_addresses()
+    mint_pubkey = addresses.collection_mint
+    mint_authority_pubkey = addresses.mint_authority
+    collection_holder_pubkey = addresses.collection_holder
     mint_associated_account_pubkey = assoc_instructions.get_associated_token_address(
         collection_holder_pubkey, mint_pubkey
     )
     metaplex_program_id = Pubkey.from_string(
         "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
     )
-    metadata_pda, _metadata_pda_bump = Pubkey.find_program_address(
-        [b"metadata", bytes(metaplex_program_id), bytes(mint_pubkey)],
-        metaplex_program_id,
-    )
-    master_edition_pda, _master_edition_bump = Pubkey.find_program_address(
-        [b"metadata", bytes(metaplex_program_id), bytes(mint_pubkey), b"edition"],
-        metaplex_program_id,
-    )
-    ingl_config_pubkey, _ingl_config_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.INGL_CONFIG_SEED, "UTF-8")], get_program_id()
-    )
-    general_account_pubkey, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
-    uris_account_pubkey, _uris_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.URIS_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
+    metadata_pda = addresses.collection_metadata
+    master_edition_pda = addresses.collection_master_edition
+    ingl_config_pubkey = addresses.config
+    general_account_pubkey = addresses.general
+    uris_account_pubkey = addresses.uris
 
     (
         registry_program_config_key,
         _registry_program_config_bump,
-    ) = Pubkey.find_program_address([b"config"], ingl_constants.REGISTRY_PROGRAM_ID)
+    ) = find_program_address([b"config"], ingl_constants.REGISTRY_PROGRAM_ID)
 
-    registry_config_account = await client.get_account_info(registry_program_config_key)
-    registry_config_data = RegistryConfig.parse(registry_config_account.value.data)
+    (registry_config_account,) = await fetch_account_data(
+        client, [registry_program_config_key], commitment, prefetch_blockhash=True
+    )
+    registry_config_data = RegistryConfig.parse(registry_config_account)
     storage_numeration = registry_config_data.validator_numeration // 625
     name_storage_numeration = registry_config_data.validator_numeration // 1666
-    storage_key, _storage_bump = Pubkey.find_program_address(
+    storage_key, _storage_bump = find_program_address(
         [b"storage", storage_numeration.to_bytes(4, "big")],
         ingl_constants.REGISTRY_PROGRAM_ID,
     )
@@ -1826,14 +1605,12 @@ async def fractionalize_existing(
     (
         pda_authorized_withdrawer,
         _pda_authorized_withdrawer_bump,
-    ) = Pubkey.find_program_address(
+    ) = find_program_address(
         [bytes(ingl_constants.INGL_AUTHORIZED_WITHDRAWER_KEY, "UTF-8")],
         get_program_id(),
     )
 
-    programdata_key, _programdata_bump = Pubkey.find_program_address(
-        [bytes(get_program_id())], ingl_constants.BPF_LOADER_UPGRADEABLE
-    )
+    programdata_key = addresses.program_data
 
     payer_account_meta = AccountMeta(payer_keypair.pubkey, True, True)
     collection_holder_meta = AccountMeta(collection_holder_pubkey, False, True)
@@ -1937,19 +1714,13 @@ async def fractionalize_existing(
         Instruction(accounts=accounts, program_id=get_program_id(), data=data)
     )
 
-    try:
-        t_dets = await sign_and_send_tx(
-            transaction, client, payer_keypair, authorized_withdrawer
-        )
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
-        )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
-    except Exception as e:
-        return f"Error: {e}"
+    return await sign_send_confirm_return_tx_as_link(
+        transaction,
+        client,
+        payer_keypair,
+        authorized_withdrawer,
+        commitment=commitment,
+    )
 
 
 async def inject_testing_data(
@@ -1957,16 +1728,12 @@ async def inject_testing_data(
     mints: List[Pubkey],
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
+    use_lookup_table: Optional[bool] = None,
 ) -> str:
-    (
-        authorized_withdrawer_key,
-        _authorized_withdrawer_bump,
-    ) = Pubkey.find_program_address(
-        [bytes(ingl_constants.AUTHORIZED_WITHDRAWER_KEY, "UTF-8")], get_program_id()
-    )
-    general_account_key, _general_account_bump = Pubkey.find_program_address(
-        [bytes(ingl_constants.GENERAL_ACCOUNT_SEED, "UTF-8")], get_program_id()
-    )
+    addresses = get_instance_addresses()
+    authorized_withdrawer_key = addresses.authorized_withdrawer
+    general_account_key = addresses.general
 
     payer_account_meta = AccountMeta(payer_keypair.pubkey, True, True)
     general_account_meta = AccountMeta(general_account_key, False, True)
@@ -1979,12 +1746,11 @@ async def inject_testing_data(
         authorized_withdrawer_meta,
     ]
 
-    for mint_pubkey in mints:
+    mint_addresses = derive_mint_addresses(mints)
+    for mint_pubkey, nft_account_pubkey in zip(
+        mint_addresses.mints, mint_addresses.nft_accounts
+    ):
         accounts.append(AccountMeta(mint_pubkey, False, False))
-        nft_account_pubkey, _nft_account_bump = Pubkey.find_program_address(
-            [bytes(ingl_constants.NFT_ACCOUNT_CONST, "UTF-8"), bytes(mint_pubkey)],
-            get_program_id(),
-        )
         accounts.append(AccountMeta(nft_account_pubkey, False, True))
 
     accounts.append(sys_program_meta)
@@ -1999,14 +1765,24 @@ async def inject_testing_data(
         Instruction(accounts=accounts, program_id=get_program_id(), data=data)
     )
     try:
-        t_dets = await sign_and_send_tx(transaction, client, payer_keypair)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value,
-            commitment="finalized",
-            sleep_seconds=0.4,
-            last_valid_block_height=None,
+        lookup_tables = None
+        if get_lookup_tables() if use_lookup_table is None else use_lookup_table:
+            addresses = get_lookup_addresses(transaction.instructions)
+            per_mint = set(mint_addresses.mints) | set(mint_addresses.nft_accounts)
+            lookup_tables = await ensure_lookup_tables(
+                client,
+                payer_keypair,
+                [address for address in addresses if address not in per_mint],
+                [address for address in addresses if address in per_mint],
+                commitment,
+            )
+        return await sign_send_confirm_tx(
+            transaction,
+            client,
+            payer_keypair,
+            commitment=commitment,
+            lookup_tables=lookup_tables,
         )
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
     except Exception as e:
         return f"[warning]Error: {e}[/warning]"
 
@@ -2026,23 +1802,14 @@ async def process_list_validator(
     validator_logo_url: str,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    pda_authorized_withdrawer_key, _pda_aw_bump = Pubkey.find_program_address(
-        [ingl_constants.PDA_AUTHORIZED_WITHDRAWER_SEED], get_market_program_id()
-    )
-    storage_account_key, _storage_bump = Pubkey.find_program_address(
-        [ingl_constants.PROGRAM_STORAGE_SEED], get_market_program_id()
-    )
-    this_program_data_key, _this_program_data_bump = Pubkey.find_program_address(
-        [bytes(get_market_program_id())], ingl_constants.BPF_LOADER_UPGRADEABLE
-    )
-    (
-        pda_upgrade_authority_key,
-        _pda_upgrade_authority_bump,
-    ) = Pubkey.find_program_address(
-        [ingl_constants.PDA_UPGRADE_AUTHORITY_SEED], get_market_program_id()
-    )
-    registry_storage_key, _registry_storage_bump = Pubkey.find_program_address(
+    addresses = get_instance_addresses(require_market=True)
+    pda_authorized_withdrawer_key = addresses.market_authorized_withdrawer
+    storage_account_key = addresses.market_storage
+    this_program_data_key = addresses.market_program_data
+    pda_upgrade_authority_key = addresses.market_upgrade_authority
+    registry_storage_key, _registry_storage_bump = find_program_address(
         [ingl_constants.REGISTRY_STORAGE_SEED], ingl_constants.REGISTRY_PROGRAM
     )
 
@@ -2136,7 +1903,11 @@ async def process_list_validator(
 
     # Sign Transaction, Send Transaction, and Confirm Transaction, Return Transaction Signature
     return await sign_send_confirm_return_tx_as_link(
-        transaction, client, authorized_withdrawer, current_upgrade_authority
+        transaction,
+        client,
+        authorized_withdrawer,
+        current_upgrade_authority,
+        commitment=commitment,
     )
 
 
@@ -2144,26 +1915,18 @@ async def process_delist_validator(
     authorized_withdrawer: KeypairInput,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    pda_authorized_withdrawer_key, _pda_aw_bump = Pubkey.find_program_address(
-        [ingl_constants.PDA_AUTHORIZED_WITHDRAWER_SEED], get_market_program_id()
-    )
-    storage_account_key, _storage_bump = Pubkey.find_program_address(
-        [ingl_constants.PROGRAM_STORAGE_SEED], get_market_program_id()
-    )
-    this_program_data_key, _this_program_data_bump = Pubkey.find_program_address(
-        [bytes(get_market_program_id())], ingl_constants.BPF_LOADER_UPGRADEABLE
-    )
-    (
-        pda_upgrade_authority_key,
-        _pda_upgrade_authority_bump,
-    ) = Pubkey.find_program_address(
-        [ingl_constants.PDA_UPGRADE_AUTHORITY_SEED], get_market_program_id()
-    )
+    addresses = get_instance_addresses(require_market=True)
+    pda_authorized_withdrawer_key = addresses.market_authorized_withdrawer
+    storage_account_key = addresses.market_storage
+    this_program_data_key = addresses.market_program_data
+    pda_upgrade_authority_key = addresses.market_upgrade_authority
 
-    storage_account_data = Storage.parse(
-        (await client.get_account_info(storage_account_key)).value.data
+    (storage_account_raw,) = await fetch_account_data(
+        client, [storage_account_key], commitment, prefetch_blockhash=True
     )
+    storage_account_data = Storage.parse(storage_account_raw)
     vote_account_key = Pubkey(storage_account_data.vote_account)
 
     # Forming AccountMetas
@@ -2222,7 +1985,7 @@ async def process_delist_validator(
 
     # Sign Transaction, Send Transaction, and Confirm Transaction, Return Transaction Signature
     return await sign_send_confirm_return_tx_as_link(
-        transaction, client, authorized_withdrawer
+        transaction, client, authorized_withdrawer, commitment=commitment
     )
 
 
@@ -2230,20 +1993,17 @@ async def process_buy_validator(
     payer: KeypairInput,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    pda_authorized_withdrawer_key, _pda_aw_bump = Pubkey.find_program_address(
-        [ingl_constants.PDA_AUTHORIZED_WITHDRAWER_SEED], get_market_program_id()
-    )
-    storage_account_key, _storage_bump = Pubkey.find_program_address(
-        [ingl_constants.PROGRAM_STORAGE_SEED], get_market_program_id()
-    )
-    escrow_account_key, _escrow_bump = Pubkey.find_program_address(
-        [ingl_constants.ESCROW_ACCOUNT_SEED], get_market_program_id()
-    )
+    addresses = get_instance_addresses(require_market=True)
+    pda_authorized_withdrawer_key = addresses.market_authorized_withdrawer
+    storage_account_key = addresses.market_storage
+    escrow_account_key = addresses.market_escrow
 
-    storage_account_data = Storage.parse(
-        (await client.get_account_info(storage_account_key)).value.data
+    (storage_account_raw,) = await fetch_account_data(
+        client, [storage_account_key], commitment, prefetch_blockhash=True
     )
+    storage_account_data = Storage.parse(storage_account_raw)
     vote_account_key = Pubkey(storage_account_data.vote_account)
     registered_authorized_withdrawer_key = Pubkey(
         storage_account_data.authorized_withdrawer
@@ -2302,24 +2062,25 @@ async def process_buy_validator(
     )
 
     # Sign Transaction, Send Transaction, and Confirm Transaction, Return Transaction Signature
-    return await sign_send_confirm_return_tx_as_link(transaction, client, payer)
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer, commitment=commitment
+    )
 
 
 async def process_withdraw_rewards(
     authorized_withdrawer: KeypairInput,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    pda_authorized_withdrawer_key, _pda_aw_bump = Pubkey.find_program_address(
-        [ingl_constants.PDA_AUTHORIZED_WITHDRAWER_SEED], get_market_program_id()
-    )
-    storage_account_key, _storage_bump = Pubkey.find_program_address(
-        [ingl_constants.PROGRAM_STORAGE_SEED], get_market_program_id()
-    )
+    addresses = get_instance_addresses(require_market=True)
+    pda_authorized_withdrawer_key = addresses.market_authorized_withdrawer
+    storage_account_key = addresses.market_storage
 
-    storage_account_data = Storage.parse(
-        (await client.get_account_info(storage_account_key)).value.data
+    (storage_account_raw,) = await fetch_account_data(
+        client, [storage_account_key], commitment, prefetch_blockhash=True
     )
+    storage_account_data = Storage.parse(storage_account_raw)
     vote_account_key = Pubkey(storage_account_data.vote_account)
 
     # Forming AccountMetas
@@ -2359,7 +2120,7 @@ async def process_withdraw_rewards(
 
     # Sign Transaction, Send Transaction, and Confirm Transaction, Return Transaction Signature
     return await sign_send_confirm_return_tx_as_link(
-        transaction, client, authorized_withdrawer
+        transaction, client, authorized_withdrawer, commitment=commitment
     )
 
 
@@ -2367,10 +2128,10 @@ async def process_request_mediation(
     payer: KeypairInput,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    storage_account_key, _storage_bump = Pubkey.find_program_address(
-        [ingl_constants.PROGRAM_STORAGE_SEED], get_market_program_id()
-    )
+    addresses = get_instance_addresses(require_market=True)
+    storage_account_key = addresses.market_storage
 
     # Forming AccountMetas
     payer_meta = AccountMeta(pubkey=payer.pubkey, is_signer=True, is_writable=True)
@@ -2393,7 +2154,9 @@ async def process_request_mediation(
     )
 
     # Sign Transaction, Send Transaction, and Confirm Transaction, Return Transaction Signature
-    return await sign_send_confirm_return_tx_as_link(transaction, client, payer)
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer, commitment=commitment
+    )
 
 
 async def process_mediate(
@@ -2401,18 +2164,19 @@ async def process_mediate(
     mediation_shares: dict,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    storage_account_key, _storage_bump = Pubkey.find_program_address(
-        [ingl_constants.PROGRAM_STORAGE_SEED], get_market_program_id()
-    )
+    addresses = get_instance_addresses(require_market=True)
+    storage_account_key = addresses.market_storage
 
-    escrow_account_key, _escrow_bump = Pubkey.find_program_address(
+    escrow_account_key, _escrow_bump = find_program_address(
         [ingl_constants.ESCROW_SEED], get_market_program_id()
     )
 
-    storage_account_data = Storage.parse(
-        (await client.get_account_info(storage_account_key)).value.data
+    (storage_account_raw,) = await fetch_account_data(
+        client, [storage_account_key], commitment, prefetch_blockhash=True
     )
+    storage_account_data = Storage.parse(storage_account_raw)
 
     authorized_withdrawer_key = Pubkey(storage_account_data.authorized_withdrawer)
     buyer_key = Pubkey(storage_account_data.purchase.buyer)
@@ -2462,7 +2226,9 @@ async def process_mediate(
     )
 
     # Sign Transaction, Send Transaction, and Confirm Transaction, Return Transaction Signature
-    return await sign_send_confirm_return_tx_as_link(transaction, client, payer)
+    return await sign_send_confirm_return_tx_as_link(
+        transaction, client, payer, commitment=commitment
+    )
 
 
 async def process_validate_secondary_item_transfers(
@@ -2470,17 +2236,18 @@ async def process_validate_secondary_item_transfers(
     item_index: int,
     client: AsyncClient,
     log_level: int = 0,
+    commitment: Optional[Commitment] = None,
 ) -> str:
-    storage_account_key, _storage_bump = Pubkey.find_program_address(
-        [ingl_constants.PROGRAM_STORAGE_SEED], get_market_program_id()
-    )
-    escrow_account_key, _escrow_bump = Pubkey.find_program_address(
+    addresses = get_instance_addresses(require_market=True)
+    storage_account_key = addresses.market_storage
+    escrow_account_key, _escrow_bump = find_program_address(
         [ingl_constants.ESCROW_SEED], get_market_program_id()
     )
 
-    storage_account_data = Storage.parse(
-        (await client.get_account_info(storage_account_key)).value.data
+    (storage_account_raw,) = await fetch_account_data(
+        client, [storage_account_key], commitment, prefetch_blockhash=True
     )
+    storage_account_data = Storage.parse(storage_account_raw)
     buyer_key = Pubkey(storage_account_data.purchase.buyer)
     assert authorized_withdrawer.pubkey == Pubkey(
         storage_account_data.authorized_withdrawer
@@ -2523,5 +2290,5 @@ async def process_validate_secondary_item_transfers(
 
     # Sign Transaction, Send Transaction, and Confirm Transaction, Return Transaction Signature
     return await sign_send_confirm_return_tx_as_link(
-        transaction, client, authorized_withdrawer
+        transaction, client, authorized_withdrawer, commitment=commitment
     )
@@ -0,0 +1,156 @@
+import asyncio
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+import httpx
+from solana.rpc.async_api import AsyncClient
+from .state import get_rate_limit
+
+MIN_RATE = 1.0
+MAX_RATE = 1000.0
+# Linear growth once an endpoint has throttled us: +1 request/s per second of
+# saturated traffic. Before that the rate doubles every second (slow start).
+RATE_INCREASE = 1.0
+RATE_DECREASE = 0.5
+# Requests already in flight when the first 429 arrives will all come back
+# throttled; only back off once for the whole burst.
+DECREASE_COOLDOWN = 1.0
+MAX_THROTTLE_RETRIES = 5
+
+_limiters: Dict[str, "RateLimiter"] = {}
+
+
+class RateLimiter:
+    def __init__(self, rate: Optional[float]):
+        # Without a starting rate requests go out uncapped until the first 429.
+        self.rate = rate
+        self.threshold: Optional[float] = None
+        self.tokens = max(1.0, rate or 1.0)
+        self.updated = time.monotonic()
+        self.recent = deque()
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.throttled = 0
+
+    def _refill(self, now: float):
+        # One second of burst on top of the steady rate.
+        capacity = max(1.0, self.rate)
+        self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                await asyncio.sleep(self.blocked_until - now)
+                continue
+            if self.rate is None:
+                self.recent.append(now)
+                while now - self.recent[0] > 1.0:
+                    self.recent.popleft()
+                return
+            self._refill(now)
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return
+            # Re-check after sleeping: the rate may have dropped meanwhile.
+            await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
+    def block(self, retry_after: float):
+        self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+    def record_success(self):
+        if self.rate is None:
+            return
+        self._refill(time.monotonic())
+        if self.tokens >= 1.0:
+            # Not using the rate we have; don't ask for more.
+            return
+        if self.threshold is None or self.rate < self.threshold:
+            self.rate = min(MAX_RATE, self.rate + 1.0)
+        else:
+            self.rate = min(MAX_RATE, self.rate + RATE_INCREASE / self.rate)
+
+    def record_throttle(self, retry_after: Optional[float]):
+        now = time.monotonic()
+        self.throttled += 1
+        if retry_after is not None:
+            self.block(retry_after)
+        if now - self.last_decrease < DECREASE_COOLDOWN:
+            return
+        self.last_decrease = now
+        if self.rate is None:
+            # Back off from the last second's throughput, which drew the 429.
+            self.rate = float(len(self.recent))
+            self.recent.clear()
+            self.updated = now
+        self._refill(now)
+        self.rate = max(MIN_RATE, self.rate * RATE_DECREASE)
+        self.threshold = self.rate
+        self.tokens = min(self.tokens, 0.0)
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def get_rate_limiter(url: httpx.URL, rate: Optional[float] = None) -> RateLimiter:
+    origin = f"{url.scheme}://{url.netloc.decode()}"
+    if origin not in _limiters:
+        _limiters[origin] = RateLimiter(get_rate_limit() if rate is None else rate)
+    return _limiters[origin]
+
+
+class RateLimitedTransport(httpx.AsyncHTTPTransport):
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        max_retries: int = MAX_THROTTLE_RETRIES,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.rate = rate
+        self.max_retries = max_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = get_rate_limiter(request.url, self.rate)
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire()
+            response = await super().handle_async_request(request)
+            retry_after = _retry_after(response)
+            if response.status_code != 429:
+                if retry_after is not None:
+                    limiter.block(retry_after)
+                elif response.status_code < 400:
+                    limiter.record_success()
+                return response
+            limiter.record_throttle(retry_after)
+            if attempt == self.max_retries:
+                return response
+            await response.aclose()
+
+
+def use_rate_limiter(
+    client: AsyncClient,
+    rate: Optional[float] = None,
+    max_retries: int = MAX_THROTTLE_RETRIES,
+):
+    if rate is None:
+        rate = get_rate_limit()
+    if rate == 0:
+        return
+    session = client._provider.session
+    client._provider.session = httpx.AsyncClient(
+        timeout=session.timeout, transport=RateLimitedTransport(rate, max_retries)
+    )
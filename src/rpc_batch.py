@@ -0,0 +1,93 @@
+import asyncio
+import json
+from typing import List, Tuple, Type
+import httpx
+from solders.rpc.requests import Body
+from solana.exceptions import SolanaRpcException
+from solana.rpc.providers.async_http import AsyncHTTPProvider
+from solana.rpc.providers.core import T, _after_request_unparsed, _parse_raw
+
+MAX_BATCH_SIZE = 100
+
+
+def _resolve(future: asyncio.Future, result=None, error=None):
+    # The caller may have given up (timeout, hedge lost) before the batch returned.
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def _rpc_error(error: Exception, provider, body: Body, parser) -> Exception:
+    # Raise what make_request raises for the same request sent on its own.
+    if not isinstance(error, httpx.HTTPError):
+        return error
+    rpc_error = SolanaRpcException(
+        error, provider.make_request, provider, body, parser
+    )
+    rpc_error.__cause__ = error
+    return rpc_error
+
+
+class BatchingMixin:
+    # Coalesces the make_request calls issued within one event loop tick
+    # into a single JSON-RPC batch POST.
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._batch_queue: List[Tuple[Body, Type[T], asyncio.Future]] = []
+
+    async def make_request(self, body: Body, parser: Type[T]) -> T:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch_queue.append((body, parser, future))
+        if len(self._batch_queue) == 1:
+            loop.call_soon(self._flush_batch)
+        return await future
+
+    def _flush_batch(self):
+        queue, self._batch_queue = self._batch_queue, []
+        for i in range(0, len(queue), MAX_BATCH_SIZE):
+            asyncio.ensure_future(self._send_batch(queue[i : i + MAX_BATCH_SIZE]))
+
+    async def post_batch(self, content: str, bodies: List[Body]) -> str:
+        raw_response = await self.session.post(
+            **{**self._build_common_request_kwargs(), "content": content}
+        )
+        return _after_request_unparsed(raw_response)
+
+    async def _send_batch(self, batch: List[Tuple[Body, Type[T], asyncio.Future]]):
+        if len(batch) == 1:
+            body, parser, future = batch[0]
+            try:
+                _resolve(future, await super().make_request(body, parser))
+            except Exception as e:
+                _resolve(future, error=e)
+            return
+        payload = []
+        for i, (body, _parser, _future) in enumerate(batch):
+            request = json.loads(body.to_json())
+            request["id"] = i
+            payload.append(request)
+        try:
+            raw = await self.post_batch(
+                json.dumps(payload), [body for body, _, _ in batch]
+            )
+            responses = {response.get("id"): response for response in json.loads(raw)}
+        except Exception as e:
+            for body, parser, future in batch:
+                _resolve(future, error=_rpc_error(e, self, body, parser))
+            return
+        for i, (body, parser, future) in enumerate(batch):
+            try:
+                if i not in responses:
+                    raise Exception(f"No response for batched {type(body).__name__}")
+                _resolve(future, _parse_raw(json.dumps(responses[i]), parser))
+            except Exception as e:
+                _resolve(future, error=e)
+
+
+class BatchingHTTPProvider(BatchingMixin, AsyncHTTPProvider):
+    pass
@@ -0,0 +1,304 @@
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+import httpx
+from solders.rpc.requests import Body
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.providers.async_http import AsyncHTTPProvider
+from solana.rpc.providers.core import DEFAULT_TIMEOUT
+from .rate_limit import use_rate_limiter
+from .rpc_batch import BatchingHTTPProvider, BatchingMixin
+from .state import get_batch_requests, get_endpoints, get_hedge_delay, get_hedge_reads
+
+LATENCY_EWMA_ALPHA = 0.2
+HEALTH_CHECK_INTERVAL = 10.0
+FAILURE_COOLDOWN = 2.0
+MAX_FAILURE_COOLDOWN = 60.0
+LATENCY_SAMPLES = 100
+DEFAULT_HEDGE_DELAY = 0.25
+HEDGE_MIN_SAMPLES = 20
+# Each request routed to an endpoint earns a tenth of a hedge, so hedging
+# adds at most ~10% load on top of a small burst.
+HEDGE_BUDGET_RATIO = 0.1
+HEDGE_BUDGET_BURST = 5.0
+
+
+class Endpoint:
+    __slots__ = (
+        "url",
+        "latency",
+        "samples",
+        "failures",
+        "unhealthy_until",
+        "hedge_tokens",
+    )
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latency: Optional[float] = None
+        self.samples = deque(maxlen=LATENCY_SAMPLES)
+        self.failures = 0
+        self.unhealthy_until = 0.0
+        self.hedge_tokens = HEDGE_BUDGET_BURST
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.unhealthy_until
+
+    def record_success(self, latency: float):
+        self.failures = 0
+        self.unhealthy_until = 0.0
+        self.samples.append(latency)
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += LATENCY_EWMA_ALPHA * (latency - self.latency)
+
+    def p95(self) -> Optional[float]:
+        if len(self.samples) < HEDGE_MIN_SAMPLES:
+            return None
+        samples = sorted(self.samples)
+        return samples[int(len(samples) * 0.95) - 1]
+
+    def earn_hedge_token(self):
+        self.hedge_tokens = min(
+            HEDGE_BUDGET_BURST, self.hedge_tokens + HEDGE_BUDGET_RATIO
+        )
+
+    def take_hedge_token(self) -> bool:
+        if self.hedge_tokens < 1.0:
+            return False
+        self.hedge_tokens -= 1.0
+        return True
+
+    def record_failure(self, now: float):
+        self.failures += 1
+        cooldown = FAILURE_COOLDOWN * 2 ** (self.failures - 1)
+        self.unhealthy_until = now + min(cooldown, MAX_FAILURE_COOLDOWN)
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _is_read(body: Body) -> bool:
+    return type(body).__name__.startswith("Get")
+
+
+class PooledHTTPProvider(AsyncHTTPProvider):
+    def __init__(
+        self,
+        endpoints: Sequence[str],
+        extra_headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL,
+        hedge_reads: Optional[bool] = None,
+        hedge_delay: Optional[float] = None,
+    ):
+        super().__init__(endpoints[0], extra_headers, timeout)
+        self.endpoints = [Endpoint(url) for url in endpoints]
+        self.health_check_interval = health_check_interval
+        self.health_task: Optional[asyncio.Task] = None
+        self.hedge_reads = get_hedge_reads() if hedge_reads is None else hedge_reads
+        self.hedge_delay = get_hedge_delay() if hedge_delay is None else hedge_delay
+        self.hedges = 0
+
+    def ranked(self) -> List[Endpoint]:
+        # Healthy endpoints by moving latency average, unmeasured ones first so
+        # they get probed; unhealthy ones last, soonest to recover first.
+        now = time.monotonic()
+        return sorted(
+            self.endpoints,
+            key=lambda e: (
+                not e.is_healthy(now),
+                0.0 if e.is_healthy(now) else e.unhealthy_until,
+                -1.0 if e.latency is None else e.latency,
+            ),
+        )
+
+    async def _post(self, endpoint: Endpoint, request_kwargs: Dict[str, Any]) -> str:
+        start = time.monotonic()
+        try:
+            response = await self.session.post(
+                **{**request_kwargs, "url": endpoint.url}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            if _is_retryable(e):
+                endpoint.record_failure(time.monotonic())
+            raise
+        endpoint.record_success(time.monotonic() - start)
+        return response.text
+
+    def get_hedge_delay(self, endpoint: Endpoint) -> float:
+        if self.hedge_delay:
+            return self.hedge_delay
+        p95 = endpoint.p95()
+        return DEFAULT_HEDGE_DELAY if p95 is None else p95
+
+    async def _hedged_post(
+        self,
+        primary: Endpoint,
+        secondary: Endpoint,
+        request_kwargs: Dict[str, Any],
+        tried: Set[Endpoint],
+    ) -> Tuple[str, Endpoint]:
+        first = asyncio.ensure_future(self._post(primary, request_kwargs))
+        done, _ = await asyncio.wait({first}, timeout=self.get_hedge_delay(primary))
+        if done or not primary.take_hedge_token():
+            return await first, primary
+        self.hedges += 1
+        tried.add(secondary)
+        second = asyncio.ensure_future(self._post(secondary, request_kwargs))
+        racing = {first: primary, second: secondary}
+        error = None
+        try:
+            while racing:
+                done, _ = await asyncio.wait(
+                    racing, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    endpoint = racing.pop(task)
+                    if task.exception() is None:
+                        return task.result(), endpoint
+                    error = task.exception()
+                    if not _is_retryable(error):
+                        raise error
+            raise error
+        finally:
+            for task in racing:
+                task.cancel()
+
+    async def post(
+        self, build_kwargs: Callable[[], Dict[str, Any]], hedge: bool = False
+    ) -> str:
+        self.start_health_checks()
+        request_kwargs = build_kwargs()
+        endpoints = self.ranked()
+        tried = set()
+        error = None
+        for i, endpoint in enumerate(endpoints):
+            if endpoint in tried:
+                continue
+            tried.add(endpoint)
+            endpoint.earn_hedge_token()
+            try:
+                if hedge and i + 1 < len(endpoints):
+                    raw, endpoint = await self._hedged_post(
+                        endpoint, endpoints[i + 1], request_kwargs, tried
+                    )
+                else:
+                    raw = await self._post(endpoint, request_kwargs)
+            except httpx.HTTPError as e:
+                if not _is_retryable(e):
+                    raise
+                error = e
+                continue
+            return raw
+        raise error
+
+    async def make_request_unparsed(self, body: Body) -> str:
+        return await self.post(
+            lambda: self._before_request(body=body),
+            self.hedge_reads and _is_read(body),
+        )
+
+    async def make_batch_request_unparsed(self, reqs) -> str:
+        return await self.post(
+            lambda: self._before_batch_request(reqs),
+            self.hedge_reads and all(_is_read(body) for body in reqs),
+        )
+
+    async def check_endpoint(self, endpoint: Endpoint):
+        start = time.monotonic()
+        try:
+            url = httpx.URL(endpoint.url)
+            # Keep any path and query, e.g. an api key, of the endpoint.
+            health_url = url.copy_with(path=url.path.rstrip("/") + "/health")
+            response = await self.session.get(health_url)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            endpoint.record_failure(time.monotonic())
+        else:
+            endpoint.record_success(time.monotonic() - start)
+
+    async def health_check(self):
+        await asyncio.gather(*(self.check_endpoint(e) for e in self.endpoints))
+
+    async def _run_health_checks(self):
+        while not self.session.is_closed:
+            await self.health_check()
+            await asyncio.sleep(self.health_check_interval)
+
+    def start_health_checks(self):
+        if self.health_task is None or self.health_task.done():
+            self.health_task = asyncio.ensure_future(self._run_health_checks())
+
+    async def is_connected(self) -> bool:
+        await self.health_check()
+        now = time.monotonic()
+        return any(e.is_healthy(now) for e in self.endpoints)
+
+    async def close(self):
+        if self.health_task is not None:
+            self.health_task.cancel()
+        await super().close()
+
+
+class BatchingPooledHTTPProvider(BatchingMixin, PooledHTTPProvider):
+    async def post_batch(self, content: str, bodies: List[Body]) -> str:
+        return await self.post(
+            lambda: {**self._build_common_request_kwargs(), "content": content},
+            self.hedge_reads and all(_is_read(body) for body in bodies),
+        )
+
+
+def get_endpoint_url(client: AsyncClient) -> str:
+    provider = client._provider
+    if isinstance(provider, PooledHTTPProvider):
+        return provider.ranked()[0].url
+    return provider.endpoint_uri
+
+
+async def raw_request(client: AsyncClient, method: str, params: List[Any]) -> Any:
+    # For RPC methods the installed solders has no request type for.
+    provider = client._provider
+
+    def build_kwargs():
+        body = {"jsonrpc": "2.0", "id": 0, "method": method, "params": params}
+        return {**provider._build_common_request_kwargs(), "content": json.dumps(body)}
+
+    if isinstance(provider, PooledHTTPProvider):
+        raw = await provider.post(build_kwargs)
+    else:
+        response = await provider.session.post(**build_kwargs())
+        response.raise_for_status()
+        raw = response.text
+    parsed = json.loads(raw)
+    if "error" in parsed:
+        raise Exception(parsed["error"].get("message", parsed["error"]))
+    return parsed["result"]
+
+
+def get_async_client(
+    endpoints: Optional[Sequence[str]] = None, batch_requests: Optional[bool] = None
+) -> AsyncClient:
+    endpoints = list(endpoints or get_endpoints())
+    if batch_requests is None:
+        batch_requests = get_batch_requests()
+    client = AsyncClient(endpoints[0])
+    if len(endpoints) > 1:
+        provider = BatchingPooledHTTPProvider if batch_requests else PooledHTTPProvider
+        client._provider = provider(endpoints)
+    elif batch_requests:
+        client._provider = BatchingHTTPProvider(endpoints[0])
+    if len(endpoints) > 1:
+        # A pool moves on to another endpoint rather than waiting out a 429.
+        use_rate_limiter(client, max_retries=0)
+    else:
+        use_rate_limiter(client)
+    return client
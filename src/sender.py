@@ -0,0 +1,191 @@
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.signature import Signature
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solana.transaction import Transaction
+from .confirm import COMMITMENT_RANKS, CONFIRM_TIMEOUT, status_reached
+from .state import DryRun, KeypairInput, get_commitment, sign_and_send_tx
+
+MAX_IN_FLIGHT = 32
+STATUS_BATCH_SIZE = 256
+STATUS_POLL_INTERVAL = 0.4
+
+
+class SendResult:
+    __slots__ = ("index", "signature", "error", "sent_at", "confirmed_at", "plan")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.signature: Optional[Signature] = None
+        self.error = None
+        self.sent_at: Optional[float] = None
+        self.confirmed_at: Optional[float] = None
+        self.plan = None
+
+    @property
+    def latency(self) -> Optional[float]:
+        if self.sent_at is None or self.confirmed_at is None:
+            return None
+        return self.confirmed_at - self.sent_at
+
+
+def _percentile(values: Sequence[float], percentile: float) -> Optional[float]:
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percentile))]
+
+
+class PipelinedSender:
+    def __init__(
+        self,
+        client: AsyncClient,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        commitment: Optional[Commitment] = None,
+        timeout: float = CONFIRM_TIMEOUT,
+        poll_interval: float = STATUS_POLL_INTERVAL,
+        lookup_tables: Optional[List[AddressLookupTableAccount]] = None,
+        stop_on_error: bool = False,
+    ):
+        self.client = client
+        self.max_in_flight = max_in_flight
+        self.commitment = commitment or get_commitment()
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.lookup_tables = lookup_tables
+        # Leaves the rest unsent once a transaction fails, for ordered work.
+        self.stop_on_error = stop_on_error
+        self._failed = False
+        self.results: List[SendResult] = []
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._pending: Dict[Signature, Tuple[SendResult, asyncio.Future]] = {}
+        self._wakeup = asyncio.Event()
+
+    async def _send_one(
+        self,
+        result: SendResult,
+        transaction: Transaction,
+        signers: Sequence[KeypairInput],
+        slots: asyncio.Semaphore,
+    ):
+        try:
+            resp = await sign_and_send_tx(
+                transaction,
+                self.client,
+                *signers,
+                commitment=self.commitment,
+                lookup_tables=self.lookup_tables,
+            )
+            result.signature = resp.value
+            result.sent_at = time.monotonic()
+            if result.signature in self._pending:
+                raise Exception(f"Duplicate transaction {result.signature}")
+            landed = asyncio.get_running_loop().create_future()
+            self._pending[result.signature] = (result, landed)
+            self._wakeup.set()
+            await landed
+        except DryRun as e:
+            result.plan = e.plans[0]
+        except Exception as e:
+            result.error = e
+            self._failed = True
+        finally:
+            slots.release()
+
+    async def _check_batch(self, signatures: List[Signature], rank: int):
+        statuses = (await self.client.get_signature_statuses(signatures)).value
+        now = time.monotonic()
+        for signature, status in zip(signatures, statuses):
+            result, landed = self._pending[signature]
+            if status_reached(status, rank):
+                del self._pending[signature]
+                result.confirmed_at = now
+                if status.err is not None:
+                    landed.set_exception(
+                        Exception(f"Transaction {signature} failed: {status.err}")
+                    )
+                else:
+                    landed.set_result(None)
+
+    def _expire(self):
+        now = time.monotonic()
+        for signature, (result, landed) in list(self._pending.items()):
+            if now - result.sent_at > self.timeout:
+                del self._pending[signature]
+                landed.set_exception(
+                    Exception(f"Unable to confirm transaction {signature}")
+                )
+
+    async def _poll(self, sending: asyncio.Task):
+        rank = COMMITMENT_RANKS[self.commitment]
+        while not sending.done() or self._pending:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            await asyncio.sleep(self.poll_interval)
+            signatures = list(self._pending)
+            try:
+                await asyncio.gather(
+                    *(
+                        self._check_batch(signatures[i : i + STATUS_BATCH_SIZE], rank)
+                        for i in range(0, len(signatures), STATUS_BATCH_SIZE)
+                    )
+                )
+            except Exception:
+                # A failed status call is retried on the next tick.
+                pass
+            # Expire on every tick, so a status RPC that keeps failing can't
+            # leave send_all waiting forever.
+            self._expire()
+
+    async def _send_all(
+        self, transactions: Iterable[Tuple[Transaction, Sequence[KeypairInput]]]
+    ):
+        slots = asyncio.Semaphore(self.max_in_flight)
+        sends = []
+        try:
+            for transaction, signers in transactions:
+                await slots.acquire()
+                if self.stop_on_error and self._failed:
+                    slots.release()
+                    break
+                result = SendResult(len(self.results))
+                self.results.append(result)
+                sends.append(
+                    asyncio.ensure_future(
+                        self._send_one(result, transaction, signers, slots)
+                    )
+                )
+            await asyncio.gather(*sends)
+        finally:
+            self._wakeup.set()
+
+    async def send_all(
+        self, transactions: Iterable[Tuple[Transaction, Sequence[KeypairInput]]]
+    ) -> List[SendResult]:
+        self.results = []
+        self._failed = False
+        self.started_at = time.monotonic()
+        sending = asyncio.ensure_future(self._send_all(transactions))
+        await asyncio.gather(sending, self._poll(sending))
+        self.finished_at = time.monotonic()
+        return self.results
+
+    def metrics(self) -> dict:
+        latencies = [r.latency for r in self.results if r.latency is not None]
+        elapsed = (self.finished_at or time.monotonic()) - (self.started_at or 0.0)
+        confirmed = sum(1 for r in self.results if r.signature and r.error is None)
+        return {
+            "sent": len(self.results),
+            "confirmed": confirmed,
+            "failed": len(self.results) - confirmed,
+            "elapsed": elapsed,
+            "tx_per_second": confirmed / elapsed if elapsed > 0 else 0.0,
+            "latency_p50": _percentile(latencies, 0.5),
+            "latency_p95": _percentile(latencies, 0.95),
+        }
@@ -1,17 +1,31 @@
+import asyncio
 import json
-from typing import Optional
+from typing import List, Optional, Tuple
 import base58
 from borsh_construct import *
-from .ledger import *
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solana.rpc import types
+from solana.rpc.commitment import Commitment, Confirmed
 from solana.rpc.async_api import AsyncClient
 from solana.transaction import Transaction
 from solders.rpc.responses import SendTransactionResp
 from solders.signature import Signature
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.hash import Hash
+from solders.message import MessageV0, to_bytes_versioned
+from solders.transaction import VersionedTransaction
 import os
+import time
+import tempfile
+from contextlib import contextmanager
 from construct import Adapter
+from .blockhash import get_blockhash_refresher
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
 class Constants:
@@ -53,6 +67,9 @@ class Constants:
     BPF_LOADER_UPGRADEABLE = Pubkey.from_string(
         "BPFLoaderUpgradeab1e11111111111111111111111"
     )
+    METAPLEX_PROGRAM_ID = Pubkey.from_string(
+        "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
+    )
     REGISTRY_PROGRAM = Pubkey.from_string(
         "38pfsot7kCZkrttx1THEDXEz4JJXmCCcaDoDieRtVuy5"
     )
@@ -197,9 +214,17 @@ class KeypairInput:
         return self.__str__()
 
 
+def ledger_dongle():
+    # ledgerblue pulls in the USB/HID transport stack, so it is only imported
+    # once a Ledger:// signer is actually used.
+    from .ledger import ledgerDongle
+
+    return ledgerDongle()
+
+
 def parse_keypair_input(str_input: str) -> KeypairInput:
     if str_input.startswith("Ledger://"):
-        t_dongle = ledgerDongle()
+        t_dongle = ledger_dongle()
         pub_key = t_dongle.get_address(int(str_input[9:]))
         return KeypairInput(ledger_address=int(str_input[9:]), pubkey=pub_key)
     else:
@@ -230,7 +255,7 @@ class PubkeyInput:
 
 def parse_pubkey_input(str_input: str) -> PubkeyInput:
     if str_input.startswith("Ledger://"):
-        t_dongle = ledgerDongle()
+        t_dongle = ledger_dongle()
         pub_key = t_dongle.get_address(int(str_input[9:]))
         return PubkeyInput(ledger_address=int(str_input[9:]), pubkey=pub_key)
     else:
@@ -246,103 +271,302 @@ def parse_pubkey_input(str_input: str) -> PubkeyInput:
                 raise new_e
 
 
+class DryRun(Exception):
+    # Raised in place of sending while dry run mode is on; carries the plans.
+    def __init__(self, plans):
+        self.plans = plans
+        super().__init__("\n\n".join(plan.render() for plan in plans))
+
+
+_dry_run = {"enabled": False}
+
+
+def get_dry_run() -> bool:
+    return _dry_run["enabled"]
+
+
+def set_dry_run(dry_run: bool):
+    _dry_run["enabled"] = dry_run
+
+
+def compile_versioned_message(
+    tx: Transaction, lookup_tables: List[AddressLookupTableAccount]
+) -> MessageV0:
+    return MessageV0.try_compile(
+        tx.fee_payer,
+        tx.instructions,
+        lookup_tables,
+        tx.recent_blockhash or Hash.default(),
+    )
+
+
+def get_transaction_size(
+    tx: Transaction, lookup_tables: Optional[List[AddressLookupTableAccount]] = None
+) -> int:
+    # Wire size once signed: signature count, signatures, then the message.
+    if lookup_tables:
+        message = compile_versioned_message(tx, lookup_tables)
+        signatures = message.header.num_required_signatures
+        return 1 + 64 * signatures + len(to_bytes_versioned(message))
+    return 1 + 64 * len(tx.signatures) + len(tx.serialize_message())
+
+
+def sign_versioned_tx(
+    tx: Transaction, lookup_tables: List[AddressLookupTableAccount], *args
+) -> bytes:
+    message = compile_versioned_message(tx, lookup_tables)
+    message_bytes = to_bytes_versioned(message)
+    signatures = {}
+    for arg in args:
+        if not isinstance(arg, KeypairInput):
+            raise ValueError(
+                "Invalid argument expected a KeypairInput, Found -> : " + str(type(arg))
+            )
+        if arg.keypair is not None:
+            signatures[arg.pubkey] = arg.keypair.sign_message(message_bytes)
+        elif arg.ledger_address is not None:
+            signatures[arg.pubkey] = Signature.from_bytes(
+                ledger_dongle().sign(message_bytes, arg.ledger_address)
+            )
+        else:
+            raise Exception("KeypairInput is not valid")
+    signers = message.account_keys[: message.header.num_required_signatures]
+    missing = [str(signer) for signer in signers if signer not in signatures]
+    if missing:
+        raise Exception(f"Missing signatures for {', '.join(missing)}")
+    return bytes(
+        VersionedTransaction.populate(
+            message, [signatures[signer] for signer in signers]
+        )
+    )
+
+
+def get_blockhash_commitment(commitment: Optional[Commitment] = None) -> Commitment:
+    # A processed blockhash can belong to a fork that never lands.
+    commitment = commitment or get_commitment()
+    return Confirmed if commitment == "processed" else commitment
+
+
 async def sign_and_send_tx(
-    tx: Transaction, client: AsyncClient, *args, skip_preflight: bool = False
+    tx: Transaction,
+    client: AsyncClient,
+    *args,
+    skip_preflight: bool = False,
+    commitment: Optional[Commitment] = None,
+    broadcast: Optional[bool] = None,
+    priority_fee: Optional[bool] = None,
+    auto_compute_units: Optional[bool] = None,
+    lookup_tables: Optional[List[AddressLookupTableAccount]] = None,
 ) -> SendTransactionResp:
-    last_valid_block_height = None
-    if client.blockhash_cache:
-        try:
-            recent_blockhash = client.blockhash_cache.get()
-        except ValueError:
-            blockhash_resp = await client.get_latest_blockhash(Finalized)
-            recent_blockhash = client._process_blockhash_resp(
-                blockhash_resp, used_immediately=True
-            )
-            last_valid_block_height = blockhash_resp.value.last_valid_block_height
+    if get_dry_run():
+        from .plan import plan_transaction
+
+        raise DryRun([plan_transaction(tx, lookup_tables)])
+    refresher = get_blockhash_refresher(client, get_blockhash_commitment(commitment))
+    if get_priority_fee() if priority_fee is None else priority_fee:
+        from .priority_fee import add_priority_fee, estimate_transaction_priority_fee
+
+        blockhash, micro_lamports = await asyncio.gather(
+            refresher.get(), estimate_transaction_priority_fee(client, tx)
+        )
+        recent_blockhash, last_valid_block_height = blockhash
     else:
-        blockhash_resp = await client.get_latest_blockhash(Finalized)
-        recent_blockhash = client.parse_recent_blockhash(blockhash_resp)
-        last_valid_block_height = blockhash_resp.value.last_valid_block_height
+        micro_lamports = None
+        recent_blockhash, last_valid_block_height = await refresher.get()
     tx.recent_blockhash = recent_blockhash
+    if get_auto_compute_units() if auto_compute_units is None else auto_compute_units:
+        from .compute_units import set_compute_units
 
-    # print("signing actually args: ", args)
-    for arg in args:
-        # print(arg)
-        if isinstance(arg, KeypairInput):
-            # print("p_key: ", arg.pubkey, "keypair: ", arg.keypair, "ledger: ", arg.ledger_address)
-            if arg.keypair is not None:
-                tx.sign_partial(arg.keypair)
-            elif arg.ledger_address is not None:
-                t_dongle = ledgerDongle()
-                message = await make_message(tx, client, False)
-                # print("message: ", message)
-                signature = Signature.from_bytes(
-                    t_dongle.sign(message, arg.ledger_address)
-                )
-                tx.add_signature(arg.pubkey, signature)
+        await set_compute_units(client, tx, lookup_tables)
+    if micro_lamports:
+        add_priority_fee(tx, micro_lamports, lookup_tables)
+
+    if lookup_tables:
+        raw = sign_versioned_tx(tx, lookup_tables, *args)
+    else:
+        # print("signing actually args: ", args)
+        for arg in args:
+            # print(arg)
+            if isinstance(arg, KeypairInput):
+                # print("p_key: ", arg.pubkey, "keypair: ", arg.keypair, "ledger: ", arg.ledger_address)
+                if arg.keypair is not None:
+                    tx.sign_partial(arg.keypair)
+                elif arg.ledger_address is not None:
+                    from .ledger import make_message
+
+                    t_dongle = ledger_dongle()
+                    message = await make_message(tx, client, False)
+                    # print("message: ", message)
+                    signature = Signature.from_bytes(
+                        t_dongle.sign(message, arg.ledger_address)
+                    )
+                    tx.add_signature(arg.pubkey, signature)
+                else:
+                    raise Exception("KeypairInput is not valid")
             else:
-                raise Exception("KeypairInput is not valid")
-        else:
-            raise ValueError(
-                "Invalid argument expected a KeypairInput, Found -> : " + str(type(arg))
-            )
+                raise ValueError(
+                    "Invalid argument expected a KeypairInput, Found -> : "
+                    + str(type(arg))
+                )
+        raw = tx.serialize()
     # print("Reached here")
     opts_to_use = types.TxOpts(
         preflight_commitment=client._commitment,
         last_valid_block_height=last_valid_block_height,
         skip_preflight=skip_preflight,
     )
-    txn_resp = await client.send_raw_transaction(tx.serialize(), opts=opts_to_use)
-    if client.blockhash_cache:
-        blockhash_resp = await client.get_latest_blockhash(Finalized)
-        client._process_blockhash_resp(blockhash_resp, used_immediately=False)
+    if get_broadcast() if broadcast is None else broadcast:
+        from .broadcast import broadcast_transaction
+
+        return await broadcast_transaction(
+            client,
+            raw,
+            last_valid_block_height,
+            skip_preflight,
+            client._commitment,
+        )
+    txn_resp = await client.send_raw_transaction(raw, opts=opts_to_use)
     # print("finished")
     return txn_resp
 
 
+def get_tx_link(signature: Signature) -> str:
+    return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(signature)+get_explorer_suffix(get_network())}]{str(signature)}[/link]"
+
+
+async def sign_send_confirm_tx(
+    tx: Transaction,
+    client: AsyncClient,
+    *args,
+    commitment: Optional[Commitment] = None,
+    **kwargs,
+) -> str:
+    # Returns the transaction link, or the rendered plan in dry run mode.
+    from .confirm import confirm_signature
+
+    try:
+        t_dets = await sign_and_send_tx(
+            tx, client, *args, commitment=commitment, **kwargs
+        )
+    except DryRun as e:
+        return str(e)
+    await confirm_signature(client, t_dets.value, commitment)
+    return get_tx_link(t_dets.value)
+
+
 async def sign_send_confirm_return_tx_as_link(
-    tx: Transaction, client: AsyncClient, *args
+    tx: Transaction,
+    client: AsyncClient,
+    *args,
+    commitment: Optional[Commitment] = None,
+    **kwargs,
 ) -> str:
     # Sign Transaction, Send Transaction, and Confirm Transaction, Return Transaction Signature
     try:
-        t_dets = await sign_and_send_tx(tx, client, *args)
-        await client.confirm_transaction(
-            tx_sig=t_dets.value, commitment="finalized", sleep_seconds=0.4
+        return await sign_send_confirm_tx(
+            tx, client, *args, commitment=commitment, **kwargs
         )
-
-        return f"Transaction Id: [link=https://explorer.solana.com/tx/{str(t_dets.value)+get_explorer_suffix(get_network())}]{str(t_dets.value)}[/link]"
     except Exception as e:
         return f"Error: {e}"
 
 
-def set_config(key: str, value: str):
-    file_dir = f"{os.path.expanduser('~')}/.config/solana/ingl/"
-    os.makedirs(file_dir, exist_ok=True)
-    file_dir = file_dir + "config.json"
+_config_cache = {"stamp": None, "config": {}}
+
+
+def get_config_path() -> str:
+    return f"{os.path.expanduser('~')}/.config/solana/ingl/config.json"
+
+
+def config_stamp(file_path: str):
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def read_config(file_path: str) -> dict:
     try:
-        f = open(file_dir, "r")
+        f = open(file_path, "r")
         config = json.load(f)
         f.close()
+        return config
     except:
-        config = {}
-    config[key] = value
-    with open(file_dir, "w") as f:
-        json.dump(config, f)
+        return {}
 
 
-def get_config(key: str) -> str:
-    file_dir = f"{os.path.expanduser('~')}/.config/solana/ingl/"
-    os.makedirs(file_dir, exist_ok=True)
-    file_dir = file_dir + "config.json"
+def load_config() -> dict:
+    file_path = get_config_path()
+    stamp = config_stamp(file_path)
+    if stamp is not None and stamp == _config_cache["stamp"]:
+        return _config_cache["config"]
+    config = read_config(file_path)
+    _config_cache["stamp"] = stamp
+    _config_cache["config"] = config
+    return config
+
+
+CONFIG_LOCK_TIMEOUT = 5.0
+
+
+@contextmanager
+def config_lock(file_path: str, timeout: float = CONFIG_LOCK_TIMEOUT):
+    lock_file = open(file_path + ".lock", "a+")
     try:
-        f = open(file_dir, "r")
-        config = json.load(f)
-        f.close()
-        if key in config:
-            return config[key]
-        else:
-            return ""
+        if fcntl is not None:
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() > deadline:
+                        raise Exception(
+                            f"Timed out waiting for the config lock: {file_path}.lock"
+                        )
+                    time.sleep(0.005)
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+        lock_file.close()
+
+
+def write_config(file_path: str, config: dict):
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".config.", suffix=".tmp", dir=os.path.dirname(file_path)
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(config, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
     except:
+        os.unlink(tmp_path)
+        raise
+
+
+def set_configs(values: dict):
+    file_path = get_config_path()
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with config_lock(file_path):
+        config = read_config(file_path)
+        config.update(values)
+        write_config(file_path, config)
+        _config_cache["stamp"] = config_stamp(file_path)
+        _config_cache["config"] = config
+
+
+def set_config(key: str, value: str):
+    set_configs({key: value})
+
+
+def get_config(key: str) -> str:
+    config = load_config()
+    if key in config:
+        return config[key]
+    else:
         return ""
 
 
@@ -370,6 +594,195 @@ def set_network(network: str):
     set_config("network", network)
 
 
+def get_endpoints() -> List[str]:
+    endpoints = [get_network()]
+    extra = get_config("endpoints")
+    if isinstance(extra, list):
+        endpoints += [e for e in extra if e not in endpoints]
+    return endpoints
+
+
+def set_endpoints(endpoints: List[str]):
+    set_config("endpoints", endpoints)
+
+
+def get_broadcast() -> bool:
+    return get_config("broadcast") is True
+
+
+def set_broadcast(broadcast: bool):
+    set_config("broadcast", broadcast)
+
+
+def get_hedge_reads() -> bool:
+    return get_config("hedge_reads") is True
+
+
+def set_hedge_reads(hedge_reads: bool):
+    set_config("hedge_reads", hedge_reads)
+
+
+def get_hedge_delay() -> Optional[float]:
+    hedge_delay = get_config("hedge_delay")
+    if isinstance(hedge_delay, (int, float)) and hedge_delay > 0:
+        return hedge_delay
+    else:
+        return None
+
+
+def set_hedge_delay(hedge_delay: Optional[float]):
+    set_config("hedge_delay", hedge_delay)
+
+
+DEFAULT_PRIORITY_FEE_PERCENTILE = 75
+DEFAULT_PRIORITY_FEE_CAP = 100_000
+
+
+def get_priority_fee() -> bool:
+    return get_config("priority_fee") is True
+
+
+def set_priority_fee(priority_fee: bool):
+    set_config("priority_fee", priority_fee)
+
+
+def get_priority_fee_percentile() -> float:
+    percentile = get_config("priority_fee_percentile")
+    if isinstance(percentile, (int, float)) and 0 <= percentile <= 100:
+        return percentile
+    else:
+        return DEFAULT_PRIORITY_FEE_PERCENTILE
+
+
+def set_priority_fee_percentile(percentile: float):
+    set_config("priority_fee_percentile", percentile)
+
+
+def get_priority_fee_cap() -> int:
+    cap = get_config("priority_fee_cap")
+    if isinstance(cap, int) and cap >= 0:
+        return cap
+    else:
+        return DEFAULT_PRIORITY_FEE_CAP
+
+
+def set_priority_fee_cap(cap: int):
+    set_config("priority_fee_cap", cap)
+
+
+def get_rate_limit() -> Optional[float]:
+    # Unset means no cap until an endpoint answers 429; 0 turns limiting off.
+    rate_limit = get_config("rate_limit")
+    if isinstance(rate_limit, (int, float)) and rate_limit >= 0:
+        return rate_limit
+    else:
+        return None
+
+
+def set_rate_limit(rate_limit: Optional[float]):
+    set_config("rate_limit", rate_limit)
+
+
+def get_auto_compute_units() -> bool:
+    return get_config("auto_compute_units") is True
+
+
+def set_auto_compute_units(auto_compute_units: bool):
+    set_config("auto_compute_units", auto_compute_units)
+
+
+def get_lookup_tables() -> bool:
+    return get_config("lookup_tables") is True
+
+
+def set_lookup_tables(lookup_tables: bool):
+    set_config("lookup_tables", lookup_tables)
+
+
+def _lookup_table_key(authority: Pubkey, kind: str = "instance") -> str:
+    # A table only exists on the cluster it was created on.
+    key = f"{get_network()}|{get_program_id()}|{authority}"
+    return key if kind == "instance" else f"{key}|{kind}"
+
+
+def get_lookup_table_address(
+    authority: Pubkey, kind: str = "instance"
+) -> Optional[Pubkey]:
+    tables = get_config("lookup_table_addresses") or {}
+    key = _lookup_table_key(authority, kind)
+    if key in tables:
+        return Pubkey.from_string(tables[key])
+    else:
+        return None
+
+
+def set_lookup_table_address(authority: Pubkey, table: Pubkey, kind: str = "instance"):
+    tables = get_config("lookup_table_addresses") or {}
+    key = _lookup_table_key(authority, kind)
+    set_config("lookup_table_addresses", {**tables, key: str(table)})
+
+
+def get_retired_lookup_tables(authority: Pubkey) -> List[Tuple[Pubkey, Optional[int]]]:
+    # Replaced tables with the slot they were deactivated at, None until then.
+    tables = get_config("retired_lookup_tables") or {}
+    return [
+        (Pubkey.from_string(table), slot)
+        for table, slot in tables.get(_lookup_table_key(authority), [])
+    ]
+
+
+def set_retired_lookup_tables(
+    authority: Pubkey, retired: List[Tuple[Pubkey, Optional[int]]]
+):
+    tables = get_config("retired_lookup_tables") or {}
+    key = _lookup_table_key(authority)
+    set_config(
+        "retired_lookup_tables",
+        {**tables, key: [[str(table), slot] for table, slot in retired]},
+    )
+
+
+def get_batch_requests() -> bool:
+    return get_config("batch_requests") is True
+
+
+def set_batch_requests(batch_requests: bool):
+    set_config("batch_requests", batch_requests)
+
+
+COMMITMENT_LEVELS = ("processed", "confirmed", "finalized")
+_commitment_override = {"commitment": None, "verify_finality": None}
+
+
+def override_commitment(
+    commitment: Optional[str] = None, verify_finality: Optional[bool] = None
+):
+    _commitment_override["commitment"] = commitment
+    _commitment_override["verify_finality"] = verify_finality
+
+
+def get_commitment() -> str:
+    commitment = _commitment_override["commitment"] or get_config("commitment")
+    if commitment in COMMITMENT_LEVELS:
+        return commitment
+    else:
+        return "finalized"
+
+
+def set_commitment(commitment: str):
+    set_config("commitment", commitment)
+
+
+def get_verify_finality() -> bool:
+    if _commitment_override["verify_finality"] is not None:
+        return _commitment_override["verify_finality"]
+    return get_config("verify_finality") is True
+
+
+def set_verify_finality(verify_finality: bool):
+    set_config("verify_finality", verify_finality)
+
+
 def get_keypair_path() -> str:
     keypair_path = get_config("keypair_path")
     if keypair_path == "":
@@ -378,10 +791,14 @@ def get_keypair_path() -> str:
         return keypair_path
 
 
-def set_keypair_path(keypair_path: str) -> bool:
+def load_keypair_path(keypair_path: str) -> Tuple[str, Keypair]:
     path = os.path.abspath(keypair_path)
+    return path, keypair_from_json(path)
+
+
+def set_keypair_path(keypair_path: str) -> bool:
     try:
-        keypair = keypair_from_json(path)
+        path, keypair = load_keypair_path(keypair_path)
     except:
         print("Invalid keypair path")
         return False
@@ -414,9 +831,8 @@ def get_market_keypair_path() -> str:
 
 
 def set_market_keypair_path(keypair_path: str) -> bool:
-    path = os.path.abspath(keypair_path)
     try:
-        keypair = keypair_from_json(path)
+        path, keypair = load_keypair_path(keypair_path)
     except:
         print("Invalid keypair path")
         return False
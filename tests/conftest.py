@@ -0,0 +1,7 @@
+import os
+import sys
+import tempfile
+
+# Keep config, lookup table and compute unit state out of the real config directory.
+os.environ["HOME"] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,375 @@
+import asyncio
+import base64
+import json
+import random
+import time
+from collections import Counter
+
+import base58
+import websockets
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+
+SLOT_SECONDS = 0.4
+PACKET_DATA_SIZE = 1232
+MAX_TRANSACTION_ACCOUNTS = 64
+COMPUTE_BUDGET_PROGRAM = "ComputeBudget111111111111111111111111111111"
+TOKEN_PROGRAM = "TokenkegQfeZyiNwAxRKzJ3d6ZSPbZUqGVm6nnzL3ZsR1"
+LOOKUP_TABLE_PROGRAM = "AddressLookupTab1e1111111111111111111111111"
+LOOKUP_TABLE_META_SIZE = 56
+
+
+class RpcError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class MockRpc:
+    def __init__(
+        self,
+        finalize_after=13.0,
+        latency=0.0,
+        status_code=200,
+        tail_latency=0.0,
+        tail_probability=0.0,
+        drop_probability=0.0,
+        signatures=None,
+        accounts=None,
+        rate_limit=None,
+        retry_after=None,
+        priority_fees=None,
+        min_priority_fee=0,
+        units_consumed=3_000,
+    ):
+        self.finalize_after = finalize_after
+        self.latency = latency
+        self.tail_latency = tail_latency
+        self.tail_probability = tail_probability
+        self.drop_probability = drop_probability
+        self.status_code = status_code
+        # Requests allowed per one-second window before answering 429.
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.window = (0, 0)
+        self.throttled = 0
+        # Recent per-slot prioritization fees; under congestion transactions
+        # paying less than min_priority_fee never reach a leader.
+        self.priority_fees = priority_fees or [0]
+        self.min_priority_fee = min_priority_fee
+        self.compute_unit_prices = []
+        # Units each non compute budget instruction burns in simulation.
+        self.units_consumed = units_consumed
+        self.requests = Counter()
+        self.http_requests = 0
+        self.bytes_sent = 0
+        # Pass a shared dict to make several stand-ins act as one cluster.
+        self.signatures = {} if signatures is None else signatures
+        # Address -> (owner, data) for the account read methods.
+        self.accounts = {} if accounts is None else accounts
+        self.methods = {
+            "getSignatureStatuses": self.get_signature_statuses,
+            "getLatestBlockhash": self.get_latest_blockhash,
+            "getBlockHeight": self.get_block_height,
+            "getSlot": self.get_slot,
+            "getAccountInfo": self.get_account_info,
+            "getMultipleAccounts": self.get_multiple_accounts,
+            "getTokenAccountsByOwner": self.get_token_accounts_by_owner,
+            "getProgramAccounts": self.get_program_accounts,
+            "getRecentPrioritizationFees": self.get_recent_prioritization_fees,
+            "simulateTransaction": self.simulate_transaction,
+            "sendTransaction": self.send_transaction,
+        }
+        self.started = time.monotonic()
+        self.http_server = None
+        self.ws_server = None
+
+    @property
+    def http_url(self):
+        return f"http://127.0.0.1:{self.http_server.sockets[0].getsockname()[1]}"
+
+    @property
+    def ws_url(self):
+        return f"ws://127.0.0.1:{self.ws_server.sockets[0].getsockname()[1]}"
+
+    async def __aenter__(self):
+        self.http_server = await asyncio.start_server(self.serve_http, "127.0.0.1", 0)
+        self.ws_server = await websockets.serve(self.serve_ws, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.http_server.close()
+        self.ws_server.close()
+        await self.http_server.wait_closed()
+        await self.ws_server.wait_closed()
+
+    def slot(self):
+        return int((time.monotonic() - self.started) / SLOT_SECONDS)
+
+    def submit(self, signature):
+        self.signatures.setdefault(str(signature), time.monotonic())
+
+    def status(self, signature):
+        submitted = self.signatures.get(signature)
+        if submitted is None:
+            return None
+        elapsed = time.monotonic() - submitted
+        if elapsed >= self.finalize_after:
+            level = "finalized"
+        elif elapsed >= SLOT_SECONDS:
+            level = "confirmed"
+        else:
+            level = "processed"
+        return {
+            "slot": self.slot(),
+            "confirmations": None if level == "finalized" else 1,
+            "status": {"Ok": None},
+            "err": None,
+            "confirmationStatus": level,
+        }
+
+    def context(self, value):
+        return {"context": {"slot": self.slot()}, "value": value}
+
+    async def get_signature_statuses(self, params):
+        return self.context([self.status(signature) for signature in params[0]])
+
+    async def get_latest_blockhash(self, params):
+        return self.context(
+            {
+                "blockhash": "EkSnNWid2cvwEVnVx9aBqawnmiCNiDgp3gUdkDPTKN1N",
+                "lastValidBlockHeight": self.slot() + 150,
+            }
+        )
+
+    async def get_block_height(self, params):
+        return self.slot()
+
+    async def get_slot(self, params):
+        return self.slot()
+
+    def account(self, address, data_slice=None):
+        if address not in self.accounts:
+            return None
+        owner, data = self.accounts[address]
+        if data_slice is not None:
+            offset = data_slice["offset"]
+            data = data[offset : offset + data_slice["length"]]
+        return {
+            "lamports": 1_000_000,
+            "data": [base64.b64encode(data).decode(), "base64"],
+            "owner": owner,
+            "executable": False,
+            "rentEpoch": 0,
+        }
+
+    async def get_account_info(self, params):
+        return self.context(self.account(params[0]))
+
+    async def get_multiple_accounts(self, params):
+        return self.context([self.account(address) for address in params[0]])
+
+    async def get_token_accounts_by_owner(self, params):
+        owner = bytes(Pubkey.from_string(params[0]))
+        data_slice = params[2].get("dataSlice") if len(params) > 2 else None
+        return self.context(
+            [
+                {"pubkey": address, "account": self.account(address, data_slice)}
+                for address, (program, data) in self.accounts.items()
+                if program == TOKEN_PROGRAM and data[32:64] == owner
+            ]
+        )
+
+    async def get_program_accounts(self, params):
+        config = params[1] if len(params) > 1 else {}
+        memcmps = [
+            (f["memcmp"]["offset"], base58.b58decode(f["memcmp"]["bytes"]))
+            for f in config.get("filters", [])
+            if "memcmp" in f
+        ]
+        data_slice = config.get("dataSlice")
+        return [
+            {"pubkey": address, "account": self.account(address, data_slice)}
+            for address, (owner, data) in self.accounts.items()
+            if owner == params[0]
+            and all(data[o : o + len(b)] == b for o, b in memcmps)
+        ]
+
+    async def get_recent_prioritization_fees(self, params):
+        slot = self.slot()
+        return [
+            {"slot": slot - i, "prioritizationFee": fee}
+            for i, fee in enumerate(self.priority_fees)
+        ]
+
+    def compute_unit_price(self, transaction):
+        message = transaction.message
+        for instruction in message.instructions:
+            program_id = message.account_keys[instruction.program_id_index]
+            if str(program_id) == COMPUTE_BUDGET_PROGRAM and instruction.data[0] == 3:
+                return int.from_bytes(instruction.data[1:9], "little")
+        return 0
+
+    async def simulate_transaction(self, params):
+        transaction = VersionedTransaction.from_bytes(base64.b64decode(params[0]))
+        message = transaction.message
+        units = sum(
+            150
+            if str(message.account_keys[ix.program_id_index]) == COMPUTE_BUDGET_PROGRAM
+            else self.units_consumed
+            for ix in message.instructions
+        )
+        return self.context(
+            {"err": None, "logs": [], "accounts": None, "unitsConsumed": units}
+        )
+
+    def apply_lookup_table_instructions(self, message):
+        # Keep created tables readable so callers can reuse, extend and close them.
+        keys = [str(key) for key in message.account_keys]
+        for ix in message.instructions:
+            if keys[ix.program_id_index] != LOOKUP_TABLE_PROGRAM:
+                continue
+            table = keys[ix.accounts[0]]
+            tag = int.from_bytes(bytes(ix.data[:4]), "little")
+            if tag == 0:
+                meta = bytes(LOOKUP_TABLE_META_SIZE)
+                self.accounts[table] = (LOOKUP_TABLE_PROGRAM, meta)
+            elif tag == 2:
+                owner, data = self.accounts[table]
+                self.accounts[table] = (owner, data + bytes(ix.data[12:]))
+            elif tag == 3:
+                owner, data = self.accounts[table]
+                slot = self.slot().to_bytes(8, "little")
+                self.accounts[table] = (owner, data[:4] + slot + data[12:])
+            elif tag == 4:
+                self.accounts.pop(table, None)
+
+    async def send_transaction(self, params):
+        raw = base64.b64decode(params[0])
+        if len(raw) > PACKET_DATA_SIZE:
+            raise RpcError(-32602, f"transaction too large: {len(raw)} bytes")
+        transaction = VersionedTransaction.from_bytes(raw)
+        message = transaction.message
+        accounts = len(message.account_keys) + sum(
+            len(lookup.writable_indexes) + len(lookup.readonly_indexes)
+            for lookup in getattr(message, "address_table_lookups", [])
+        )
+        if accounts > MAX_TRANSACTION_ACCOUNTS:
+            raise RpcError(-32002, "Transaction locked too many accounts")
+        signature = str(transaction.signatures[0])
+        price = self.compute_unit_price(transaction)
+        self.compute_unit_prices.append(price)
+        # Simulate congestion: the node accepts the transaction but it never
+        # reaches a leader.
+        if price >= self.min_priority_fee and random.random() >= self.drop_probability:
+            self.submit(signature)
+            self.apply_lookup_table_instructions(message)
+        return signature
+
+    async def call(self, request):
+        method = request["method"]
+        self.requests[method] += 1
+        handler = self.methods.get(method)
+        if handler is None:
+            error = {"code": -32601, "message": f"Method not found: {method}"}
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": error}
+        try:
+            result = await handler(request.get("params", []))
+        except RpcError as e:
+            error = {"code": e.code, "message": str(e)}
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": error}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    def over_limit(self):
+        if self.rate_limit is None:
+            return False
+        second = int(time.monotonic())
+        start, count = self.window
+        count = count + 1 if start == second else 1
+        self.window = (second, count)
+        return count > self.rate_limit
+
+    async def serve_http(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode().split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                raw = await reader.readexactly(length)
+                self.http_requests += 1
+                if self.tail_probability and random.random() < self.tail_probability:
+                    await asyncio.sleep(self.tail_latency)
+                elif self.latency:
+                    await asyncio.sleep(self.latency)
+                status = self.status_code
+                headers = ""
+                if self.over_limit():
+                    status = 429
+                    self.throttled += 1
+                    if self.retry_after is not None:
+                        headers = f"Retry-After: {self.retry_after}\r\n"
+                if status != 200:
+                    payload = b""
+                elif head.startswith(b"GET"):
+                    payload = b"ok"
+                else:
+                    body = json.loads(raw)
+                    if isinstance(body, list):
+                        response = await asyncio.gather(
+                            *(self.call(req) for req in body)
+                        )
+                    else:
+                        response = await self.call(body)
+                    payload = json.dumps(response).encode()
+                self.bytes_sent += len(payload)
+                writer.write(
+                    f"HTTP/1.1 {status} MOCK\r\nContent-Type: application/json\r\n".encode()
+                    + f"{headers}Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_ws(self, websocket, path=None):
+        async for message in websocket:
+            request = json.loads(message)
+            self.requests[request["method"]] += 1
+            if request["method"] != "signatureSubscribe":
+                continue
+            subscription = self.requests["signatureSubscribe"]
+            await websocket.send(
+                json.dumps(
+                    {"jsonrpc": "2.0", "id": request["id"], "result": subscription}
+                )
+            )
+            params = request["params"]
+            commitment = "finalized"
+            if len(params) > 1:
+                commitment = params[1].get("commitment", commitment)
+            asyncio.ensure_future(
+                self.notify(websocket, subscription, params[0], commitment)
+            )
+
+    async def notify(self, websocket, subscription, signature, commitment):
+        submitted = self.signatures.get(signature, time.monotonic())
+        delay = {"processed": 0.0, "confirmed": SLOT_SECONDS}.get(
+            commitment, self.finalize_after
+        )
+        await asyncio.sleep(max(0.0, submitted + delay - time.monotonic()))
+        await websocket.send(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "signatureNotification",
+                    "params": {
+                        "result": self.context({"err": None}),
+                        "subscription": subscription,
+                    },
+                }
+            )
+        )
@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solana.transaction import Transaction
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+from src.chunking import MAX_MINTS_PER_INSTRUCTION, count_accounts, pack_mints
+from src.compute_units import MAX_COMPUTE_UNITS
+from src.instruction import ComputeBudgetInstruction
+from src.lookup_table import get_lookup_addresses
+from src.processor import build_vote_governance_instruction, send_mint_chunks
+from src.state import KeypairInput, get_transaction_size
+
+# The limits come from the stand-in cluster, not the code under test.
+from tests.mock_rpc import (
+    MAX_TRANSACTION_ACCOUNTS,
+    PACKET_DATA_SIZE,
+    MockRpc,
+    RpcError,
+)
+
+
+def vote_builder(payer: Pubkey):
+    proposal = Pubkey.new_unique()
+    return lambda chunk: build_vote_governance_instruction(
+        payer, True, proposal, 1, chunk
+    )
+
+
+def with_budget(instruction: Instruction, payer: Pubkey) -> Transaction:
+    # The send path may prepend a compute unit limit and price.
+    budget = ComputeBudgetInstruction()
+    tx = Transaction(fee_payer=payer)
+    tx.instructions = [
+        budget.set_compute_unit_limit(MAX_COMPUTE_UNITS, payer),
+        budget.set_compute_unit_price(1, payer),
+        instruction,
+    ]
+    return tx
+
+
+def fits(instruction, payer, lookup_tables=None) -> bool:
+    tx = with_budget(instruction, payer)
+    if count_accounts(tx.instructions, payer) > MAX_TRANSACTION_ACCOUNTS:
+        return False
+    return get_transaction_size(tx, lookup_tables) <= PACKET_DATA_SIZE
+
+
+@pytest.mark.parametrize("use_lookup_table", [False, True])
+def test_pack_mints_fills_chunks_up_to_the_limits(use_lookup_table):
+    payer = Pubkey.new_unique()
+    build = vote_builder(payer)
+    mints = [Pubkey.new_unique() for _ in range(60)]
+    lookup_tables = None
+    if use_lookup_table:
+        addresses = get_lookup_addresses([build(mints)])[:256]
+        lookup_tables = [AddressLookupTableAccount(Pubkey.new_unique(), addresses)]
+
+    chunks = pack_mints(build, mints, payer, lookup_tables)
+
+    assert [mint for chunk, _tx in chunks for mint in chunk] == mints
+    for i, (chunk, tx) in enumerate(chunks):
+        assert 0 < len(chunk) <= MAX_MINTS_PER_INSTRUCTION
+        assert list(tx.instructions) == [build(chunk)]
+        assert fits(build(chunk), payer, lookup_tables)
+        if i + 1 < len(chunks):
+            # Greedy: one more mint would break a limit.
+            next_mint = chunks[i + 1][0][0]
+            assert not fits(build(chunk + [next_mint]), payer, lookup_tables)
+
+
+def test_pack_mints_caps_the_mint_count():
+    payer = Pubkey.new_unique()
+    program = Pubkey.new_unique()
+
+    def build(chunk):
+        return Instruction(program, bytes([len(chunk)]), [])
+
+    mints = [Pubkey.new_unique() for _ in range(600)]
+    chunks = pack_mints(build, mints, payer)
+
+    assert [len(chunk) for chunk, _tx in chunks] == [255, 255, 90]
+    assert len(pack_mints(build, mints, payer, max_mints=100)) == 6
+
+
+def test_pack_mints_rejects_a_mint_that_cannot_fit():
+    payer = Pubkey.new_unique()
+    program = Pubkey.new_unique()
+    accounts = [
+        AccountMeta(Pubkey.new_unique(), False, True)
+        for _ in range(MAX_TRANSACTION_ACCOUNTS)
+    ]
+
+    def build(chunk):
+        return Instruction(program, bytes([len(chunk)]), accounts)
+
+    with pytest.raises(Exception, match="does not fit in a transaction"):
+        pack_mints(build, [Pubkey.new_unique()], payer)
+
+
+def test_send_mint_chunks_reports_each_mint():
+    async def run():
+        signer = KeypairInput(t_keypair=Keypair())
+        build = vote_builder(signer.pubkey)
+        mints = [Pubkey.new_unique() for _ in range(40)]
+        chunks = pack_mints(build, mints, signer.pubkey)
+        assert len(chunks) >= 3
+        async with MockRpc(finalize_after=1.0) as rpc:
+            send = rpc.methods["sendTransaction"]
+            sends = []
+
+            async def fail_second_send(params):
+                sends.append(params)
+                if len(sends) == 2:
+                    raise RpcError(-32602, "invalid transaction")
+                return await send(params)
+
+            rpc.methods["sendTransaction"] = fail_second_send
+            client = AsyncClient(rpc.http_url, Confirmed)
+            try:
+                result = await send_mint_chunks(
+                    build,
+                    mints,
+                    signer,
+                    client,
+                    Confirmed,
+                    use_lookup_table=False,
+                    max_in_flight=1,
+                )
+            finally:
+                await client.close()
+        return chunks, result.splitlines()
+
+    chunks, lines = asyncio.run(run())
+
+    assert len(lines) == sum(len(chunk) for chunk, _tx in chunks)
+    failed = set(chunks[1][0])
+    for line in lines:
+        mint, status = line.split(": ", 1)
+        if Pubkey.from_string(mint) in failed:
+            assert status.startswith("Error: ")
+        else:
+            assert status.startswith("Transaction Id: ")
@@ -0,0 +1,79 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from src.state import (
+    config_lock,
+    get_config,
+    get_config_path,
+    read_config,
+    set_config,
+    write_config,
+)
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def test_write_config_replaces_the_file(tmp_path):
+    file_path = str(tmp_path / "config.json")
+    write_config(file_path, {"network": "devnet"})
+    write_config(file_path, {"network": "mainnet"})
+
+    assert read_config(file_path) == {"network": "mainnet"}
+    assert os.listdir(tmp_path) == ["config.json"]
+
+
+def test_write_config_keeps_the_old_file_on_failure(tmp_path):
+    file_path = str(tmp_path / "config.json")
+    write_config(file_path, {"network": "devnet"})
+
+    with pytest.raises(TypeError):
+        write_config(file_path, {"network": object()})
+
+    assert read_config(file_path) == {"network": "devnet"}
+    assert os.listdir(tmp_path) == ["config.json"]
+
+
+def test_config_lock_times_out_while_held(tmp_path):
+    file_path = str(tmp_path / "config.json")
+    with config_lock(file_path):
+        with pytest.raises(Exception, match="Timed out waiting for the config lock"):
+            with config_lock(file_path, timeout=0.05):
+                pass
+    with config_lock(file_path, timeout=0.05):
+        pass
+
+
+def test_get_config_sees_writes_from_other_processes(home):
+    set_config("network", "devnet")
+    assert get_config("network") == "devnet"
+
+    file_path = get_config_path()
+    with open(file_path, "w") as f:
+        json.dump({"network": "testnet", "program_id": "x" * 32}, f)
+
+    assert get_config("network") == "testnet"
+
+
+def _set_keys(worker: int):
+    for i in range(20):
+        set_config(f"worker{worker}-{i}", str(i))
+
+
+def test_concurrent_set_config_loses_no_updates(home):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_set_keys, args=(w,)) for w in range(6)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    config = read_config(get_config_path())
+    assert len(config) == 6 * 20
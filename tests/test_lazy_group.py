@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+from src.ingl_cli import entry, market
+
+
+def test_stored_short_help_matches_the_commands():
+    for group in (entry, market):
+        for cmd_name, (_, short_help) in group.lazy_commands.items():
+            command = group._load_command(cmd_name)
+            assert short_help == command.get_short_help_str(10000), cmd_name
+
+
+def test_help_imports_no_command_modules():
+    script = (
+        "import sys\n"
+        "from src.ingl_cli import entry\n"
+        "try:\n"
+        "    entry(['--help'])\n"
+        "finally:\n"
+        "    print(sorted(m for m in sys.modules if m.startswith('src.commands')))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    assert "Commands:" in result.stdout
+    assert result.stdout.splitlines()[-1] == "[]"
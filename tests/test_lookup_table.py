@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+from src.lookup_table import (
+    MAX_LOOKUP_TABLE_ADDRESSES,
+    MINTS_TABLE,
+    close_retired_lookup_tables,
+    ensure_lookup_tables,
+    fetch_lookup_table,
+)
+from src.state import (
+    KeypairInput,
+    get_lookup_table_address,
+    get_retired_lookup_tables,
+    set_retired_lookup_tables,
+)
+from tests.mock_rpc import MockRpc
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+
+def addresses(count):
+    return [Pubkey.new_unique() for _ in range(count)]
+
+
+def run(test):
+    async def main():
+        signer = KeypairInput(t_keypair=Keypair())
+        async with MockRpc(finalize_after=1.0) as rpc:
+            client = AsyncClient(rpc.http_url, Confirmed)
+            try:
+                return await test(rpc, client, signer)
+            finally:
+                await client.close()
+
+    return asyncio.run(main())
+
+
+def test_tables_are_reused_for_the_same_accounts():
+    instance, mints = addresses(4), addresses(30)
+
+    async def test(rpc, client, signer):
+        first = await ensure_lookup_tables(client, signer, instance, mints, Confirmed)
+        sends = rpc.requests["sendTransaction"]
+        second = await ensure_lookup_tables(client, signer, instance, mints, Confirmed)
+        assert rpc.requests["sendTransaction"] == sends
+        return first, second
+
+    first, second = run(test)
+    assert [table.key for table in first] == [table.key for table in second]
+    assert list(first[0].addresses) == instance
+    assert list(first[1].addresses) == mints
+
+
+def test_full_mint_table_is_replaced_and_retired():
+    instance = addresses(4)
+    old_mints, new_mints = addresses(150), addresses(150)
+
+    async def test(rpc, client, signer):
+        old = await ensure_lookup_tables(
+            client, signer, instance, old_mints, Confirmed
+        )
+        new = await ensure_lookup_tables(
+            client, signer, instance, new_mints, Confirmed
+        )
+        retired = get_retired_lookup_tables(signer.pubkey)
+        stored = get_lookup_table_address(signer.pubkey, MINTS_TABLE)
+        return old, new, retired, stored
+
+    old, new, retired, stored = run(test)
+    assert old[0].key == new[0].key
+    assert new[1].key != old[1].key
+    assert stored == new[1].key
+    assert list(new[1].addresses) == new_mints
+    assert [table for table, _slot in retired] == [old[1].key]
+    assert retired[0][1] is not None
+
+
+def test_table_too_small_for_the_mints_is_kept():
+    mints = addresses(MAX_LOOKUP_TABLE_ADDRESSES + 50)
+
+    async def test(rpc, client, signer):
+        first = await ensure_lookup_tables(client, signer, [], mints, Confirmed)
+        sends = rpc.requests["sendTransaction"]
+        second = await ensure_lookup_tables(client, signer, [], mints, Confirmed)
+        assert rpc.requests["sendTransaction"] == sends
+        return first, second
+
+    first, second = run(test)
+    assert len(first[0].addresses) == MAX_LOOKUP_TABLE_ADDRESSES
+    assert first[0].key == second[0].key
+
+
+def test_retired_tables_are_closed_after_the_cooldown():
+    async def test(rpc, client, signer):
+        [table] = await ensure_lookup_tables(client, signer, [], addresses(3))
+        waiting = Pubkey.new_unique()
+        # Deactivated long ago, and just now.
+        slot = (await client.get_slot()).value
+        set_retired_lookup_tables(
+            signer.pubkey, [(table.key, slot - 1_000), (waiting, slot)]
+        )
+        await close_retired_lookup_tables(client, signer)
+        closed = await fetch_lookup_table(client, table.key)
+        return closed, waiting, get_retired_lookup_tables(signer.pubkey)
+
+    closed, waiting, retired = run(test)
+    assert closed is None
+    assert [table for table, _slot in retired] == [waiting]
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+from solana.rpc.async_api import AsyncClient
+
+from src import rate_limit
+from src.rate_limit import (
+    DECREASE_COOLDOWN,
+    MAX_RATE,
+    MIN_RATE,
+    RATE_DECREASE,
+    RATE_INCREASE,
+    RateLimiter,
+    use_rate_limiter,
+)
+from tests.mock_rpc import MockRpc
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    return clock
+
+
+def saturate(limiter: RateLimiter):
+    limiter.tokens = 0.0
+
+
+def test_slow_start_adds_one_per_success(clock):
+    limiter = RateLimiter(10.0)
+    for _ in range(5):
+        saturate(limiter)
+        limiter.record_success()
+    assert limiter.rate == 15.0
+
+
+def test_idle_successes_do_not_raise_the_rate(clock):
+    limiter = RateLimiter(10.0)
+    limiter.record_success()
+    assert limiter.rate == 10.0
+
+
+def test_throttle_halves_once_per_burst(clock):
+    limiter = RateLimiter(40.0)
+    limiter.record_throttle(None)
+    limiter.record_throttle(None)
+    assert limiter.rate == 40.0 * RATE_DECREASE
+    assert limiter.threshold == limiter.rate
+    assert limiter.throttled == 2
+
+    clock.now += DECREASE_COOLDOWN
+    limiter.record_throttle(None)
+    assert limiter.rate == 40.0 * RATE_DECREASE**2
+
+
+def test_growth_is_linear_past_the_threshold(clock):
+    limiter = RateLimiter(40.0)
+    limiter.record_throttle(None)
+    saturate(limiter)
+    limiter.record_success()
+    assert limiter.rate == pytest.approx(20.0 + RATE_INCREASE / 20.0)
+
+
+def test_rate_stays_within_bounds(clock):
+    limiter = RateLimiter(MIN_RATE)
+    limiter.record_throttle(None)
+    assert limiter.rate == MIN_RATE
+
+    limiter = RateLimiter(MAX_RATE)
+    saturate(limiter)
+    limiter.record_success()
+    assert limiter.rate == MAX_RATE
+
+
+def test_unset_rate_is_uncapped_until_a_throttle():
+    async def run():
+        limiter = RateLimiter(None)
+        for _ in range(50):
+            await limiter.acquire()
+        limiter.record_success()
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.rate is None
+    limiter.record_throttle(None)
+    assert limiter.rate == 50 * RATE_DECREASE
+    assert limiter.threshold == limiter.rate
+
+
+def test_retry_after_blocks_acquire():
+    async def run():
+        limiter = RateLimiter(100.0)
+        limiter.record_throttle(0.2)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire()
+        return loop.time() - start
+
+    assert asyncio.run(run()) >= 0.2
+
+
+def test_client_backs_off_under_endpoint_limit():
+    async def run():
+        rate_limit._limiters.clear()
+        async with MockRpc(rate_limit=20) as rpc:
+            client = AsyncClient(rpc.http_url)
+            use_rate_limiter(client, rate=10)
+            try:
+                slots = await asyncio.gather(*(client.get_slot() for _ in range(60)))
+            finally:
+                await client.close()
+            limiter = next(iter(rate_limit._limiters.values()))
+            return slots, rpc.throttled, limiter.rate
+
+    slots, throttled, rate = asyncio.run(run())
+    assert len(slots) == 60
+    assert throttled < 20
+    assert rate < 40
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+from solana.exceptions import SolanaRpcException
+from solana.rpc.async_api import AsyncClient
+
+from src.rpc_batch import BatchingHTTPProvider
+from tests.mock_rpc import MockRpc
+
+
+def batching_client(url):
+    client = AsyncClient(url)
+    client._provider = BatchingHTTPProvider(url)
+    return client
+
+
+def test_calls_in_one_tick_share_a_request():
+    async def run():
+        async with MockRpc() as rpc:
+            client = batching_client(rpc.http_url)
+            try:
+                slots = await asyncio.gather(*(client.get_slot() for _ in range(10)))
+            finally:
+                await client.close()
+            return slots, rpc.http_requests
+
+    slots, http_requests = asyncio.run(run())
+    assert len(slots) == 10
+    assert http_requests == 1
+
+
+@pytest.mark.parametrize("calls", [1, 3])
+def test_transport_errors_match_unbatched_calls(calls):
+    async def run():
+        # Nothing listens on port 1.
+        client = batching_client("http://127.0.0.1:1")
+        try:
+            return await asyncio.gather(
+                *(client.get_slot() for _ in range(calls)), return_exceptions=True
+            )
+        finally:
+            await client.close()
+
+    errors = asyncio.run(run())
+    assert all(isinstance(error, SolanaRpcException) for error in errors)
@@ -0,0 +1,29 @@
+import time
+
+from src.rpc_pool import PooledHTTPProvider
+
+
+def test_recovered_endpoint_ranks_by_latency():
+    provider = PooledHTTPProvider(
+        ["http://fast.invalid", "http://slow.invalid", "http://down.invalid"]
+    )
+    fast, slow, down = provider.endpoints
+    fast.record_success(0.01)
+    slow.record_success(0.2)
+    down.record_success(0.05)
+    now = time.monotonic()
+    down.record_failure(now)
+    assert provider.ranked() == [fast, slow, down]
+
+    # Its cooldown is over: back between the others by latency.
+    down.unhealthy_until = now - 1.0
+    assert provider.ranked() == [fast, down, slow]
+
+
+def test_unhealthy_endpoints_rank_by_recovery():
+    provider = PooledHTTPProvider(["http://a.invalid", "http://b.invalid"])
+    a, b = provider.endpoints
+    now = time.monotonic()
+    a.unhealthy_until = now + 10.0
+    b.unhealthy_until = now + 5.0
+    assert provider.ranked() == [b, a]
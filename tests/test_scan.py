@@ -0,0 +1,108 @@
+import asyncio
+import itertools
+
+import pytest
+from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
+
+from src.scan import (
+    NFT_DATA_HEADER_SIZE,
+    NONE,
+    decode_nft_data_header,
+    scan_nft_accounts,
+)
+from src.state import NftData, get_program_id
+from tests.mock_rpc import MockRpc
+
+PHRASE = 739_024
+
+
+def nft_data(
+    rarity=None,
+    rarity_seed_time=None,
+    last_withdrawal_epoch=None,
+    last_delegation_epoch=None,
+    withdraws=0,
+    votes=0,
+    numeration=7,
+):
+    return NftData.build(
+        {
+            "validation_phrase": PHRASE,
+            "rarity": rarity,
+            "rarity_seed_time": rarity_seed_time,
+            "funds_location": 2,
+            "numeration": numeration,
+            "date_created": 1_700_000_000,
+            "last_withdrawal_epoch": last_withdrawal_epoch,
+            "last_delegation_epoch": last_delegation_epoch,
+            "all_withdraws": [410] * withdraws,
+            "all_votes": {i: True for i in range(votes)},
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "rarity, rarity_seed_time, last_withdrawal_epoch, last_delegation_epoch",
+    list(
+        itertools.product([None, 3], [None, 1_700_000_000], [None, 410], [None, 2**40])
+    ),
+)
+def test_decode_matches_nft_data_parse(
+    rarity, rarity_seed_time, last_withdrawal_epoch, last_delegation_epoch
+):
+    data = nft_data(
+        rarity, rarity_seed_time, last_withdrawal_epoch, last_delegation_epoch, 4, 5
+    )
+    parsed = NftData.parse(data)
+
+    # A dataSlice of the header size is enough, whichever Options are set.
+    header, offset = decode_nft_data_header(data[:NFT_DATA_HEADER_SIZE])
+
+    assert header == tuple(
+        NONE if value is None else value
+        for value in (
+            parsed.rarity,
+            parsed.funds_location,
+            parsed.numeration,
+            parsed.date_created,
+            parsed.last_withdrawal_epoch,
+            parsed.last_delegation_epoch,
+        )
+    )
+    assert int.from_bytes(data[offset : offset + 4], "little") == 4
+
+
+def test_header_size_is_the_largest_header():
+    data = nft_data(3, 1_700_000_000, 410, 400)
+    _header, offset = decode_nft_data_header(data)
+    assert offset == NFT_DATA_HEADER_SIZE
+
+
+def test_scan_filters_by_phrase_and_counts_votes():
+    program_id = str(get_program_id())
+    nfts = {
+        str(Pubkey.new_unique()): (program_id, nft_data(i % 4, withdraws=i, votes=i))
+        for i in range(10)
+    }
+    other = (PHRASE + 1).to_bytes(4, "little") + bytes(100)
+    accounts = dict(nfts)
+    accounts[str(Pubkey.new_unique())] = (program_id, other)
+    accounts[str(Pubkey.new_unique())] = (str(Pubkey.new_unique()), nft_data())
+
+    async def run(with_votes):
+        async with MockRpc(accounts=accounts) as rpc:
+            client = AsyncClient(rpc.http_url)
+            try:
+                return await scan_nft_accounts(client, PHRASE, with_votes)
+            finally:
+                await client.close()
+
+    table = asyncio.run(run(False))
+    assert sorted(map(str, table.accounts)) == sorted(nfts)
+    assert table.votes is None
+    assert sorted(table.rarity) == sorted(i % 4 for i in range(10))
+
+    table = asyncio.run(run(True))
+    assert len(table) == 10
+    assert sum(table.votes) == sum(range(10))